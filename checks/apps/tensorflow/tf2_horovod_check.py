@@ -9,6 +9,7 @@ import reframe.utility.osext as osext
 from hpctestlib.ml.tensorflow.horovod import tensorflow_cnn_check
 
 hooks = rfm.utility.import_module("...microbenchmarks.gpu.hooks")
+sitedata = rfm.utility.import_module("...common.sitedata")
 
 REFERENCE_SMALL_PERFORMANCE = {
     'alvis:8xT4': {
@@ -113,60 +114,16 @@ class snic_tensorflow_horovod_check(tensorflow_cnn_check):
 
     @run_before('run')
     def set_num_task(self):
-        # Settings for various systems. num_tasks is per-variant
-        self.tasks_cpu_settings = {
-            'alvis:2xV100': {
-                'cpus_per_node': 16,
-                'num_nodes': {'small': 1, 'large': 1},
-            },
-            'alvis:4xV100': {
-                'cpus_per_node': 32,
-                'num_nodes': {'small': 1, 'large': 1},
-            },
-            'alvis:8xT4': {
-                'cpus_per_node': 32,
-                'num_nodes': {'small': 1, 'large': 1},
-            },
-            'alvis:4xA40': {
-                'cpus_per_node': 64,
-                'num_nodes': {'small': 1, 'large': 1},
-            },
-            'alvis:4xA100_MEM256': {
-                'cpus_per_node': 64,
-                'num_nodes': {'small': 1, 'large': 1},
-            },
-            'alvis:4xA100_MEM512': {
-                'cpus_per_node': 64,
-                'num_nodes': {'small': 1, 'large': 1},
-            },
-            'alvis:4xA100fat': {
-                'cpus_per_node': 64,
-                'num_nodes': {'small': 1, 'large': 1},
-            },
-            'kebnekaise:2xK80': {
-                'cpus_per_node': 28,
-                'num_nodes': {'small': 1, 'large': 4},
-            },
-            'kebnekaise:4xK80': {
-                'cpus_per_node': 28,
-                'num_nodes': {'small': 1, 'large': 2},
-            },
-            'kebnekaise:2xV100': {
-                'cpus_per_node': 28,
-                'num_nodes': {'small': 1, 'large': 4},
-            },
-        }
-
         if self.variant == 'small':
             self.reference = REFERENCE_SMALL_PERFORMANCE
         else:
             self.reference = REFERENCE_LARGE_PERFORMANCE
 
-        cp = self.current_partition.fullname
+        settings = sitedata.partition_value(self, 'horovod', 'TASKS_CPU_SETTINGS')
         # Use one task per GPU
         self.num_tasks_per_node = self.num_gpus_per_node
-        self.num_cpus_per_task = int(self.tasks_cpu_settings.get(cp)['cpus_per_node'] / self.num_tasks_per_node)
-        self.num_tasks = self.tasks_cpu_settings.get(cp)['num_nodes'][self.variant] * self.num_tasks_per_node
+        self.num_cpus_per_task = int(settings['cpus_per_node'] / self.num_tasks_per_node)
+        self.num_tasks = settings['num_nodes'][self.variant] * self.num_tasks_per_node
 
     @run_before('run')
     def setup_run(self):
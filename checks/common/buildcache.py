@@ -0,0 +1,106 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Content addressed cache of the binaries built by the benchmark fixtures.
+#
+# A binary is stored under the hash of everything that went into building
+# it: the sources, the compiler and its flags, the modules of the
+# programming environment and the partition it was built on.  A fixture
+# finding its key in the cache copies the binary instead of compiling it, so
+# the binaries are only rebuilt when one of these changes.
+#
+# The cache is kept in $HPC2N_BUILD_CACHE, or ~/.cache/hpc2n-reframe/builds;
+# setting HPC2N_BUILD_CACHE to an empty string disables it.
+#
+
+import hashlib
+import json
+import os
+import shutil
+
+import reframe.core.runtime as rt
+
+
+def cache_dir():
+    '''Return the cache directory, or ``None`` if the cache is disabled.'''
+
+    if 'HPC2N_BUILD_CACHE' in os.environ:
+        return os.environ['HPC2N_BUILD_CACHE'] or None
+
+    cache = os.environ.get('XDG_CACHE_HOME',
+                           os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache, 'hpc2n-reframe', 'builds')
+
+
+def find_environ(partition, name):
+    '''Return a programming environment of a partition from the
+    configuration, or ``None``.'''
+
+    for part in rt.runtime().system.partitions:
+        if part.fullname == partition:
+            for env in part.environs:
+                if env.name == name:
+                    return env
+
+    return None
+
+
+def build_key(sources, partition, environ, cflags, modules=()):
+    '''Return the cache key of a build.
+
+    ``sources`` are the files compiled, ``environ`` the programming
+    environment and ``modules`` the extra modules loaded by the test.
+    '''
+
+    hasher = hashlib.sha256()
+    for filename in sources:
+        with open(filename, 'rb') as fp:
+            hasher.update(hashlib.sha256(fp.read()).digest())
+
+    hasher.update(json.dumps({
+        'partition': partition,
+        'environ': environ.name,
+        'modules': list(environ.modules) + list(modules),
+        'cc': environ.cc,
+        'cflags': list(cflags),
+    }, sort_keys=True).encode())
+    return hasher.hexdigest()
+
+
+def _entry(key):
+    return os.path.join(cache_dir(), key[:2], key)
+
+
+def lookup(key, name):
+    '''Return the path of a cached binary, or ``None``.'''
+
+    if cache_dir() is None:
+        return None
+
+    filename = os.path.join(_entry(key), name)
+    return filename if os.access(filename, os.X_OK) else None
+
+
+def store(key, filename, name, **meta):
+    '''Store a binary in the cache as ``name``.
+
+    The binary is copied under a temporary name and moved in place, so that
+    concurrent sessions never see a partial file.  ``meta`` is saved next to
+    it for reference.
+    '''
+
+    if cache_dir() is None:
+        return None
+
+    entry = _entry(key)
+    os.makedirs(entry, exist_ok=True)
+    with open(os.path.join(entry, 'meta.json'), 'w') as fp:
+        json.dump(dict(meta, binary=name), fp, indent=2, sort_keys=True)
+
+    cached = os.path.join(entry, name)
+    tmpfile = f'{cached}.{os.getpid()}.tmp'
+    shutil.copy2(filename, tmpfile)
+    os.replace(tmpfile, cached)
+    return cached
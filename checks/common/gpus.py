@@ -0,0 +1,92 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Registry of the GPUs of the partitions.
+#
+# The registry is built once per run from the ``gpu`` devices of the
+# partitions of the current system in the configuration, which give the
+# architecture and the number of GPUs per node, and the SPECS table in
+# checks/common/tables/gpu.py, which gives the model, memory and peak rates.
+# A partition without a ``gpu`` device has no entry.
+#
+
+import collections
+import functools
+import os
+
+import reframe.core.runtime as rt
+import reframe.utility as util
+
+sitedata = util.import_module_from_file(
+    os.path.join(os.path.dirname(__file__), 'sitedata.py')
+)
+
+GPU = collections.namedtuple(
+    'GPU', ['partition', 'model', 'vendor', 'build', 'arch', 'count',
+            'memory', 'peak_fp64', 'peak_fp32', 'peak_bw']
+)
+
+# The vendor and the build of the GPUs by the prefix of their architecture
+_VENDORS = {
+    'sm_': ('nvidia', 'cuda'),
+    'gfx': ('amd', 'hip'),
+}
+
+
+def _vendor(arch):
+    for prefix, vendor in _VENDORS.items():
+        if arch.startswith(prefix):
+            return vendor
+
+    raise ValueError(f'unknown GPU architecture {arch!r}')
+
+
+def _gpu(partition):
+    devices = partition.select_devices('gpu')
+    if not devices:
+        return None
+
+    device = devices[0]
+    spec = sitedata.lookup('gpu', 'SPECS', partition.fullname, {})
+    arch = device.arch or spec.get('arch')
+    if device.arch and spec.get('arch', device.arch) != device.arch:
+        raise ValueError(f'{partition.fullname}: the configuration has '
+                         f'{device.arch} GPUs, the GPU table {spec["arch"]}')
+
+    vendor, build = _vendor(arch) if arch else (None, None)
+    return GPU(partition.fullname, spec.get('model'), vendor, build, arch,
+               device.num_devices, spec.get('memory'), spec.get('peak_fp64'),
+               spec.get('peak_fp32'), spec.get('peak_bw'))
+
+
+@functools.lru_cache(maxsize=None)
+def registry():
+    '''Return a dict mapping the full names of the GPU partitions of the
+    current system to their :class:`GPU`.'''
+
+    gpus = {}
+    for part in rt.runtime().system.partitions:
+        gpu = _gpu(part)
+        if gpu is not None:
+            gpus[part.fullname] = gpu
+
+    return gpus
+
+
+def gpu_info(partition):
+    '''Return the :class:`GPU` of a partition, or ``None`` if it has no
+    GPUs.'''
+
+    return registry().get(partition.fullname)
+
+
+def compute_arch(gpu):
+    '''Return the architecture of a GPU the way the GPU builds take it,
+    e.g. ``80`` for ``sm_80`` and ``gfx908`` for ``gfx908``.'''
+
+    if gpu.arch is None:
+        return None
+
+    return gpu.arch[3:] if gpu.build == 'cuda' else gpu.arch
@@ -0,0 +1,143 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Parser of the HPL output.
+#
+# HPL prints one block per case of HPL.dat: the result line with the
+# variant, N, NB, P, Q, time and Gflops, optionally the detailed timing of
+# builds with -DHPL_DETAILED_TIMING, and the residual check.  The parser
+# returns one record per case, so the cases of a multi-N, multi-NB or
+# multi-grid run can be compared.  It does not depend on ReFrame; run it on
+# a captured output to print the records:
+#
+#   python3 checks/common/parsers/hpl.py HPL.out
+#
+
+import collections
+import re
+import sys
+
+
+HPLCase = collections.namedtuple(
+    'HPLCase', ['variant', 'N', 'NB', 'P', 'Q', 'time', 'gflops',
+                'residual', 'passed', 'timing']
+)
+
+# The GPU Linpack of NVIDIA adds the Gflops per GPU in parentheses
+_RESULT = re.compile(r'^(W[RC]\S*)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+'
+                     r'([0-9.]+(?:e[+-]\d+)?)\s+([0-9.]+e[+-]\d+)'
+                     r'(?:\s+\(\s*[0-9.]+e[+-]\d+\s*\))?\s*$')
+
+_RESIDUAL = re.compile(r'^\|\|Ax-b\|\|_oo/.*=\s*([0-9.]+(?:e[+-]\d+)?)\s+'
+                       r'\.+\s+(PASSED|FAILED)')
+
+_TIMING = re.compile(r'^\+?\s*Max aggregated wall time\s+(.+?)[\s.]*:\s+'
+                     r'([0-9.]+)')
+
+_SUMMARY = re.compile(r'^\s*(\d+)\s+tests (completed and passed|completed '
+                      r'and failed|skipped)')
+
+
+def parse(text):
+    '''Return the list of :class:`HPLCase` of an HPL output.
+
+    Cases without a residual check have ``residual`` and ``passed`` set to
+    ``None``; ``timing`` maps the phases of the detailed timing, e.g.
+    ``'update'``, to their time in seconds and is empty otherwise.
+    '''
+
+    cases = []
+    case = None
+    for line in text.splitlines():
+        m = _RESULT.match(line)
+        if m:
+            if case:
+                cases.append(case)
+
+            variant, N, NB, P, Q, time, gflops = m.groups()
+            case = HPLCase(variant, int(N), int(NB), int(P), int(Q),
+                           float(time), float(gflops), None, None, {})
+            continue
+
+        if case is None:
+            continue
+
+        m = _TIMING.match(line)
+        if m:
+            case.timing[m.group(1).strip()] = float(m.group(2))
+            continue
+
+        m = _RESIDUAL.match(line)
+        if m:
+            cases.append(case._replace(residual=float(m.group(1)),
+                                       passed=(m.group(2) == 'PASSED')))
+            case = None
+
+    if case:
+        cases.append(case)
+
+    return cases
+
+
+def parse_file(filename):
+    with open(filename) as fp:
+        return parse(fp.read())
+
+
+def summary(text):
+    '''Return the ``(passed, failed, skipped)`` counts of the final summary
+    of an HPL output, or ``None`` if the run did not complete.'''
+
+    counts = {}
+    for line in text.splitlines():
+        m = _SUMMARY.match(line)
+        if m:
+            counts[m.group(2)] = int(m.group(1))
+
+    if not counts:
+        return None
+
+    return (counts.get('completed and passed', 0),
+            counts.get('completed and failed', 0),
+            counts.get('skipped', 0))
+
+
+def best(cases):
+    '''Return the fastest case that passed its residual check, or ``None``.'''
+
+    passed = [c for c in cases if c.passed is not False]
+    return max(passed, key=lambda c: c.gflops) if passed else None
+
+
+def case_name(case):
+    '''Return a name identifying the parameters of a case, e.g.
+    ``N107520_NB192_P7x4``.'''
+
+    return f'N{case.N}_NB{case.NB}_P{case.P}x{case.Q}'
+
+
+def main():
+    for filename in sys.argv[1:]:
+        with open(filename) as fp:
+            text = fp.read()
+
+        cases = parse(text)
+        for c in cases:
+            status = {True: 'PASSED', False: 'FAILED', None: '-'}[c.passed]
+            print(f'{filename}: {c.variant} {case_name(c)} {c.time:.2f}s '
+                  f'{c.gflops:.1f} GFlops residual={c.residual} {status}')
+            for phase, t in c.timing.items():
+                print(f'    {phase}: {t:.2f}s')
+
+        winner = best(cases)
+        if winner:
+            print(f'{filename}: best {case_name(winner)} '
+                  f'{winner.gflops:.1f} GFlops')
+
+        print(f'{filename}: passed, failed, skipped = {summary(text)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Parser of the IOR results.
+#
+# IOR prints one line per iteration and access with the bandwidth, IOPS,
+# latency and the open, write/read and close times, and a summary per test
+# and operation with the min/max/mean bandwidth and operations over the
+# iterations.  Both are read from the JSON summary of ``-O summaryFormat=JSON
+# -O summaryFile=FILE`` or from the default text output of IOR 3.3 and 4.0.
+# It does not depend on ReFrame; run it on a summary or an output to print
+# the records:
+#
+#   python3 checks/common/parsers/ior.py ior-summary.json
+#
+
+import collections
+import json
+import re
+import statistics
+import sys
+
+
+IORResult = collections.namedtuple(
+    'IORResult', ['test', 'refnum', 'iteration', 'access', 'bw', 'iops',
+                  'latency', 'block', 'xfer', 'open', 'wrrd', 'close',
+                  'total']
+)
+
+IORSummary = collections.namedtuple(
+    'IORSummary', ['test', 'refnum', 'operation', 'api', 'tasks', 'reps',
+                   'bw_max', 'bw_min', 'bw_mean', 'bw_std', 'ops_max',
+                   'ops_min', 'ops_mean', 'ops_std', 'mean_time']
+)
+
+_NUMBER = r'[-+]?[0-9.]+(?:e[+-]\d+)?'
+
+# access, bw(MiB/s), IOPS, Latency(s), block(KiB), xfer(KiB), open(s),
+# wr/rd(s), close(s), total(s) and iter
+_RESULT = re.compile(rf'^(write|read)((?:\s+{_NUMBER}){{9}})\s+(\d+)\s*$')
+
+_RESULT_HEADER = re.compile(r'^access\s+bw\(MiB/s\)')
+
+
+def parse_json(text):
+    '''Return the lists of :class:`IORResult` and :class:`IORSummary` of the
+    JSON summary of an IOR run.'''
+
+    data = json.loads(text)
+    summaries = []
+    for s in data.get('summary', []):
+        summaries.append(IORSummary(
+            s['TestID'], s['ReferenceNumber'], s['operation'], s['API'],
+            s['numTasks'], s['repetitions'], s['bwMaxMIB'], s['bwMinMIB'],
+            s['bwMeanMIB'], s['bwStdMIB'], s['OPsMax'], s['OPsMin'],
+            s['OPsMean'], s['OPsSD'], s['MeanTime']
+        ))
+
+    refnums = {s.test: s.refnum for s in summaries}
+    results = []
+    for test in data.get('tests', []):
+        test_id = test.get('TestID', 0)
+        for iteration, accesses in enumerate(test.get('Results', [])):
+            for r in accesses:
+                results.append(IORResult(
+                    test_id, refnums.get(test_id), iteration, r['access'],
+                    r['bwMiB'], r['iops'], r['latency'], r['blockKiB'],
+                    r['xferKiB'], r['openTime'], r['wrRdTime'],
+                    r['closeTime'], r['totalTime']
+                ))
+
+    return results, summaries
+
+
+def parse_text(text):
+    '''Return the lists of :class:`IORResult` and :class:`IORSummary` of the
+    text output of an IOR run.'''
+
+    results = []
+    summaries = []
+    test_id = -1
+    for line in text.splitlines():
+        if _RESULT_HEADER.match(line):
+            test_id += 1
+            continue
+
+        m = _RESULT.match(line)
+        if m:
+            values = [float(v) for v in m.group(2).split()]
+            results.append(IORResult(test_id, None, int(m.group(3)),
+                                     m.group(1), *values))
+            continue
+
+        # The summary lines have a variable number of stonewalling columns
+        # after Mean(s), so the columns after them are counted from the end
+        fields = line.split()
+        if len(fields) < 25 or fields[0] not in ('write', 'read'):
+            continue
+
+        try:
+            stats = [float(v) for v in fields[1:10]]
+            summaries.append(IORSummary(
+                int(fields[-15]), int(fields[-1]), fields[0], fields[-2],
+                int(fields[-14]), int(fields[-12]), *stats
+            ))
+        except ValueError:
+            continue
+
+    refnums = {s.test: s.refnum for s in summaries}
+    results = [r._replace(refnum=refnums.get(r.test)) for r in results]
+    return results, summaries
+
+
+def parse(text):
+    '''Return the results and summaries of a JSON summary or a text output
+    of IOR.'''
+
+    if text.lstrip().startswith('{'):
+        return parse_json(text)
+
+    return parse_text(text)
+
+
+def parse_file(filename):
+    with open(filename) as fp:
+        return parse(fp.read())
+
+
+def find_summary(summaries, operation, refnum=-1):
+    '''Return the summary of ``operation`` of the test with reference number
+    ``refnum``, or ``None``.'''
+
+    for s in summaries:
+        if s.operation == operation and s.refnum == refnum:
+            return s
+
+    return None
+
+
+def mean(results, access, field, refnum=-1):
+    '''Return the mean of ``field`` over the iterations of ``access`` of the
+    test with reference number ``refnum``, or ``None``.'''
+
+    values = [getattr(r, field) for r in results
+              if r.access == access and r.refnum == refnum]
+    return statistics.mean(values) if values else None
+
+
+def variation(summary):
+    '''Return the coefficient of variation of the bandwidth over the
+    iterations of a summary.'''
+
+    return summary.bw_std / summary.bw_mean if summary.bw_mean else 0.0
+
+
+def main():
+    for filename in sys.argv[1:]:
+        results, summaries = parse_file(filename)
+        for r in results:
+            print(f'{filename}: test {r.test} (refnum {r.refnum}) '
+                  f'iteration {r.iteration} {r.access} {r.bw:.1f} MiB/s '
+                  f'{r.iops:.1f} IOPS latency={r.latency:.6f}s '
+                  f'open={r.open:.4f}s close={r.close:.4f}s')
+
+        for s in summaries:
+            print(f'{filename}: test {s.test} (refnum {s.refnum}) '
+                  f'{s.operation} {s.api} max={s.bw_max:.1f} '
+                  f'mean={s.bw_mean:.1f} MiB/s cv={variation(s):.3f} '
+                  f'ops={s.ops_mean:.1f}')
+
+
+if __name__ == '__main__':
+    main()
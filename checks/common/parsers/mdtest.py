@@ -0,0 +1,126 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Parser of the mdtest summary.
+#
+# mdtest ends with a summary of the rates and one of the times of its
+# phases, with the max, min, mean and standard deviation over the
+# iterations.  The layouts of IOR 3.3 (``SUMMARY rate:``, with a colon after
+# the phase) and IOR 4.0 (``SUMMARY rate (in ops/sec):``, without it) are
+# both read.  Every phase is returned, the ones of PHASES by their name and
+# the others, e.g. the stonewall phases of IOR 4.0, by their label.  It does
+# not depend on ReFrame; run it on a captured output to print the summaries:
+#
+#   python3 checks/common/parsers/mdtest.py rfm_job.out
+#
+
+import collections
+import re
+import sys
+
+
+MDtestStat = collections.namedtuple('MDtestStat',
+                                    ['max', 'min', 'mean', 'std'])
+
+MDtestSummary = collections.namedtuple('MDtestSummary',
+                                       ['iterations', 'rate', 'time'])
+
+# The phases as (name, label in the summary, unit of the rate)
+PHASES = [
+    ('dir_create', 'Directory creation', 'dirs/s'),
+    ('dir_stat', 'Directory stat', 'dirs/s'),
+    ('dir_removal', 'Directory removal', 'dirs/s'),
+    ('file_create', 'File creation', 'files/s'),
+    ('file_stat', 'File stat', 'files/s'),
+    ('file_read', 'File read', 'files/s'),
+    ('file_removal', 'File removal', 'files/s'),
+    ('tree_create', 'Tree creation', 'dirs/s'),
+    ('tree_removal', 'Tree removal', 'dirs/s'),
+]
+
+_NAMES = {label: name for name, label, _ in PHASES}
+
+# IOR 4.0 prints NA for the statistics it does not have
+_NUMBER = r'[-+]?[0-9.]+(?:e[+-]\d+)?|NA'
+
+_HEADER = re.compile(r'^SUMMARY (rate|time)\b.*?(?:\(of (\d+) iterations?\))?'
+                     r'\s*$')
+
+_PHASE = re.compile(rf'^\s+(\S.*?)\s*:?\s+({_NUMBER})\s+({_NUMBER})\s+'
+                    rf'({_NUMBER})\s+({_NUMBER})\s*$')
+
+
+def _value(text):
+    return None if text == 'NA' else float(text)
+
+
+def phase_name(label):
+    '''Return the name of the phase of a summary label, e.g. ``file_create``
+    of ``File creation``.'''
+
+    return _NAMES.get(label, re.sub(r'\W+', '_', label.lower()).strip('_'))
+
+
+def parse(text):
+    '''Return the list of :class:`MDtestSummary` of an mdtest output, one
+    per mdtest run.
+
+    ``rate`` and ``time`` map the names of the phases to their
+    :class:`MDtestStat`, with ``None`` for the statistics mdtest gives as NA;
+    ``iterations`` is ``None`` if the summary does not give it.
+    '''
+
+    summaries = []
+    section = None
+    for line in text.splitlines():
+        m = _HEADER.match(line)
+        if m:
+            section = m.group(1)
+            if section == 'rate' or not summaries:
+                iterations = int(m.group(2)) if m.group(2) else None
+                summaries.append(MDtestSummary(iterations, {}, {}))
+
+            continue
+
+        # The sections end at the first unindented line
+        if section is None or (line and not line[0].isspace()):
+            section = None
+            continue
+
+        m = _PHASE.match(line)
+        if m:
+            stat = MDtestStat(*(_value(v) for v in m.group(2, 3, 4, 5)))
+            getattr(summaries[-1], section)[phase_name(m.group(1))] = stat
+
+    return summaries
+
+
+def parse_file(filename):
+    with open(filename) as fp:
+        return parse(fp.read())
+
+
+def sections(text, pattern):
+    '''Split the output of a script running several mdtests into a dict
+    mapping the group of ``pattern``, matching the line printed before each
+    run, to its output.'''
+
+    parts = re.split(pattern, text, flags=re.MULTILINE)
+    return dict(zip(parts[1::2], parts[2::2]))
+
+
+def main():
+    for filename in sys.argv[1:]:
+        for num, summary in enumerate(parse_file(filename), 1):
+            print(f'{filename}: summary {num} '
+                  f'({summary.iterations} iterations)')
+            for name, stat in summary.rate.items():
+                values = ' '.join(f'{column}={value}' for column, value
+                                  in stat._asdict().items())
+                print(f'    {name}: {values} ops/s')
+
+
+if __name__ == '__main__':
+    main()
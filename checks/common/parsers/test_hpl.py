@@ -0,0 +1,92 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Tests of the HPL parser on the outputs in fixtures/: netlib HPL 2.3, with
+# and without the detailed timing, and the GPU Linpack of NVIDIA.  Run them
+# with
+#
+#   python3 -m pytest checks/common/parsers
+#
+
+import importlib.util
+import os
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_parser():
+    spec = importlib.util.spec_from_file_location(
+        'hpl_parser', os.path.join(os.path.dirname(__file__), 'hpl.py')
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read(name):
+    with open(os.path.join(FIXTURES, name)) as fp:
+        return fp.read()
+
+
+def test_netlib_cases():
+    hplout = load_parser()
+    cases = hplout.parse(read('hpl-2.3.out'))
+    assert [(c.N, c.NB, c.P, c.Q) for c in cases] == [
+        (107520, 192, 4, 7), (107520, 192, 7, 4),
+        (107520, 256, 4, 7), (107520, 256, 7, 4),
+    ]
+    assert [c.gflops for c in cases] == [888.47, 871.03, 902.66, 836.95]
+    assert [c.time for c in cases] == [932.71, 951.38, 918.05, 990.12]
+    assert [c.residual for c in cases] == [
+        1.92834752e-03, 2.04511363e-03, 1.77026591e-03, 2.31058843e+01
+    ]
+    assert [c.passed for c in cases] == [True, True, True, False]
+    assert {c.variant for c in cases} == {'WC01C2R2'}
+    assert all(not c.timing for c in cases)
+
+
+def test_netlib_summary_and_best():
+    hplout = load_parser()
+    text = read('hpl-2.3.out')
+    assert hplout.summary(text) == (3, 1, 0)
+
+    best = hplout.best(hplout.parse(text))
+    assert hplout.case_name(best) == 'N107520_NB256_P4x7'
+    assert best.gflops == 902.66
+
+
+def test_failed_case_is_not_best():
+    hplout = load_parser()
+    cases = hplout.parse(read('hpl-2.3.out'))
+    assert hplout.best(cases[3:]) is None
+
+
+def test_detailed_timing():
+    hplout = load_parser()
+    cases = hplout.parse(read('hpl-2.3-timing.out'))
+    assert [(c.variant, c.N, c.NB, c.P, c.Q) for c in cases] == [
+        ('WR10R2L2', 40320, 192, 4, 7), ('WR10R2C2', 40320, 192, 4, 7),
+    ]
+    assert [c.gflops for c in cases] == [519.52, 505.40]
+    assert [c.residual for c in cases] == [3.46119810e-03, 3.02207185e-03]
+    assert cases[0].timing == {
+        'rfact': 3.41, 'pfact': 2.97, 'mxswp': 1.65, 'update': 78.84,
+        'laswp': 6.02, 'up tr sv': 0.19,
+    }
+    assert cases[1].timing['update'] == 80.62
+
+
+def test_nvidia():
+    hplout = load_parser()
+    text = read('hpl-nvidia.out')
+    cases = hplout.parse(text)
+    assert len(cases) == 1
+    case = cases[0]
+    assert (case.N, case.NB, case.P, case.Q) == (181248, 1024, 2, 2)
+    assert case.gflops == 2.174e+05
+    assert case.time == 18.26
+    assert case.residual == 0.0003843
+    assert case.passed is True
+    assert hplout.summary(text) == (1, 0, 0)
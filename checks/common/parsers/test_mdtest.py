@@ -0,0 +1,86 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Tests of the mdtest parser on the outputs in fixtures/ of mdtest 3.3 and
+# 4.0.  Run them with
+#
+#   python3 -m pytest checks/common/parsers
+#
+
+import importlib.util
+import os
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_parser():
+    spec = importlib.util.spec_from_file_location(
+        'mdtest_parser', os.path.join(os.path.dirname(__file__), 'mdtest.py')
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read(name):
+    with open(os.path.join(FIXTURES, name)) as fp:
+        return fp.read()
+
+
+def test_mdtest_33():
+    mdtestout = load_parser()
+    summaries = mdtestout.parse(read('mdtest-3.3.out'))
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert summary.iterations == 3
+    assert list(summary.rate) == [name for name, _, _ in mdtestout.PHASES]
+    assert summary.rate['dir_create'] == (14212.361, 12034.118,
+                                          13187.442, 894.306)
+    assert summary.rate['file_create'] == (9321.504, 8105.772,
+                                           8744.219, 497.866)
+    assert summary.rate['file_read'].mean == 21603.947
+    assert summary.rate['tree_removal'].std == 35.808
+    assert summary.time['file_create'] == (6.909, 6.008, 6.415, 0.373)
+    assert len(summary.time) == len(mdtestout.PHASES)
+
+
+def test_mdtest_40():
+    mdtestout = load_parser()
+    summaries = mdtestout.parse(read('mdtest-4.0.out'))
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert summary.iterations == 3
+    assert summary.rate['dir_stat'] == (93118.620, 88405.351,
+                                        90802.245, 1924.512)
+    assert summary.rate['file_create'] == (16540.212, 14381.907,
+                                           15469.590, 881.187)
+    assert summary.rate['file_create_stonewall'] == (None, None,
+                                                     17115.336, None)
+    assert summary.rate['directory_rename'].mean == 10477.109
+    assert summary.rate['file_move'].max == 12117.440
+    assert summary.time['dir_create'] == (6.282, 5.470, 5.838, 0.332)
+    assert summary.time['file_create_stonewall'].mean == 6.544
+
+
+def test_phase_name():
+    mdtestout = load_parser()
+    assert mdtestout.phase_name('File creation') == 'file_create'
+    assert mdtestout.phase_name('Tree removal') == 'tree_removal'
+    assert (mdtestout.phase_name('File create (stonewall)') ==
+            'file_create_stonewall')
+
+
+def test_sections():
+    mdtestout = load_parser()
+    text = ('mdtest case 0: z2_b4_n2000\n' + read('mdtest-3.3.out') +
+            'mdtest case 1: z2_b4_n2000_W30\n' + read('mdtest-4.0.out'))
+    outputs = mdtestout.sections(text, r'^mdtest case (\d+): .*$')
+    assert list(outputs) == ['0', '1']
+
+    first = mdtestout.parse(outputs['0'])
+    second = mdtestout.parse(outputs['1'])
+    assert first[-1].rate['file_create'].mean == 8744.219
+    assert second[-1].rate['file_create'].mean == 15469.590
+    assert len(mdtestout.parse(text)) == 2
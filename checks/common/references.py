@@ -0,0 +1,9 @@
+# Performance references calibrated from the perflog history.
+#
+# Generated by perflog-store calibrate; run it to fill in the references.
+# Do not edit; rerun the calibration instead.
+#
+# REFERENCES[check][variant][partition][environ][perfvar]
+
+REFERENCES = {
+}
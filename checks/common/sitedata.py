@@ -0,0 +1,176 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Site data shared by the HPC2N and C3SE checks.
+#
+# The per-partition tables live in checks/common/tables/<module>.py.  A table
+# module is only loaded when one of its tables is first used, each table is
+# validated once, and the lookups are memoized by the partition's full name,
+# so that the many test variants created by the checks share one copy.
+#
+# The returned entries are shared between all tests and must not be
+# modified.
+#
+
+import functools
+import os
+
+import reframe.utility as util
+
+_MISSING = object()
+
+
+def _load(name):
+    return util.import_module_from_file(
+        os.path.join(os.path.dirname(__file__), f'{name}.py')
+    )
+
+
+def _check_partition(name, key):
+    sysname, sep, part = key.partition(':')
+    if not sysname or not sep or not part or ':' in part:
+        raise ValueError(f'{name}: {key!r} is not a system:partition name')
+
+
+def _validate_partition_table(name, data):
+    if not isinstance(data, dict):
+        raise TypeError(f'{name}: expected a dict, got {type(data).__name__}')
+
+    for key in data:
+        _check_partition(name, key)
+
+
+def _validate_fs_table(name, data):
+    if not isinstance(data, dict):
+        raise TypeError(f'{name}: expected a dict, got {type(data).__name__}')
+
+    for base_dir, entry in data.items():
+        valid_systems = entry.get('valid_systems')
+        if not valid_systems:
+            raise ValueError(f'{name}: no valid_systems for {base_dir!r}')
+
+        systems = {s.split(':')[0] for s in valid_systems}
+        for key in _scopes(entry):
+            if ':' in key:
+                _check_partition(f'{name}[{base_dir!r}]', key)
+
+            if key.split(':')[0] not in systems:
+                raise ValueError(f'{name}[{base_dir!r}]: {key!r} is not one '
+                                 f'of the valid systems')
+
+
+def _scopes(entry):
+    '''Return the system and partition keys of a file system entry.'''
+
+    systems = {s.split(':')[0] for s in entry.get('valid_systems', [])}
+    return [k for k, v in entry.items()
+            if isinstance(v, dict) and (':' in k or k in systems)]
+
+
+@functools.lru_cache(maxsize=None)
+def table(module, name):
+    '''Return a per-partition table, e.g. ``table('stream', 'ARRAY_SIZE')``.
+
+    The table is indexed by the partition's full name.
+    '''
+
+    data = getattr(_load(os.path.join('tables', module)), name)
+    _validate_partition_table(f'{module}.{name}', data)
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup(module, name, partition):
+    return table(module, name).get(partition, _MISSING)
+
+
+def lookup(module, name, partition, default=None):
+    '''Return the entry of a partition in a per-partition table.'''
+
+    value = _lookup(module, name, partition)
+    return default if value is _MISSING else value
+
+
+def partition_value(test, module, name, default=None):
+    '''Return the entry of the test's current partition in a table.'''
+
+    return lookup(module, name, test.current_partition.fullname, default)
+
+
+@functools.lru_cache(maxsize=None)
+def fs_table(module, name):
+    '''Return a file system table, e.g. ``fs_table('ior', 'FS')``.
+
+    The table is indexed by the test directory.  Each entry holds the
+    ``valid_systems`` and the settings of the file system, and may override
+    them for a system or partition in a sub-dict.  The ``DEFAULTS`` of the
+    table module apply to all file systems.
+    '''
+
+    data = getattr(_load(os.path.join('tables', module)), name)
+    _validate_fs_table(f'{module}.{name}', data)
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _fs_settings(module, name, base_dir, scope):
+    entry = fs_table(module, name)[base_dir]
+    scopes = _scopes(entry)
+    settings = dict(getattr(_load(os.path.join('tables', module)),
+                            'DEFAULTS', {}))
+    settings.update((k, v) for k, v in entry.items() if k not in scopes)
+    for key in dict.fromkeys([scope.split(':')[0], scope]):
+        settings.update(entry.get(key, {}))
+
+    return settings
+
+
+def fs_settings(test, module, name):
+    '''Return the settings of the test's file system on its partition.
+
+    The settings of the file system are overridden by those of the current
+    system and then by those of the current partition.  Before the test is
+    set up, only the system settings are applied.
+    '''
+
+    if test.current_partition is not None:
+        scope = test.current_partition.fullname
+    else:
+        scope = test.current_system.name
+
+    return _fs_settings(module, name, test.base_dir, scope)
+
+
+def test_variant(test):
+    '''Return the parameters of a test the way they are stored in the
+    perflog store, e.g. ``base_dir=/scratch``.'''
+
+    params = [tok[1:] for tok in test.display_name.split()[1:]
+              if tok.startswith('%')]
+    return ' '.join(sorted(params, key=lambda p: p.partition('=')[0]))
+
+
+@functools.lru_cache(maxsize=None)
+def calibrated_reference(check, variant, partition, environ):
+    '''Return the calibrated references of a test, or an empty dict.
+
+    The references are generated by ``perflog-store calibrate`` into
+    references.py, which is only read on first use.
+    '''
+
+    references = _load('references').REFERENCES
+    entry = references.get(check, {}).get(variant, {})
+    return entry.get(partition, {}).get(environ, {})
+
+
+def apply_calibrated_reference(test):
+    '''Replace the hand-written references of the current partition with the
+    calibrated ones, if there are any.'''
+
+    partition = test.current_partition.fullname
+    calibrated = calibrated_reference(type(test).__name__, test_variant(test),
+                                      partition, test.current_environ.name)
+    if calibrated:
+        test.reference.update({partition: calibrated})
@@ -0,0 +1,86 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-partition specifications of the GPUs.
+#
+# The architecture and the number of GPUs per node come from the devices of
+# the partitions in the configuration; the configuration has no place for
+# the rest, so the model of each GPU partition and its nominal vendor
+# figures are kept here.  Memory is in GB, the peak FLOP rates in GFLOP/s
+# and the peak memory bandwidth in GB/s.  See common/gpus.py.
+#
+
+_V100_PCIE_16GB = {
+    'model': 'V100-PCIE-16GB', 'arch': 'sm_70', 'memory': 16,
+    'peak_fp64': 7000, 'peak_fp32': 14000, 'peak_bw': 900,
+}
+
+_V100_SXM2_32GB = {
+    'model': 'V100-SXM2-32GB', 'arch': 'sm_70', 'memory': 32,
+    'peak_fp64': 7800, 'peak_fp32': 15700, 'peak_bw': 900,
+}
+
+_T4 = {
+    'model': 'T4', 'arch': 'sm_75', 'memory': 16,
+    'peak_fp64': 254, 'peak_fp32': 8100, 'peak_bw': 320,
+}
+
+_A100_PCIE_40GB = {
+    'model': 'A100-PCIE-40GB', 'arch': 'sm_80', 'memory': 40,
+    'peak_fp64': 9700, 'peak_fp32': 19500, 'peak_bw': 1555,
+}
+
+_A100_SXM4_40GB = {
+    'model': 'A100-SXM4-40GB', 'arch': 'sm_80', 'memory': 40,
+    'peak_fp64': 9700, 'peak_fp32': 19500, 'peak_bw': 1555,
+}
+
+_A100_SXM4_80GB = {
+    'model': 'A100-SXM4-80GB', 'arch': 'sm_80', 'memory': 80,
+    'peak_fp64': 9700, 'peak_fp32': 19500, 'peak_bw': 2039,
+}
+
+_A40 = {
+    'model': 'A40', 'arch': 'sm_86', 'memory': 48,
+    'peak_fp64': 585, 'peak_fp32': 37400, 'peak_bw': 696,
+}
+
+_A6000 = {
+    'model': 'RTX-A6000', 'arch': 'sm_86', 'memory': 48,
+    'peak_fp64': 605, 'peak_fp32': 38700, 'peak_bw': 768,
+}
+
+_L40S = {
+    'model': 'L40S', 'arch': 'sm_89', 'memory': 48,
+    'peak_fp64': 1431, 'peak_fp32': 91600, 'peak_bw': 864,
+}
+
+_H100_SXM5_80GB = {
+    'model': 'H100-SXM5-80GB', 'arch': 'sm_90', 'memory': 80,
+    'peak_fp64': 34000, 'peak_fp32': 67000, 'peak_bw': 3350,
+}
+
+_MI100 = {
+    'model': 'MI100', 'arch': 'gfx908', 'memory': 32,
+    'peak_fp64': 11500, 'peak_fp32': 23100, 'peak_bw': 1229,
+}
+
+SPECS = {
+    'alvis:2xV100': _V100_SXM2_32GB,
+    'alvis:4xV100': _V100_SXM2_32GB,
+    'alvis:8xT4': _T4,
+    'alvis:4xA100_MEM256': _A100_SXM4_40GB,
+    'alvis:4xA100_MEM512': _A100_SXM4_40GB,
+    'alvis:4xA100fat': _A100_SXM4_80GB,
+    'alvis:4xA40': _A40,
+    'kebnekaise:2xv100': _V100_PCIE_16GB,
+    'kebnekaise:2xa6000': _A6000,
+    'kebnekaise:8xa40': _A40,
+    'kebnekaise:2xa100': _A100_PCIE_40GB,
+    'kebnekaise:2xl40s': _L40S,
+    'kebnekaise:6xl40s': _L40S,
+    'kebnekaise:4xh100': _H100_SXM5_80GB,
+    'kebnekaise:2xmi100': _MI100,
+}
@@ -0,0 +1,51 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-partition settings of the TensorFlow Horovod check.
+#
+
+# num_nodes is per-variant
+TASKS_CPU_SETTINGS = {
+    'alvis:2xV100': {
+        'cpus_per_node': 16,
+        'num_nodes': {'small': 1, 'large': 1},
+    },
+    'alvis:4xV100': {
+        'cpus_per_node': 32,
+        'num_nodes': {'small': 1, 'large': 1},
+    },
+    'alvis:8xT4': {
+        'cpus_per_node': 32,
+        'num_nodes': {'small': 1, 'large': 1},
+    },
+    'alvis:4xA40': {
+        'cpus_per_node': 64,
+        'num_nodes': {'small': 1, 'large': 1},
+    },
+    'alvis:4xA100_MEM256': {
+        'cpus_per_node': 64,
+        'num_nodes': {'small': 1, 'large': 1},
+    },
+    'alvis:4xA100_MEM512': {
+        'cpus_per_node': 64,
+        'num_nodes': {'small': 1, 'large': 1},
+    },
+    'alvis:4xA100fat': {
+        'cpus_per_node': 64,
+        'num_nodes': {'small': 1, 'large': 1},
+    },
+    'kebnekaise:2xK80': {
+        'cpus_per_node': 28,
+        'num_nodes': {'small': 1, 'large': 4},
+    },
+    'kebnekaise:4xK80': {
+        'cpus_per_node': 28,
+        'num_nodes': {'small': 1, 'large': 2},
+    },
+    'kebnekaise:2xV100': {
+        'cpus_per_node': 28,
+        'num_nodes': {'small': 1, 'large': 4},
+    },
+}
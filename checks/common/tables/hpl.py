@@ -0,0 +1,19 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-partition settings of the HPL checks.
+#
+
+SINGLE_NODE = {
+    'kebnekaise:bdw': {'N': 107520, 'NB': 192, 'P': 7, 'Q': 4},
+    'kebnekaise:sky': {'N': 107520, 'NB': 192, 'P': 7, 'Q': 4},
+    'kebnekaise:zen4': {'N': 107520, 'NB': 192, 'P': 16, 'Q': 16},
+    'kebnekaise:2xl40s': {'N': 107520, 'NB': 192, 'P': 8, 'Q': 6},
+    'kebnekaise:4xh100': {'N': 107520, 'NB': 192, 'P': 12, 'Q': 8},
+    'vera:skylake': {'N': 101760, 'NB': 192, 'P': 8, 'Q': 4},
+    'vera:icelake': {'N': 245760, 'NB': 192, 'P': 16, 'Q': 4},
+    'alvis:2xV100': {'N': 280000, 'NB': 200, 'P': 4, 'Q': 4},
+    'alvis:8xT4': {'N': 240000, 'NB': 200, 'P': 4, 'Q': 4},
+}
@@ -0,0 +1,164 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-file system settings of the IOR checks.
+#
+# The settings of a file system may be overridden for a system or a partition
+# in a sub-dict; see sitedata.fs_settings.
+#
+
+DEFAULTS = {
+    'ior_block_size': '24g',
+    'ior_xfr_size': '4m',
+    'ior_access_type': 'MPIIO',
+    # Cases of IorSweepCheck; HDF5 needs an IOR built with it, add it to
+    # sweep_apis of the file systems where it is
+    'sweep_xfer_sizes': ['4k', '64k', '1m', '4m', '16m'],
+    'sweep_apis': ['POSIX', 'MPIIO'],
+    'sweep_block_size': '1g',
+    'sweep_deadline': 30,
+    # Data per task and deadline of IorScalingCheck
+    'scaling_block_size': '16g',
+    'scaling_deadline': 120,
+    # Data per task and deadline of the IOR runs of MDtestIorInterference
+    'interference_block_size': '16g',
+    'interference_deadline': 60,
+    # IorCacheBypassReadCheck: whether the file system is shared between the
+    # nodes, the command dropping the page cache of a node where users may
+    # run one, and the bandwidth a node cannot read faster than (MiB/s, a
+    # 100 Gbit/s link)
+    'shared': True,
+    'drop_caches_cmd': None,
+    'max_node_bw': 11920,
+    'reference': {
+        'read_bw': (0, None, None, 'MiB/s'),
+        'write_bw': (0, None, None, 'MiB/s')
+    },
+}
+
+FS = {
+    '/pfs/stor10/io-test': {
+        'valid_systems': ['kebnekaise'],
+        'kebnekaise': {
+            'num_tasks': 28,
+            'num_tasks_per_node': 28,
+        },
+        'kebnekaise:zen3': {
+            'num_tasks': 128,
+            'num_tasks_per_node': 128,
+        },
+        'kebnekaise:zen4': {
+            'num_tasks': 256,
+            'num_tasks_per_node': 256,
+        },
+        'kebnekaise:8xa40': {
+            'num_tasks': 64,
+            'num_tasks_per_node': 64,
+        },
+        'kebnekaise:2xl40s': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'kebnekaise:6xl40s': {
+            'num_tasks': 60,
+            'num_tasks_per_node': 60,
+        },
+        'kebnekaise:4xh100': {
+            'num_tasks': 96,
+            'num_tasks_per_node': 96,
+        },
+        'ior_block_size': '480g',
+        'reference': {
+            'write_bw': (5400, -0.1, None, 'MiB/s'),
+            'read_bw': (5300, -0.1, None, 'MiB/s'),
+        },
+    },
+    '/scratch': {
+        'valid_systems': ['kebnekaise'],
+        'kebnekaise:zen4': {
+            'num_tasks': 256,
+            'num_tasks_per_node': 256,
+        },
+        'kebnekaise:2xl40s': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'kebnekaise:4xh100': {
+            'num_tasks': 96,
+            'num_tasks_per_node': 96,
+        },
+        'ior_block_size': '10g',
+        # The local disk of the node
+        'shared': False,
+        'max_node_bw': 7000,
+    },
+    '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test': {
+        'valid_systems': ['alvis'],
+        'alvis:CPUonly': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+        },
+        'alvis:2xV100': {
+            'num_tasks': 16,
+            'num_tasks_per_node': 16,
+        },
+        'alvis:4xV100': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+        },
+        'alvis:4xA40': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'alvis:4xA100_MEM256': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'alvis:4xA100_MEM512': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'reference': {
+            'write_bw': (3100, -0.1, None, 'MiB/s'),
+            'read_bw': (2500, -0.1, None, 'MiB/s'),
+        },
+        'ior_block_size': '240g',
+    },
+    '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test': {
+        'valid_systems': ['alvis'],
+        'alvis:CPUonly': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+        },
+        'alvis:2xV100': {
+            'num_tasks': 16,
+            'num_tasks_per_node': 16,
+            'ior_access_type': 'POSIX',
+        },
+        'alvis:4xV100': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+            'ior_access_type': 'POSIX',
+        },
+        'alvis:4xA40': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+            'ior_access_type': 'POSIX',
+        },
+        'alvis:4xA100_MEM256': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'alvis:4xA100_MEM512': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'ior_block_size': '240g',
+        'reference': {
+            'write_bw': (6700, -0.1, None, 'MiB/s'),
+            'read_bw': (6100, -0.1, None, 'MiB/s'),
+        },
+    },
+}
@@ -0,0 +1,32 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-directory settings of the node-local disk check.
+#
+# The settings of a directory may be overridden for a system or a partition
+# in a sub-dict; see sitedata.fs_settings.  $TMPDIR is expanded in the job.
+#
+
+DEFAULTS = {
+    'file_size': '32g',
+    'runtime': 30,
+    'queue_depths': [1, 4, 16, 32],
+    'random_depth': 32,
+    'cpus_per_task': 16,
+    'reference': {
+        'randread_4k': (0, -0.1, None, 'IOPS'),
+        'randwrite_4k': (0, -0.1, None, 'IOPS'),
+        'mmap_read': (0, -0.1, None, 'MiB/s'),
+    },
+}
+
+FS = {
+    '/scratch': {
+        'valid_systems': ['kebnekaise'],
+    },
+    '$TMPDIR': {
+        'valid_systems': ['alvis', 'vera'],
+    },
+}
@@ -0,0 +1,237 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-file system settings of the mdtest checks.
+#
+# The settings of a file system may be overridden for a system or a partition
+# in a sub-dict; see sitedata.fs_settings.
+#
+
+DEFAULTS = {
+    'nr_dirs_files_per_proc': '20000',
+    'iterations': '3',
+    'io_api': 'POSIX',
+    'stride': '0',
+    'unique_dir_per_task': True,
+    'hierarch_depth': '3',
+    'hierarch_branch': '3',
+    'bytes_per_file': '0',
+    'stonewall_timer': '300',
+    # Points of MDtestSweep.  mdtest only stonewalls trees with a branch
+    # factor of 1, the other points are bounded by their number of items
+    'sweep_depths': ['1', '3'],
+    'sweep_branches': ['1', '3'],
+    'sweep_items_per_dir': ['10', '100'],
+    'sweep_bytes_per_file': ['0', '4k', '64k'],
+    'sweep_stonewall_timer': '30',
+    # Files per task of the mdtest runs of MDtestIorInterference
+    'interference_files_per_proc': '5000',
+    'reference': {
+        'dir_create': (0, -0.1, None, 'dirs/s'),
+        'dir_stat': (0, -0.1, None, 'dirs/s'),
+        'dir_removal': (0, -0.1, None, 'dirs/s'),
+        'file_create': (0, -0.1, None, 'files/s'),
+        'file_stat': (0, -0.1, None, 'files/s'),
+        'file_read': (0, -0.1, None, 'files/s'),
+        'file_removal': (0, -0.1, None, 'files/s'),
+        'tree_create': (0, -0.1, None, 'dirs/s'),
+        'tree_removal': (0, -0.1, None, 'dirs/s'),
+    },
+}
+
+# Single node test
+NODE = {
+    '/pfs/stor10/io-test': {
+        'valid_systems': ['kebnekaise'],
+        'kebnekaise': {
+            'num_tasks': 28,
+            'num_tasks_per_node': 28,
+        },
+        'kebnekaise:zen3': {
+            'num_tasks': 128,
+            'num_tasks_per_node': 128,
+        },
+        'kebnekaise:zen4': {
+            'num_tasks': 256,
+            'num_tasks_per_node': 256,
+        },
+        'kebnekaise:2xl40s': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'kebnekaise:6xl40s': {
+            'num_tasks': 60,
+            'num_tasks_per_node': 60,
+        },
+        'kebnekaise:8xa40': {
+            'num_tasks': 64,
+            'num_tasks_per_node': 64,
+        },
+        'kebnekaise:4xh100': {
+            'num_tasks': 96,
+            'num_tasks_per_node': 96,
+        },
+        'reference': {
+            'dir_create': (13000, -0.1, None, 'dirs/s'),
+            'dir_stat': (23000, -0.1, None, 'dirs/s'),
+            'dir_removal': (14000, -0.1, None, 'dirs/s'),
+            'file_create': (6500, -0.1, None, 'files/s'),
+            'file_stat': (30000, -0.1, None, 'files/s'),
+            'file_read': (10000, -0.1, None, 'files/s'),
+            'file_removal': (15000, -0.1, None, 'files/s'),
+            'tree_create': (500, -0.1, None, 'dirs/s'),
+            'tree_removal': (400, -0.1, None, 'dirs/s'),
+        },
+    },
+    '/scratch': {
+        'valid_systems': ['kebnekaise'],
+        'kebnekaise:zen4': {
+            'num_tasks': 256,
+            'num_tasks_per_node': 256,
+        },
+        'kebnekaise:2xl40s': {
+            'num_tasks': 48,
+            'num_tasks_per_node': 48,
+        },
+        'kebnekaise:4xh100': {
+            'num_tasks': 96,
+            'num_tasks_per_node': 96,
+        },
+    },
+    '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test': {
+        'valid_systems': ['alvis'],
+        'nr_dirs_files_per_proc': '1000',
+        'alvis:CPUonly': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+        },
+        'alvis:2xV100': {
+            'num_tasks': 16,
+            'num_tasks_per_node': 16,
+        },
+        'alvis:4xV100': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+        },
+        'alvis:4xA40': {
+            'num_tasks': 64,
+            'num_tasks_per_node': 64,
+        },
+        'alvis:4xA100_MEM256': {
+            'num_tasks': 63,
+            'num_tasks_per_node': 63,
+        },
+        'alvis:4xA100_MEM512': {
+            'num_tasks': 63,
+            'num_tasks_per_node': 63,
+        },
+        'reference': {
+            'dir_create': (3000, -0.1, None, 'dirs/s'),
+            'dir_stat': (60000, -0.1, None, 'dirs/s'),
+            'dir_removal': (1000, -0.1, None, 'dirs/s'),
+            'file_create': (4000, -0.1, None, 'files/s'),
+            'file_stat': (60000, -0.1, None, 'files/s'),
+            'file_read': (35000, -0.1, None, 'files/s'),
+            'file_removal': (1500, -0.1, None, 'files/s'),
+            'tree_create': (37, -0.1, None, 'dirs/s'),
+            'tree_removal': (9, -0.1, None, 'dirs/s'),
+        },
+    },
+    '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test': {
+        'valid_systems': ['alvis'],
+        'alvis:CPUonly': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+        },
+        'alvis:2xV100': {
+            'num_tasks': 16,
+            'num_tasks_per_node': 16,
+        },
+        'alvis:4xV100': {
+            'num_tasks': 32,
+            'num_tasks_per_node': 32,
+        },
+        'alvis:4xA40': {
+            'num_tasks': 64,
+            'num_tasks_per_node': 64,
+        },
+        'alvis:4xA100_MEM256': {
+            'num_tasks': 63,
+            'num_tasks_per_node': 63,
+        },
+        'alvis:4xA100_MEM512': {
+            'num_tasks': 63,
+            'num_tasks_per_node': 63,
+        },
+        'reference': {
+            'dir_create': (64000, -0.1, None, 'dirs/s'),
+            'dir_stat': (95000, -0.1, None, 'dirs/s'),
+            'dir_removal': (70000, -0.1, None, 'dirs/s'),
+            'file_create': (60000, -0.1, None, 'files/s'),
+            'file_stat': (120000, -0.1, None, 'files/s'),
+            'file_read': (55000, -0.1, None, 'files/s'),
+            'file_removal': (70000, -0.1, None, 'files/s'),
+            'tree_create': (250, -0.1, None, 'dirs/s'),
+            'tree_removal': (450, -0.1, None, 'dirs/s'),
+        },
+    },
+}
+
+# Single thread test
+SINGLE = {
+    '/pfs/stor10/io-test': {
+        'valid_systems': ['kebnekaise'],
+        'nr_dirs_files_per_proc': '100000',
+        'iterations': '5',
+        'reference': {
+            'dir_create': (1900, -0.1, None, 'dirs/s'),
+            'dir_stat': (2100, -0.1, None, 'dirs/s'),
+            'dir_removal': (1800, -0.1, None, 'dirs/s'),
+            'file_create': (900, -0.1, None, 'files/s'),
+            'file_stat': (950, -0.1, None, 'files/s'),
+            'file_read': (1100, -0.1, None, 'files/s'),
+            'file_removal': (1700, -0.1, None, 'files/s'),
+            'tree_create': (850, -0.1, None, 'dirs/s'),
+            'tree_removal': (1200, -0.1, None, 'dirs/s'),
+        },
+    },
+    '/scratch': {
+        'valid_systems': ['kebnekaise'],
+        'nr_dirs_files_per_proc': '100000',
+        'iterations': '5',
+    },
+    '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test': {
+        'valid_systems': ['alvis'],
+        'nr_dirs_files_per_proc': '100000',
+        'iterations': '5',
+        'reference': {
+            'dir_create': (1700, -0.1, None, 'dirs/s'),
+            'dir_stat': (155000, -0.1, None, 'dirs/s'),
+            'dir_removal': (1700, -0.1, None, 'dirs/s'),
+            'file_create': (3400, -0.1, None, 'files/s'),
+            'file_stat': (138000, -0.1, None, 'files/s'),
+            'file_read': (138000, -0.1, None, 'files/s'),
+            'file_removal': (3300, -0.1, None, 'files/s'),
+            'tree_create': (3600, -0.1, None, 'dirs/s'),
+            'tree_removal': (900, -0.1, None, 'dirs/s'),
+        },
+    },
+    '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test': {
+        'valid_systems': ['alvis'],
+        'nr_dirs_files_per_proc': '100000',
+        'iterations': '5',
+        'reference': {
+            'dir_create': (2500, -0.1, None, 'dirs/s'),
+            'dir_stat': (16000, -0.1, None, 'dirs/s'),
+            'dir_removal': (2000, -0.1, None, 'dirs/s'),
+            'file_create': (2500, -0.1, None, 'files/s'),
+            'file_stat': (27000, -0.1, None, 'files/s'),
+            'file_read': (32000, -0.1, None, 'files/s'),
+            'file_removal': (2500, -0.1, None, 'files/s'),
+            'tree_create': (1200, -0.1, None, 'dirs/s'),
+            'tree_removal': (700, -0.1, None, 'dirs/s'),
+        },
+    },
+}
@@ -0,0 +1,40 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-file system settings of the storage latency probe.
+#
+# The settings of a file system may be overridden for a system or a partition
+# in a sub-dict; see sitedata.fs_settings.
+#
+
+DEFAULTS = {
+    'threads': 16,
+    'duration': 120,
+    'block_size': 4096,
+    # Ceilings of the 99th percentiles until the references are calibrated
+    'reference': {
+        'create_p99': (50000, None, 0.0, 'us'),
+        'write_p99': (100000, None, 0.0, 'us'),
+        'stat_p99': (50000, None, 0.0, 'us'),
+        'open_p99': (50000, None, 0.0, 'us'),
+        'read_p99': (100000, None, 0.0, 'us'),
+        'unlink_p99': (50000, None, 0.0, 'us'),
+    },
+}
+
+FS = {
+    '/pfs/stor10/io-test': {
+        'valid_systems': ['kebnekaise'],
+    },
+    '/scratch': {
+        'valid_systems': ['kebnekaise'],
+    },
+    '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test': {
+        'valid_systems': ['alvis'],
+    },
+    '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test': {
+        'valid_systems': ['alvis'],
+    },
+}
@@ -0,0 +1,79 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-partition settings of the STREAM checks.
+#
+
+CPUS_PER_TASK = {
+    'kebnekaise:local': 28,
+    'kebnekaise:bdw': 28,
+    'kebnekaise:sky': 28,
+    'kebnekaise:gpu': 28,
+    'kebnekaise:knl': 68,
+    'kebnekaise:lm': 72,
+    'kebnekaise:zen3': 128,
+    'kebnekaise:zen4': 256,
+    'kebnekaise:2xl40s': 48,
+    'kebnekaise:4xh100': 96,
+    'aigert:zen4': 256,
+    'UmU-Cloud:default': 64,
+    'vera:skylake': 32,
+    'vera:icelake': 64,
+    'alvis:8xT4': 32,
+    'alvis:2xV100': 16,
+    'alvis:4xV100': 32,
+    'alvis:4xA100_MEM256': 64,
+    'alvis:4xA100_MEM512': 64,
+    'alvis:4xA100fat': 64,
+    'alvis:4xA40': 64,
+}
+
+THREAD_REDUCTION = {
+    # Due to the wekanode process we need to reduce number of OMP threads on A100 nodes
+    'alvis:4xA100_MEM256': 2,
+    'alvis:4xA100_MEM512': 2,
+    'alvis:4xA100fat': 2,
+}
+
+# Size of array in Mi-elements (*1024^2), total memory usage is size * 1024^2 * 8 * 3
+ARRAY_SIZE = {
+    'kebnekaise:local': 4500,
+    'kebnekaise:bdw': 4500,
+    'kebnekaise:sky': 4500,
+    'kebnekaise:gpu': 4500,
+    'kebnekaise:knl': 6800,
+    'kebnekaise:lm': 24000, # 121000, for using the whole memory, but that takes forever.
+    'kebnekaise:zen3': 42000,
+    'kebnekaise:zen4': 26000,
+    'kebnekaise:2xl40s': 13000,
+    'kebnekaise:4xh100': 26000,
+    'aigert:zen4': 30000,
+    'UmU-Cloud:default': 21200,
+    'vera:skylake': 3600,
+    'vera:icelake': 20000,
+    'alvis:8xT4': 22900,
+    'alvis:2xV100': 30900,
+    'alvis:4xV100': 30900,
+    # Due to the wekanode process we need to reduce memory on A100 nodes
+    'alvis:4xA100_MEM256': 9800,
+    'alvis:4xA100_MEM512': 20000,
+    'alvis:4xA100fat': 41000,
+    'alvis:4xA40': 10400,
+}
+
+USE_OMP_BINDING = {
+    # Due to the wekanode process we can't use OMP binding on A100 nodes
+    'alvis:4xA100_MEM256': False,
+    'alvis:4xA100_MEM512': False,
+    'alvis:4xA100fat': False,
+}
+
+# Default is to use hugepages, this is for turning it off
+DISABLE_HUGEPAGES = {
+}
+
+# OMP_PROC_BIND when the OMP binding is used, default is spread
+PROC_BIND = {
+}
@@ -3,8 +3,9 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import math
 import os
-import re
+import shlex
 
 import reframe as rfm
 import reframe.utility as util
@@ -12,6 +13,90 @@ import reframe.utility.sanity as sn
 import reframe.utility.udeps as udeps
 
 from reframe.core.backends import getlauncher
+from reframe.core.exceptions import SanityError
+
+hooks = rfm.utility.import_module('...gpu.hooks')
+hpldat = rfm.utility.import_module('.src.hpldat')
+hplout = rfm.utility.import_module('....common.parsers.hpl')
+sitedata = rfm.utility.import_module('....common.sitedata')
+
+
+def process_grid(ntasks):
+    '''Return the most square ``(P, Q)`` grid of ``ntasks`` with
+    ``P <= Q``.'''
+
+    P = max(p for p in range(1, math.isqrt(ntasks) + 1) if ntasks % p == 0)
+    return P, ntasks // P
+
+
+@sn.deferrable
+def best_case(filename):
+    '''The fastest HPL case of an output that passed its residual check.'''
+
+    case = hplout.best(hplout.parse_file(filename))
+    if case is None:
+        raise SanityError(f'no HPL case passed in {filename}')
+
+    return case
+
+
+@sn.deferrable
+def case_gflops(filename, N, NB, P, Q, variant=None):
+    '''The GFlops of one HPL case of an output.'''
+
+    for case in hplout.parse_file(filename):
+        if ((case.N, case.NB, case.P, case.Q) == (N, NB, P, Q) and
+                variant in (None, case.variant)):
+            return case.gflops
+
+    raise SanityError(f'no HPL case {variant or ""} N={N} NB={NB} P={P} '
+                      f'Q={Q} in {filename}')
+
+
+# The GFlops of HPLBaseSingleNode_Fixed
+SINGLE_NODE_REFERENCE = {
+    'kebnekaise:bdw': {
+        'GFlops': (871, -0.05, 0.05, 'GFlops/s'),
+    },
+    'kebnekaise:sky': {
+        'GFlops': (871, -0.05, 0.05, 'GFlops/s'),
+    },
+    'kebnekaise:zen4': {
+        'GFlops': (6200, -0.05, 0.10, 'GFlops/s'),
+    },
+    'kebnekaise:2xl40s': {
+        'GFlops': (2000, -0.05, 0.05, 'GFlops/s'),
+    },
+    'kebnekaise:4xh100': {
+        'GFlops': (3350, -0.05, 0.05, 'GFlops/s'),
+    },
+    'vera:skylake': {
+        'GFlops': (1200, -0.05, 0.05, 'GFlops/s'),
+    },
+    'vera:icelake': {
+        'GFlops': (3100, -0.05, 0.05, 'GFlops/s'),
+    },
+    'alvis:2xV100': {
+        'GFlops': (1140, -0.05, 0.05, 'GFlops/s'),
+    },
+    'alvis:8xT4': {
+        'GFlops': (1140, -0.05, 0.05, 'GFlops/s'),
+    },
+}
+
+
+def single_node_gflops(test):
+    '''Return the expected GFlops of a node of the test's partition, the
+    calibrated or the hand-written reference of the single node test, or
+    ``None``.'''
+
+    partition = test.current_partition.fullname
+    calibrated = sitedata.calibrated_reference(
+        'HPLBaseSingleNode_Fixed', '', partition, test.current_environ.name
+    )
+    ref = (calibrated.get('GFlops') or
+           SINGLE_NODE_REFERENCE.get(partition, {}).get('GFlops'))
+    return ref[0] if ref else None
 
 
 class HPLBase(rfm.RunOnlyRegressionTest):
@@ -22,9 +107,7 @@ class HPLBase(rfm.RunOnlyRegressionTest):
         self.executable = 'xhpl'
 
         self.perf_patterns = {
-            'GFlops': sn.max(sn.extractall(
-                rf'^\S+\s+\d+\s+\d+\s+\d+\s+\d+\s+\d+\.\d+\s+(\d+\.\d+e\+\d+)$',
-                self.stdout, 1, float)),
+            'GFlops': sn.getattr(best_case(self.stdout), 'gflops'),
         }
 
         self.tags = {'production', 'reboot', 'maintenance'}
@@ -56,62 +139,48 @@ class HPLBase(rfm.RunOnlyRegressionTest):
 
         self.env_vars = site_variables.get(self.current_system.name, {})
 
+    @run_before('performance')
+    def set_calibrated_reference(self):
+        sitedata.apply_calibrated_reference(self)
 
     # Belongs in library part
     @run_before('run')
     def setup_HPL_data(self):
         '''Create the HPL.dat input file'''
 
-        N = self.values.get('N', 1000)
-        if not isinstance(N, list):
-            N = [N]
-        NB = self.values.get('NB', 100)
-        if not isinstance(NB, list):
-            NB = [NB]
-        P = self.values.get('P', 1)
-        if not isinstance(P, list):
-            P = [P]
-        Q = self.values.get('Q', 1)
-        if not isinstance(Q, list):
-            Q = [Q]
-
-        Ns = len(N)
-        N = ' '.join(map(str, N))
-        NBs = len(NB)
-        NB = ' '.join(map(str, NB))
-        PQs = len(P)
-        if len(Q) != PQs:
-            raise ValueError('Number of Ps != number of Qs')
-        for idx, v in enumerate(P):
-            nt = max(v*Q[idx], 1)
-
-        self.num_cases = Ns*NBs*PQs
-        self.num_tasks = nt
+        dat = hpldat.HPLDat.read(os.path.join(self.prefix, self.sourcesdir,
+                                              'HPL.dat.tmpl'))
+        # The partitions without HPL settings run a small case on one rank
+        dat.update({'N': 1000, 'NB': 100, 'P': 1, 'Q': 1})
+        dat.update(self.values)
+        dat.validate()
+
+        self.num_cases = dat.num_cases()
+        self.num_tasks = max(max(p*q for p, q in dat.grids()), 1)
 
         self.sanity_patterns = sn.assert_eq(sn.extractsingle(r'^\s+(\d+)\s+tests completed and passed residual checks,', self.stdout, 1, int), self.num_cases)
 
-        P = ' '.join(map(str, P))
-        Q = ' '.join(map(str, Q))
-
-        regex_subs = [
-            (r'^[\d\s]+# of problems sizes', f"{Ns} # of problems sizes"),
-            (r'^[\d\s]+Ns', f"{N} Ns"),
-            (r'^[\d\s]+# of NBs', f"{NBs} # of NBs"),
-            (r'^[\d\s]+NBs', f"{NB} NBs"),
-            (r'^[\d\s]+# of process grids', f"{PQs} # of process grids"),
-            (r'^[\d\s]+Ps', f"{P} Ps"),
-            (r'^[\d\s]+Qs', f"{Q} Qs"),
-        ]
-        compiled_regex_subs = [(re.compile(regex), subtxt) for (regex, subtxt) in regex_subs]
+        # With several cases, report each of them and the winning one.  The
+        # variant is only part of the name when the algorithm is varied.
+        if self.num_cases > 1:
+            cases = list(dat.cases())
+            with_variant = len({c[0] for c in cases}) > 1
+            for variant, n, nb, p, q in cases:
+                name = f'N{n}_NB{nb}_P{p}x{q}'
+                if with_variant:
+                    name = f'{variant}_{name}'
+
+                self.perf_patterns[f'GFlops_{name}'] = case_gflops(
+                    self.stdout, n, nb, p, q, variant
+                )
+
+            for param in ('N', 'NB', 'P', 'Q'):
+                self.perf_patterns[f'best_{param}'] = sn.getattr(
+                    best_case(self.stdout), param
+                )
+
+        dat.write(os.path.join(self.stagedir, 'HPL.dat'))
 
-        with open(os.path.join(self.stagedir, 'HPL.dat'), 'w') as H:
-            with open(os.path.join(self.prefix, self.sourcesdir, 'HPL.dat.tmpl')) as f:
-                for line in f:
-                    for regex, subtxt in compiled_regex_subs:
-                        match = regex.search(line)
-                        if match:
-                            line = regex.sub(subtxt, line)
-                    H.write(line)
 
 @rfm.simple_test
 class HPLBaseSingleNode_Fixed(HPLBase):
@@ -120,49 +189,263 @@ class HPLBaseSingleNode_Fixed(HPLBase):
     def __init__(self):
         super().__init__()
 
-        self.hpl_settings = {
-            'kebnekaise:bdw': {'N': 107520, 'NB': 192, 'P': 7, 'Q': 4},
-            'kebnekaise:sky': {'N': 107520, 'NB': 192, 'P': 7, 'Q': 4},
-            'kebnekaise:zen4': {'N': 107520, 'NB': 192, 'P': 16, 'Q': 16},
-            'kebnekaise:2xl40s': {'N': 107520, 'NB': 192, 'P': 8, 'Q': 6},
-            'kebnekaise:4xh100': {'N': 107520, 'NB': 192, 'P': 12, 'Q': 8},
-            'vera:skylake': {'N': 101760, 'NB': 192, 'P': 8, 'Q': 4},
-            'vera:icelake': {'N': 245760, 'NB': 192, 'P': 16, 'Q': 4},
-            'alvis:2xV100': {'N': 280000, 'NB': 200, 'P': 4, 'Q': 4},
-            'alvis:8xT4': {'N': 240000, 'NB': 200, 'P': 4, 'Q': 4},
-        }
+        self.reference = SINGLE_NODE_REFERENCE
+
+    @run_after('setup')
+    def prepare_test(self):
+        self.values = sitedata.partition_value(self, 'hpl', 'SINGLE_NODE', {})
+
 
+
+@rfm.simple_test
+class HPLScaling(HPLBase):
+    '''HPL on several nodes
+
+    The settings of each node are those of the single node test.  The
+    matrix grows with the total memory and the process grid is the most
+    square one of all ranks.  The efficiency is the GFlops per node relative
+    to the single node run of the same session, so that a slow link shows
+    up as a drop of the efficiency of the larger runs.  It takes 31 nodes
+    per partition, so it only runs with ``-t scaling``, e.g. after work on
+    the fabric.
+    '''
+
+    num_nodes = parameter([1, 2, 4, 8, 16], loggable=True)
+
+    def __init__(self):
+        super().__init__()
+
+        self.descr = f'HPL on {self.num_nodes} nodes'
+        self.time_limit = '2h'
+        self.tags = {'scaling'}
         self.reference = {
-            'kebnekaise:bdw': {
-                'GFlops': (871, -0.05, 0.05, 'GFlops/s'),
-            },
-            'kebnekaise:sky': {
-                'GFlops': (871, -0.05, 0.05, 'GFlops/s'),
-            },
-            'kebnekaise:zen4': {
-                'GFlops': (6200, -0.05, 0.10, 'GFlops/s'),
-            },
-            'kebnekaise:2xl40s': {
-                'GFlops': (2000, -0.05, 0.05, 'GFlops/s'),
-            },
-            'kebnekaise:4xh100': {
-                'GFlops': (3350, -0.05, 0.05, 'GFlops/s'),
-            },
-            'vera:skylake': {
-                'GFlops': (1200, -0.05, 0.05, 'GFlops/s'),
-            },
-            'vera:icelake': {
-                'GFlops': (3100, -0.05, 0.05, 'GFlops/s'),
-            },
-            'alvis:2xV100': {
-                'GFlops': (1140, -0.05, 0.05, 'GFlops/s'),
-            },
-            'alvis:8xT4': {
-                'GFlops': (1140, -0.05, 0.05, 'GFlops/s'),
+            '*': {
+                'efficiency': (1.0, -0.2, None, ''),
             },
         }
 
+    @run_after('init')
+    def set_dependencies(self):
+        if self.num_nodes > 1:
+            self.depends_on(self.single_node_name())
+
+    @classmethod
+    def single_node_name(cls):
+        return cls.variant_name(cls.get_variant_nums(num_nodes=1)[0])
+
+    @run_after('setup')
+    def prepare_test(self):
+        single = sitedata.partition_value(self, 'hpl', 'SINGLE_NODE', {})
+        self.skip_if(not single, f'no HPL settings for '
+                                 f'{self.current_partition.fullname}')
+
+        P, Q = process_grid(single['P'] * single['Q'] * self.num_nodes)
+        NB = single['NB']
+        # The matrix takes the same share of the memory of every node
+        N = int(single['N'] * math.sqrt(self.num_nodes)) // NB * NB
+        self.values = {'N': N, 'NB': NB, 'P': P, 'Q': Q}
+        self.num_tasks_per_node = single['P'] * single['Q']
+
+    @run_before('performance')
+    def set_scaling_perf_patterns(self):
+        gflops = self.perf_patterns['GFlops']
+        self.perf_patterns['GFlops_per_node'] = gflops / self.num_nodes
+        if self.num_nodes == 1:
+            self.perf_patterns['efficiency'] = sn.defer(1.0)
+            return
+
+        key = f'{self.current_partition.fullname}:GFlops'
+        single = self.getdep(self.single_node_name()).perfvalues.get(key)
+        if single:
+            self.perf_patterns['efficiency'] = (
+                gflops / (self.num_nodes * single[0])
+            )
+
+
+@rfm.simple_test
+class HPLParameterSweep(HPLBase):
+    '''HPL over a subspace of the HPL.dat parameters
+
+    All combinations of the values of ``subspace`` are run in one xhpl
+    invocation, on top of the single node settings with N scaled by
+    ``size_scale`` to keep the cases short.  The GFlops of each case are
+    reported, named after its T/V variant, N, NB and grid.
+    '''
+
+    #: Values of the list fields of HPL.dat to explore, e.g. ``PFACT``,
+    #: ``NBMIN``, ``NDIV``, ``RFACT``, ``BCAST`` and ``DEPTH``
+    subspace = variable(dict, value={
+        'PFACT': [0, 1, 2],
+        'RFACT': [1, 2],
+        'BCAST': [0, 1, 3],
+        'DEPTH': [0, 1],
+    })
+
+    #: Scale of the N of the single node settings
+    size_scale = variable(float, value=0.5)
+
+    #: Seconds a case may take at the single node GFlops; N is reduced to
+    #: fit and the time limit is derived from it
+    case_time = variable(int, value=300)
+
+    def __init__(self):
+        super().__init__()
+
+        self.descr = 'HPL parameter sweep'
+        self.tags = {'autotune'}
+
     @run_after('setup')
     def prepare_test(self):
-        self.values = self.hpl_settings.get(self.current_partition.fullname, {})
+        single = sitedata.partition_value(self, 'hpl', 'SINGLE_NODE', {})
+        self.skip_if(not single, f'no HPL settings for '
+                                 f'{self.current_partition.fullname}')
+
+        N = single['N'] * self.size_scale
+        gflops = single_node_gflops(self)
+        if gflops:
+            # HPL does 2/3 N^3 floating point operations
+            N = min(N, (1.5 * self.case_time * gflops * 1e9) ** (1 / 3))
+
+        NB = min(self.subspace.get('NB', [single['NB']]))
+        self.values = dict(single, **self.subspace)
+        self.values['N'] = int(N) // NB * NB
+
+    @run_before('run')
+    def set_time_limit(self):
+        # The slower variants of the sweep take up to half as long again
+        self.time_limit = int(self.num_cases * self.case_time * 1.5) + 600
+
+
+@rfm.simple_test
+class HPLGpu(HPLBase):
+    '''HPL on the GPUs of a node
+
+    Runs the GPU Linpack of the NVIDIA HPC-Benchmarks container with one
+    rank per GPU on the most square grid of the GPUs, with N sized for
+    ``memory_fraction`` of the GPU memory of the node.  With
+    ``gpu_dry_run`` the input is only written for ``dry_run_gpu_memory`` GiB
+    per GPU and read back, which works without GPUs.
+    '''
+
+    #: Container image of the GPU Linpack
+    image = variable(str, value='docker://nvcr.io/nvidia/hpc-benchmarks:24.03')
+
+    block_size = variable(int, value=1024)
+    memory_fraction = variable(float, value=0.8)
+
+    #: Only write and check the input, on any partition
+    gpu_dry_run = variable(bool, value=False)
+    dry_run_gpu_memory = variable(float, value=80.0)
+
+    def __init__(self):
+        super().__init__()
+
+        self.descr = 'GPU HPL'
+        self.tags = {'maintenance', 'gpu'}
+
+    # The GPU Linpack comes with its container, not with a module
+    @run_after('init')
+    def valid_system_and_module(self):
+        self.valid_systems = ['*'] if self.gpu_dry_run else ['+nvgpu']
+        self.valid_prog_environs = ['builtin']
+
+    @run_after('setup')
+    def set_num_gpus_per_node(self):
+        hooks.set_num_gpus_per_node(self)
+
+    @run_before('run')
+    def setup_HPL_data(self):
+        P, Q = process_grid(self.num_gpus_per_node)
+        input_cmd = [
+            'python3', 'hpl_gpu_input.py',
+            '--gpus', str(self.num_gpus_per_node), '-P', str(P), '-Q', str(Q),
+            '--nb', str(self.block_size),
+            '--fraction', str(self.memory_fraction),
+        ]
+        if self.gpu_dry_run:
+            self.job.launcher = getlauncher('local')()
+            self.executable = input_cmd[0]
+            self.executable_opts = input_cmd[1:] + [
+                '--gpu-memory', str(self.dry_run_gpu_memory)
+            ]
+            self.sanity_patterns = sn.assert_found(
+                rf'^HPL case: \S+ N=[1-9]\d* NB={self.block_size} P={P} '
+                rf'Q={Q}$', self.stdout
+            )
+            self.perf_patterns = None
+            return
 
+        self.num_tasks = self.num_gpus_per_node
+        self.num_tasks_per_node = self.num_gpus_per_node
+        self.prerun_cmds = [' '.join(input_cmd)]
+        self.container_platform = 'Singularity'
+        self.container_platform.image = self.image
+        self.container_platform.command = '/workspace/hpl.sh --dat HPL.dat'
+        self.container_platform.with_cuda = True
+
+        self.sanity_patterns = sn.assert_eq(sn.extractsingle(r'^\s+(\d+)\s+tests completed and passed residual checks,', self.stdout, 1, int), 1)
+        self.perf_patterns['GFlops_per_GPU'] = (
+            self.perf_patterns['GFlops'] / self.num_gpus_per_node
+        )
+
+
+@rfm.simple_test
+class HPLAutotune(HPLBase):
+    '''Autotune the HPL settings of a partition.
+
+    N is derived from the memory of the node and the process grids from the
+    number of cores.  A coarse pass over the block sizes and grids at a
+    small N is followed by a fine pass over N with the best of them.  The
+    best case is written to hpl_sitedata.py in the output directory, as a
+    suggested entry of checks/common/tables/hpl.py.
+    '''
+
+    def __init__(self):
+        super().__init__()
+
+        self.descr = 'HPL autotuning'
+        self.time_limit = '4h'
+        self.keep_files = ['hpl_sitedata.py']
+        self.tags = {'autotune'}
+
+        self.perf_patterns = {
+            'GFlops': sn.extractsingle(r'^Best: .*\bGFlops=([0-9.]+)',
+                                       self.stdout, 1, float),
+            'N': sn.extractsingle(r'^Best: N=(\d+)', self.stdout, 1, int),
+            'NB': sn.extractsingle(r'^Best: .*\bNB=(\d+)', self.stdout, 1,
+                                   int),
+        }
+
+    @run_after('setup')
+    def set_num_tasks(self):
+        # One rank per core, the way the SINGLE_NODE settings are run
+        self.num_tasks = self.current_partition.processor.num_cores
+        if not self.num_tasks:
+            values = sitedata.partition_value(self, 'hpl', 'SINGLE_NODE', {})
+            self.num_tasks = values.get('P', 0) * values.get('Q', 0)
+
+        # Nodes of unknown topology are allocated whole and the autotuner
+        # counts the cores it may run on
+        self.count_cores = not self.num_tasks
+        if self.count_cores:
+            self.num_tasks = 1
+            self.exclusive_access = True
+
+    # Replaces the HPL.dat of the fixed settings; the autotuner writes its own
+    @run_before('run')
+    def setup_HPL_data(self):
+        launcher = self.job.launcher.run_command(self.job)
+        if self.count_cores:
+            launcher += ' --ntasks={tasks}'
+
+        self.job.launcher = getlauncher('local')()
+        self.executable = 'python3'
+        self.executable_opts = [
+            'hpl_autotune.py',
+            '--launcher', shlex.quote(launcher),
+            '--partition', self.current_partition.fullname,
+        ]
+        if not self.count_cores:
+            self.executable_opts += ['--tasks', str(self.num_tasks)]
+        self.sanity_patterns = sn.assert_found(r'^Suggested site data:',
+                                               self.stdout)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+#
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Autotune the HPL settings of a node.
+#
+# The problem size is derived from the memory of the node and the candidate
+# process grids from the number of MPI ranks, by default one per core the
+# job may run on.  A `{tasks}` in the launcher is replaced by the number of
+# ranks.  A coarse pass runs all block
+# sizes and grids at a small problem size, and a fine pass runs the best
+# block sizes on the best grid at problem sizes around the target fraction
+# of the memory.  Both passes are single HPL runs over all their cases.  The
+# best case is printed and written as a suggested entry of
+# checks/common/tables/hpl.py.
+#
+
+import argparse
+import datetime
+import math
+import os
+import re
+import shlex
+import subprocess
+import sys
+
+import hpldat
+
+
+RESULT = re.compile(r'^W\S+\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+([0-9.]+)\s+'
+                    r'([0-9.]+e[+-]\d+)$', re.MULTILINE)
+
+PASSED = re.compile(r'^\s+(\d+)\s+tests completed and passed residual checks,',
+                    re.MULTILINE)
+
+
+def memory():
+    '''Return ``(total, available)`` memory of the node in bytes.'''
+
+    info = {}
+    with open('/proc/meminfo') as fp:
+        for line in fp:
+            key, value = line.split(':', 1)
+            info[key] = int(value.split()[0]) * 1024
+
+    return info['MemTotal'], info.get('MemAvailable', info['MemTotal'])
+
+
+def cores():
+    '''Return the number of cores the job may run on, counting the hardware
+    threads of a core once.'''
+
+    found = set()
+    for cpu in os.sched_getaffinity(0):
+        topology = f'/sys/devices/system/cpu/cpu{cpu}/topology'
+        try:
+            with open(f'{topology}/physical_package_id') as fp:
+                package = fp.read().strip()
+
+            with open(f'{topology}/core_id') as fp:
+                core = fp.read().strip()
+        except OSError:
+            package, core = None, cpu
+
+        found.add((package, core))
+
+    return len(found)
+
+
+def problem_size(mem, fraction, nb):
+    '''Return the largest multiple of ``nb`` whose matrix fits in
+    ``fraction`` of ``mem`` bytes.'''
+
+    return int(math.sqrt(fraction * mem / 8) // nb) * nb
+
+
+def grids(ntasks, count):
+    '''Return the ``count`` most square ``P x Q = ntasks`` grids with
+    ``P <= Q``.'''
+
+    pairs = [(p, ntasks // p) for p in range(1, math.isqrt(ntasks) + 1)
+             if ntasks % p == 0]
+    return sorted(pairs, key=lambda pq: pq[1] - pq[0])[:count]
+
+
+def run_hpl(args, name, Ns, NBs, grids):
+    '''Run HPL over all cases; return the list of ``(gflops, N, NB, P, Q)``
+    of a run whose residual checks all passed.'''
+
+    dat = hpldat.HPLDat.read(args.template)
+    dat.update({'N': Ns, 'NB': NBs, 'P': [p for p, _ in grids],
+                'Q': [q for _, q in grids]})
+    dat.write('HPL.dat')
+    print(f'autotune: {name} pass, Ns={Ns} NBs={NBs} grids={grids}',
+          flush=True)
+    launcher = args.launcher.replace('{tasks}', str(args.tasks))
+    proc = subprocess.run(shlex.split(launcher) + [args.binary],
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          universal_newlines=True)
+    sys.stdout.write(proc.stdout)
+    passed = PASSED.search(proc.stdout)
+    ncases = dat.num_cases()
+    if not passed or int(passed.group(1)) != ncases:
+        sys.exit(f'autotune: the {name} pass did not pass the residual checks')
+
+    results = []
+    for m in RESULT.finditer(proc.stdout):
+        N, NB, P, Q = (int(v) for v in m.group(1, 2, 3, 4))
+        results.append((float(m.group(6)), N, NB, P, Q))
+        print(f'autotune: N={N} NB={NB} P={P} Q={Q} '
+              f'GFlops={float(m.group(6)):.1f}', flush=True)
+
+    return sorted(results, reverse=True)
+
+
+def suggest(args, N, NB, P, Q):
+    '''Return the suggested site data as the source of a table module.'''
+
+    part = args.partition
+    today = datetime.date.today().isoformat()
+    return (f'# Suggested HPL settings for {part}, autotuned on {today}\n'
+            f"SINGLE_NODE = {{{part!r}: {{'N': {N}, 'NB': {NB}, "
+            f"'P': {P}, 'Q': {Q}}}}}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Autotune HPL')
+    parser.add_argument('--binary', default='xhpl')
+    parser.add_argument('--launcher', default='',
+                        help='command launching the MPI ranks')
+    parser.add_argument('--template', default='HPL.dat.tmpl')
+    parser.add_argument('--partition', default='unknown')
+    parser.add_argument('--tasks', type=int, default=0,
+                        help='number of MPI ranks, by default one per core')
+    parser.add_argument('--nbs', type=lambda s: [int(b) for b in s.split(',')],
+                        default=[128, 192, 224, 256],
+                        help='block sizes of the coarse pass')
+    parser.add_argument('--grids', type=int, default=3,
+                        help='number of process grids of the coarse pass')
+    parser.add_argument('--coarse-fraction', type=float, default=0.05,
+                        help='fraction of the memory used by the coarse pass')
+    parser.add_argument('--fractions',
+                        type=lambda s: [float(f) for f in s.split(',')],
+                        default=[0.7, 0.8, 0.85],
+                        help='fractions of the memory used by the fine pass')
+    parser.add_argument('--top', type=int, default=2,
+                        help='number of block sizes of the fine pass')
+    parser.add_argument('-o', '--output', default='hpl_sitedata.py')
+    args = parser.parse_args()
+    if not args.tasks:
+        args.tasks = cores()
+
+    total, available = memory()
+    # Never ask for more than is free on the node
+    mem = min(total, 0.95 * available / max(args.fractions))
+    print(f'autotune: {total / 1024**3:.1f} GiB of memory, '
+          f'{available / 1024**3:.1f} GiB available, {args.tasks} ranks')
+
+    N = problem_size(mem, args.coarse_fraction, max(args.nbs))
+    coarse = run_hpl(args, 'coarse', [N], args.nbs,
+                     grids(args.tasks, args.grids))
+
+    _, _, _, P, Q = coarse[0]
+    NBs = []
+    for _, _, NB, p, q in coarse:
+        if (p, q) == (P, Q) and NB not in NBs:
+            NBs.append(NB)
+
+    NBs = NBs[:args.top]
+    Ns = sorted({problem_size(mem, f, NBs[0]) for f in args.fractions})
+    fine = run_hpl(args, 'fine', Ns, NBs, [(P, Q)])
+
+    gflops, N, NB, P, Q = fine[0]
+    print(f'Best: N={N} NB={NB} P={P} Q={Q} GFlops={gflops:.1f}')
+
+    sitedata = suggest(args, N, NB, P, Q)
+    with open(args.output, 'w') as fp:
+        fp.write(sitedata)
+
+    print('Suggested site data:')
+    sys.stdout.write(sitedata)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+#
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Write the HPL.dat of a GPU Linpack run.
+#
+# N is sized for a fraction of the memory of the GPUs of the node, which is
+# read with nvidia-smi or given with --gpu-memory, e.g. to prepare and check
+# the input on a machine without GPUs.  The written file is read back and
+# its cases printed.
+#
+
+import argparse
+import math
+import subprocess
+import sys
+
+import hpldat
+
+
+def gpu_memory():
+    '''Return the memory of the smallest GPU of the node in bytes.'''
+
+    out = subprocess.run(['nvidia-smi', '--query-gpu=memory.total',
+                          '--format=csv,noheader,nounits'],
+                         stdout=subprocess.PIPE, universal_newlines=True,
+                         check=True).stdout
+    return min(int(v) for v in out.split()) * 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a GPU HPL.dat')
+    parser.add_argument('--gpus', type=int, required=True,
+                        help='number of GPUs, one rank each')
+    parser.add_argument('-P', type=int, required=True)
+    parser.add_argument('-Q', type=int, required=True)
+    parser.add_argument('--nb', type=int, default=1024)
+    parser.add_argument('--fraction', type=float, default=0.8,
+                        help='fraction of the GPU memory used by the matrix')
+    parser.add_argument('--gpu-memory', type=float,
+                        help='memory per GPU in GiB (default: nvidia-smi)')
+    parser.add_argument('--template', default='HPL.dat.tmpl')
+    parser.add_argument('-o', '--output', default='HPL.dat')
+    args = parser.parse_args()
+
+    if args.P * args.Q != args.gpus:
+        sys.exit(f'hpl: a {args.P}x{args.Q} grid does not match '
+                 f'{args.gpus} GPUs')
+
+    if args.gpu_memory:
+        memory = args.gpu_memory * 1024**3
+    else:
+        memory = gpu_memory()
+
+    N = int(math.sqrt(args.fraction * memory * args.gpus / 8))
+    N = N // args.nb * args.nb
+    dat = hpldat.HPLDat.read(args.template)
+    dat.update({'N': N, 'NB': args.nb, 'P': args.P, 'Q': args.Q})
+    dat.write(args.output)
+
+    dat = hpldat.HPLDat.read(args.output)
+    print(f'HPL input: {memory / 1024**3:.1f} GiB per GPU, '
+          f'{dat.num_cases()} case(s)')
+    for variant, N, NB, P, Q in dat.cases():
+        print(f'HPL case: {variant} N={N} NB={NB} P={P} Q={Q}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Model of the HPL input file, HPL.dat.
+#
+# Every field of HPL.dat can be read, changed and written.  The list fields
+# (N, NB, the P x Q grids, PFACT, NBMIN, NDIV, RFACT, BCAST and DEPTH) hold
+# all the values to run, and one xhpl invocation runs every combination of
+# them.  The module is used by the HPL checks and by the scripts running on
+# the nodes, so it does not depend on ReFrame.
+#
+
+import itertools
+
+
+# Maximum number of values of a list field (HPL_MAX_PARAM)
+MAX_PARAM = 20
+
+# The fields after the two header lines, in file order, as (name, type,
+# label).  A list field has a count line followed by its values; the P and Q
+# lists share the count line of the grids.
+LAYOUT = [
+    ('output', str, 'output file name (if any)'),
+    ('device', int, 'device out (6=stdout,7=stderr,file)'),
+    ('N', list, ('# of problems sizes (N)', 'Ns')),
+    ('NB', list, ('# of NBs', 'NBs')),
+    ('PMAP', int, 'PMAP process mapping (0=Row-,1=Column-major)'),
+    ('PQ', list, ('# of process grids (P x Q)', 'Ps', 'Qs')),
+    ('threshold', float, 'threshold'),
+    ('PFACT', list, ('# of panel fact', 'PFACTs (0=left, 1=Crout, 2=Right)')),
+    ('NBMIN', list, ('# of recursive stopping criterium', 'NBMINs (>= 1)')),
+    ('NDIV', list, ('# of panels in recursion', 'NDIVs')),
+    ('RFACT', list, ('# of recursive panel fact.',
+                     'RFACTs (0=left, 1=Crout, 2=Right)')),
+    ('BCAST', list, ('# of broadcast',
+                     'BCASTs (0=1rg,1=1rM,2=2rg,3=2rM,4=Lng,5=LnM)')),
+    ('DEPTH', list, ('# of lookahead depth', 'DEPTHs (>=0)')),
+    ('SWAP', int, 'SWAP (0=bin-exch,1=long,2=mix)'),
+    ('swap_threshold', int, 'swapping threshold'),
+    ('L1', int, 'L1 in (0=transposed,1=no-transposed) form'),
+    ('U', int, 'U  in (0=transposed,1=no-transposed) form'),
+    ('equilibration', int, 'Equilibration (0=no,1=yes)'),
+    ('alignment', int, 'memory alignment in double (> 0)'),
+]
+
+HEADER = [
+    'HPLinpack benchmark input file',
+    'Innovative Computing Laboratory, University of Tennessee',
+]
+
+DEFAULTS = {
+    'output': 'HPL.out',
+    'device': 6,
+    'N': [1000],
+    'NB': [100],
+    'PMAP': 1,
+    'P': [1],
+    'Q': [1],
+    'threshold': 16.0,
+    'PFACT': [2],
+    'NBMIN': [2],
+    'NDIV': [2],
+    'RFACT': [1],
+    'BCAST': [0],
+    'DEPTH': [0],
+    'SWAP': 0,
+    'swap_threshold': 1,
+    'L1': 1,
+    'U': 1,
+    'equilibration': 0,
+    'alignment': 8,
+}
+
+# Fields that hold a list of values
+LIST_FIELDS = ['N', 'NB', 'P', 'Q', 'PFACT', 'NBMIN', 'NDIV', 'RFACT',
+               'BCAST', 'DEPTH']
+
+_FACT = 'LCR'
+
+
+class HPLDat:
+    '''The fields of an HPL.dat file.
+
+    The fields are accessed by the names of :data:`DEFAULTS`, e.g.
+    ``dat['NB']``; the list fields always hold lists.
+    '''
+
+    def __init__(self, header=None, **fields):
+        self.header = list(header or HEADER)
+        self.fields = {k: list(v) if k in LIST_FIELDS else v
+                       for k, v in DEFAULTS.items()}
+        self.update(fields)
+
+    def __getitem__(self, name):
+        return self.fields[name]
+
+    def __setitem__(self, name, value):
+        self.update({name: value})
+
+    def update(self, fields):
+        '''Set fields; a single value of a list field becomes a one element
+        list.'''
+
+        for name, value in fields.items():
+            if name not in DEFAULTS:
+                raise KeyError(f'unknown HPL.dat field: {name!r}')
+
+            if name in LIST_FIELDS:
+                value = list(value) if isinstance(value, (list, tuple)) \
+                    else [value]
+
+            self.fields[name] = value
+
+    @classmethod
+    def parse(cls, text):
+        '''Read the fields of the contents of an HPL.dat file.
+
+        Like HPL, only the number of values given by the count line of a
+        list field are read.
+        '''
+
+        lines = text.splitlines()
+        fields = {}
+        pos = 2
+        for name, kind, _ in LAYOUT:
+            if kind is not list:
+                fields[name] = kind(lines[pos].split()[0])
+                pos += 1
+                continue
+
+            count = int(lines[pos].split()[0])
+            pos += 1
+            for key in (['P', 'Q'] if name == 'PQ' else [name]):
+                values = [int(v) for v in lines[pos].split()[:count]]
+                if len(values) != count:
+                    raise ValueError(f'HPL.dat line {pos + 1}: expected '
+                                     f'{count} value(s) of {key}')
+
+                fields[key] = values
+                pos += 1
+
+        return cls(lines[:2], **fields)
+
+    @classmethod
+    def read(cls, filename):
+        with open(filename) as fp:
+            return cls.parse(fp.read())
+
+    def validate(self):
+        if len(self['P']) != len(self['Q']):
+            raise ValueError('Number of Ps != number of Qs')
+
+        for name in LIST_FIELDS:
+            if not 1 <= len(self[name]) <= MAX_PARAM:
+                raise ValueError(f'HPL.dat: {name} must have 1 to '
+                                 f'{MAX_PARAM} values')
+
+    def grids(self):
+        return list(zip(self['P'], self['Q']))
+
+    def num_cases(self):
+        '''Return the number of cases xhpl runs.'''
+
+        count = len(self.grids())
+        for name in ('N', 'NB', 'PFACT', 'NBMIN', 'NDIV', 'RFACT', 'BCAST',
+                     'DEPTH'):
+            count *= len(self[name])
+
+        return count
+
+    def variant(self, pfact, nbmin, ndiv, rfact, bcast, depth):
+        '''Return the T/V column of the HPL output of a case, e.g.
+        ``WC10R2R4``.'''
+
+        order = 'RC'[self['PMAP']]
+        return (f'W{order}{depth}{bcast}{_FACT[rfact]}{ndiv}'
+                f'{_FACT[pfact]}{nbmin}')
+
+    def cases(self):
+        '''Yield ``(variant, N, NB, P, Q)`` of each case; ``variant`` is the
+        T/V column of the case in the HPL output.'''
+
+        for (P, Q), N, NB, pfact, nbmin, ndiv, rfact, bcast, depth in \
+                itertools.product(self.grids(), self['N'], self['NB'],
+                                  self['PFACT'], self['NBMIN'], self['NDIV'],
+                                  self['RFACT'], self['BCAST'],
+                                  self['DEPTH']):
+            yield (self.variant(pfact, nbmin, ndiv, rfact, bcast, depth),
+                   N, NB, P, Q)
+
+    def format(self):
+        self.validate()
+        lines = list(self.header)
+        for name, kind, label in LAYOUT:
+            if kind is not list:
+                lines.append(f'{self[name]!s:<12} {label}')
+                continue
+
+            keys = ['P', 'Q'] if name == 'PQ' else [name]
+            lines.append(f'{len(self[keys[0]]):<12} {label[0]}')
+            for key, key_label in zip(keys, label[1:]):
+                values = ' '.join(str(v) for v in self[key])
+                lines.append(f'{values:<12} {key_label}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, filename):
+        with open(filename, 'w') as fp:
+            fp.write(self.format())
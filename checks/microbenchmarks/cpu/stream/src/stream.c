@@ -40,8 +40,13 @@
 /*     program constitutes acceptance of these licensing restrictions.   */
 /*  5. Absolutely no warranty is expressed or implied.                   */
 /*-----------------------------------------------------------------------*/
+# define _GNU_SOURCE
 # include <stdio.h>
 # include <stdlib.h>
+# include <string.h>
+# include <ctype.h>
+# include <dirent.h>
+# include <sched.h>
 # include <unistd.h>
 # include <getopt.h>
 # include <math.h>
@@ -211,7 +216,129 @@ extern void tuned_STREAM_Triad(STREAM_TYPE scalar);
 #endif
 #ifdef _OPENMP
 extern int omp_get_num_threads();
+extern int omp_get_thread_num();
+#else
+#define omp_get_thread_num() 0
 #endif
+
+/*	--- NUMA mode (-N) ---
+ *	Each thread first-touches and runs the kernels on its own contiguous
+ *	part of the arrays and times it, so that the bandwidth of each NUMA
+ *	node can be reported.  The threads should be bound (OMP_PROC_BIND).
+ *	With -r, each thread repeats the kernel on its part inside the timed
+ *	region, so that arrays fitting in the caches can be timed.
+ */
+static int	numa_mode = 0, nthreads = 1;
+static int	dump_times = 0, repeats = 1;
+static int	*thread_node;
+static double	*thread_times;
+
+static void
+thread_range(int t, ssize_t *lo, ssize_t *hi)
+    {
+    ssize_t chunk = STREAM_ARRAY_SIZE / nthreads;
+    ssize_t rem = STREAM_ARRAY_SIZE % nthreads;
+
+    *lo = t * chunk + (t < rem ? t : rem);
+    *hi = *lo + chunk + (t < rem ? 1 : 0);
+    }
+
+static int
+cpu_node(int cpu)
+    {
+    char path[64];
+    DIR *dir;
+    struct dirent *ent;
+    int node = 0;
+
+    snprintf(path, sizeof(path), "/sys/devices/system/cpu/cpu%d", cpu);
+    if ((dir = opendir(path)) == NULL)
+	return 0;
+    while ((ent = readdir(dir)) != NULL) {
+	if (strncmp(ent->d_name, "node", 4) == 0 && isdigit(ent->d_name[4])) {
+	    node = atoi(ent->d_name + 4);
+	    break;
+	}
+    }
+    closedir(dir);
+    return node;
+    }
+
+static void
+numa_kernel(int kernel, int k, STREAM_TYPE scalar)
+    {
+#pragma omp parallel
+    {
+	int t = omp_get_thread_num(), r;
+	ssize_t j, lo, hi;
+	double t0;
+
+	thread_range(t, &lo, &hi);
+	t0 = mysecond();
+	for (r = 0; r < repeats; r++)
+	switch (kernel) {
+	    case 0:
+		for (j=lo; j<hi; j++)
+		    c[j] = a[j];
+		break;
+	    case 1:
+		for (j=lo; j<hi; j++)
+		    b[j] = scalar*c[j];
+		break;
+	    case 2:
+		for (j=lo; j<hi; j++)
+		    c[j] = a[j]+b[j];
+		break;
+	    case 3:
+		for (j=lo; j<hi; j++)
+		    a[j] = b[j]+scalar*c[j];
+		break;
+	}
+	thread_times[(t*4 + kernel)*NTIMES + k] = mysecond() - t0;
+    }
+    }
+
+static void
+print_numa_results()
+    {
+    int t, j, k, node, maxnode = 0, count;
+    ssize_t lo, hi, elements;
+    double time, mintime;
+
+    for (t = 0; t < nthreads; t++)
+	maxnode = MAX(maxnode, thread_node[t]);
+
+    printf("Function    NUMA node  Threads  Best Rate MB/s\n");
+    for (j = 0; j < 4; j++) {
+	for (node = 0; node <= maxnode; node++) {
+	    count = 0;
+	    elements = 0;
+	    for (t = 0; t < nthreads; t++) {
+		if (thread_node[t] == node) {
+		    thread_range(t, &lo, &hi);
+		    elements += hi - lo;
+		    count++;
+		}
+	    }
+	    if (count == 0)
+		continue;
+
+	    /* A node is as fast as its slowest thread; skip first iteration */
+	    mintime = FLT_MAX;
+	    for (k = 1; k < NTIMES; k++) {
+		time = 0;
+		for (t = 0; t < nthreads; t++) {
+		    if (thread_node[t] == node)
+			time = MAX(time, thread_times[(t*4 + j)*NTIMES + k]);
+		}
+		mintime = MIN(mintime, time);
+	    }
+	    printf("%s%9d  %7d  %14.1f\n", label[j], node, count,
+		   1.0E-6 * bytes[j] / STREAM_ARRAY_SIZE * elements / mintime);
+	}
+    }
+    }
+
 int
 main(int argc, char **argv)
     {
@@ -224,7 +351,7 @@ main(int argc, char **argv)
     double		t, *times[4];
     int opt, ret, hugepages = 0;
 
-    while ((opt = getopt(argc, argv, "s:o:n:h")) != -1) {
+    while ((opt = getopt(argc, argv, "s:o:n:hNtr:")) != -1) {
 	switch (opt) {
 	    case 's':
 		STREAM_ARRAY_SIZE = (size_t)atol(optarg);
@@ -245,11 +372,29 @@ main(int argc, char **argv)
 		hugepages = 1;
 		alignement = 2*1024*1024; /* 2MB pages */
 		break;
+	    case 'N':
+		numa_mode = 1;
+		break;
+	    case 't':
+		dump_times = 1;
+		break;
+	    case 'r':
+		repeats = MAX(atoi(optarg), 1);
+		break;
 	    default:
-		fprintf(stderr, "Usage: %s [-s stream-array-size] [-o offset] [-n ntimes] [-h(ugepages)]\n", argv[0]);
+		fprintf(stderr, "Usage: %s [-s stream-array-size] [-o offset] [-n ntimes] [-h(ugepages)] [-N(UMA)] [-t(imings)] [-r repeats]\n", argv[0]);
 		exit(-1);
 	}
     }
+    if (repeats > 1) {
+	if (!numa_mode) {
+	    fprintf(stderr, "%s: -r requires NUMA mode (-N)\n", argv[0]);
+	    exit(-1);
+	}
+	for (k = 0; k < 4; k++) {
+	    bytes[k] *= repeats;
+	}
+    }
     for (k = 0; k < 4; k++) {
 	times[k] = malloc(NTIMES * sizeof(double));
     }
@@ -283,6 +428,9 @@ main(int argc, char **argv)
 	(3.0 * BytesPerWord) * ( (double) STREAM_ARRAY_SIZE / 1024.0/1024.),
 	(3.0 * BytesPerWord) * ( (double) STREAM_ARRAY_SIZE / 1024.0/1024./1024.));
     printf("Each kernel will be executed %d times.\n", NTIMES);
+    if (repeats > 1) {
+	printf("Each timed kernel repeats its loop %d times.\n", repeats);
+    }
     printf(" The *best* time for each kernel (excluding the first iteration)\n"); 
     printf(" will be used to compute the reported bandwidth.\n");
 
@@ -304,8 +452,22 @@ main(int argc, char **argv)
 #pragma omp atomic 
 		k++;
     printf ("Number of Threads counted = %i\n",k);
+    nthreads = k;
 #endif
 
+    if (numa_mode) {
+	char *bind = getenv("OMP_PROC_BIND");
+
+	thread_node = malloc(nthreads * sizeof(int));
+	thread_times = malloc(4 * nthreads * NTIMES * sizeof(double));
+#pragma omp parallel
+	thread_node[omp_get_thread_num()] = cpu_node(sched_getcpu());
+	printf("NUMA mode: threads first-touch and time their own part of the arrays\n");
+	if (bind == NULL || strcmp(bind, "false") == 0) {
+	    printf("WARNING -- OMP_PROC_BIND is not set, threads may migrate between NUMA nodes\n");
+	}
+    }
+
     if (OFFSET > 0) {
 	ret = posix_memalign((void **)&a, OFFSET, STREAM_ARRAY_SIZE * sizeof(double));
 	ret = posix_memalign((void **)&b, OFFSET, STREAM_ARRAY_SIZE * sizeof(double));
@@ -364,12 +526,26 @@ main(int argc, char **argv)
 	}
     }
     /* Get initial value for system clock. */
+    if (numa_mode) {
+#pragma omp parallel
+	{
+	    ssize_t lo, hi, i;
+
+	    thread_range(omp_get_thread_num(), &lo, &hi);
+	    for (i=lo; i<hi; i++) {
+		a[i] = 1.0;
+		b[i] = 2.0;
+		c[i] = 0.0;
+	    }
+	}
+    } else {
 #pragma omp parallel for
     for (j=0; j<STREAM_ARRAY_SIZE; j++) {
 	    a[j] = 1.0;
 	    b[j] = 2.0;
 	    c[j] = 0.0;
 	}
+    }
 
     printf(HLINE);
 
@@ -410,9 +586,13 @@ main(int argc, char **argv)
 #ifdef TUNED
         tuned_STREAM_Copy();
 #else
+	if (numa_mode)
+	    numa_kernel(0, k, scalar);
+	else {
 #pragma omp parallel for
-	for (j=0; j<STREAM_ARRAY_SIZE; j++)
-	    c[j] = a[j];
+		for (j=0; j<STREAM_ARRAY_SIZE; j++)
+		    c[j] = a[j];
+	}
 #endif
 	times[0][k] = mysecond() - times[0][k];
 	
@@ -420,9 +600,13 @@ main(int argc, char **argv)
 #ifdef TUNED
         tuned_STREAM_Scale(scalar);
 #else
+	if (numa_mode)
+	    numa_kernel(1, k, scalar);
+	else {
 #pragma omp parallel for
-	for (j=0; j<STREAM_ARRAY_SIZE; j++)
-	    b[j] = scalar*c[j];
+		for (j=0; j<STREAM_ARRAY_SIZE; j++)
+		    b[j] = scalar*c[j];
+	}
 #endif
 	times[1][k] = mysecond() - times[1][k];
 	
@@ -430,9 +614,13 @@ main(int argc, char **argv)
 #ifdef TUNED
         tuned_STREAM_Add();
 #else
+	if (numa_mode)
+	    numa_kernel(2, k, scalar);
+	else {
 #pragma omp parallel for
-	for (j=0; j<STREAM_ARRAY_SIZE; j++)
-	    c[j] = a[j]+b[j];
+		for (j=0; j<STREAM_ARRAY_SIZE; j++)
+		    c[j] = a[j]+b[j];
+	}
 #endif
 	times[2][k] = mysecond() - times[2][k];
 	
@@ -440,9 +628,13 @@ main(int argc, char **argv)
 #ifdef TUNED
         tuned_STREAM_Triad(scalar);
 #else
+	if (numa_mode)
+	    numa_kernel(3, k, scalar);
+	else {
 #pragma omp parallel for
-	for (j=0; j<STREAM_ARRAY_SIZE; j++)
-	    a[j] = b[j]+scalar*c[j];
+		for (j=0; j<STREAM_ARRAY_SIZE; j++)
+		    a[j] = b[j]+scalar*c[j];
+	}
 #endif
 	times[3][k] = mysecond() - times[3][k];
 	}
@@ -454,6 +646,14 @@ main(int argc, char **argv)
 	    1.0E-6 * bytes[j]/times[j][0], times[j][0]);
     }
     printf(HLINE);
+    if (dump_times) {
+	printf("Iteration    Copy time   Scale time     Add time   Triad time\n");
+	for (k=0; k<NTIMES; k++) {
+	    printf("Iteration %4d: %11.6f  %11.6f  %11.6f  %11.6f\n", k,
+		   times[0][k], times[1][k], times[2][k], times[3][k]);
+	}
+	printf(HLINE);
+    }
     /*	--- SUMMARY --- */
 
     for (k=1; k<NTIMES; k++) /* note -- skip first iteration */
@@ -478,6 +678,11 @@ main(int argc, char **argv)
     }
     printf(HLINE);
 
+    if (numa_mode) {
+	print_numa_results();
+	printf(HLINE);
+    }
+
     /* --- Check Results --- */
     checkSTREAMresults();
     printf(HLINE);
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+#
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Autotune the STREAM settings of a node.
+#
+# The OMP_NUM_THREADS, OMP_PROC_BIND and hugepage settings are first swept at
+# a known good array size.  With the best of them, the array size is then
+# increased geometrically until the Triad bandwidth is flat, and the smallest
+# array reaching the plateau bandwidth is selected.  The result is
+# printed and written as suggested entries of checks/common/tables/stream.py.
+#
+
+import argparse
+import datetime
+import glob
+import os
+import re
+import subprocess
+import sys
+
+
+TRIAD = re.compile(r'^Triad:\s+([0-9.]+)\s+[0-9.]+\s+[0-9.]+\s+[0-9.]+$',
+                   re.MULTILINE)
+
+# Bytes per Mi-element of the three arrays
+BYTES_PER_SIZE = 3 * 8 * 1024 * 1024
+
+
+def available_memory():
+    '''Return the available memory of the node in bytes.'''
+
+    with open('/proc/meminfo') as fp:
+        for line in fp:
+            if line.startswith('MemAvailable:'):
+                return int(line.split()[1]) * 1024
+
+    return None
+
+
+def last_level_cache():
+    '''Return the total size of the last level caches in bytes, or 0.'''
+
+    caches = {}
+    for cpu in glob.glob('/sys/devices/system/cpu/cpu[0-9]*'):
+        indices = glob.glob(os.path.join(cpu, 'cache', 'index[0-9]*'))
+        if not indices:
+            continue
+
+        index = max(indices, key=lambda d: _read(os.path.join(d, 'level'), 0))
+        size = _read(os.path.join(index, 'size'), '0K')
+        shared = _read(os.path.join(index, 'shared_cpu_list'), cpu)
+        caches[shared] = int(size[:-1]) * 1024 if size[-1] == 'K' else int(size)
+
+    return sum(caches.values())
+
+
+def _read(filename, default):
+    try:
+        with open(filename) as fp:
+            value = fp.read().strip()
+    except OSError:
+        return default
+
+    return type(default)(value) if not isinstance(default, str) else value
+
+
+def run_stream(args, size, threads, bind, hugepages):
+    '''Run STREAM once and return the Triad bandwidth, or None on failure.'''
+
+    env = dict(os.environ, OMP_NUM_THREADS=str(threads))
+    if bind == 'false':
+        env.pop('OMP_PLACES', None)
+        env['OMP_PROC_BIND'] = 'false'
+    else:
+        env['OMP_PLACES'] = 'threads'
+        env['OMP_PROC_BIND'] = bind
+
+    cmd = [args.binary, '-s', str(size * 1024 * 1024), '-n', str(args.ntimes)]
+    if hugepages:
+        cmd.append('-h')
+
+    proc = subprocess.run(cmd, env=env, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, universal_newlines=True)
+    match = TRIAD.search(proc.stdout)
+    valid = 'Solution Validates' in proc.stdout
+    triad = float(match.group(1)) if match and valid else None
+    print(f'autotune: size={size} threads={threads} bind={bind} '
+          f'hugepages={int(hugepages)} Triad={triad or 0:.1f}', flush=True)
+    if triad is None:
+        sys.stdout.write(proc.stdout)
+
+    return triad
+
+
+def sweep_settings(args, size):
+    '''Return the best (triad, threads, bind, hugepages) at ``size``.'''
+
+    best = None
+    for hugepages in args.hugepages:
+        for bind in args.bind:
+            for threads in args.threads:
+                triad = run_stream(args, size, threads, bind, hugepages)
+                if triad is not None and (best is None or triad > best[0]):
+                    best = (triad, threads, bind, hugepages)
+
+    return best
+
+
+def sweep_sizes(args, threads, bind, hugepages, min_size, max_size):
+    '''Increase the array size until the bandwidth reaches a plateau.
+
+    The bandwidth is flat once ``patience`` successive sizes changed it by
+    less than ``plateau``.  Returns the list of ``(size, triad)`` that were
+    run.
+    '''
+
+    results = []
+    flat = 0
+    size = min_size
+    while size <= max_size:
+        triad = run_stream(args, size, threads, bind, hugepages)
+        if triad is not None:
+            if results and abs(triad / results[-1][1] - 1) < args.plateau:
+                flat += 1
+            else:
+                flat = 0
+
+            results.append((size, triad))
+            if flat >= args.patience:
+                print(f'autotune: plateau reached at size={size}')
+                break
+
+        size = max(size + 1, int(size * args.growth))
+
+    return results
+
+
+def select_size(results, tolerance):
+    '''Return the smallest array size of the bandwidth plateau.
+
+    Arrays that fit in the caches run faster than the memory bandwidth, so
+    the plateau is taken at the largest sizes and the selected size is the
+    smallest one from which all larger arrays are within ``tolerance`` of
+    it.  Returns ``(size, triad, plateau)``.
+    '''
+
+    tail = sorted(t for _, t in results[-3:])
+    plateau = tail[len(tail) // 2]
+    for i, (size, triad) in enumerate(results):
+        if all(abs(t / plateau - 1) <= tolerance for _, t in results[i:]):
+            return size, triad, plateau
+
+
+def suggest(args, size, threads, bind, hugepages):
+    '''Return the suggested site data as the source of a table module.'''
+
+    part = args.partition
+    today = datetime.date.today().isoformat()
+    lines = [
+        f'# Suggested STREAM settings for {part}, autotuned on {today}',
+        f'ARRAY_SIZE = {{{part!r}: {size}}}',
+    ]
+    if threads < args.cpus:
+        lines.append(f'THREAD_REDUCTION = {{{part!r}: {args.cpus - threads}}}')
+
+    if bind == 'false':
+        lines.append(f'USE_OMP_BINDING = {{{part!r}: False}}')
+    elif bind != 'spread':
+        lines.append(f'PROC_BIND = {{{part!r}: {bind!r}}}')
+
+    if not hugepages:
+        lines.append(f'DISABLE_HUGEPAGES = {{{part!r}: True}}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Autotune STREAM')
+    parser.add_argument('--binary', required=True)
+    parser.add_argument('--partition', default='unknown')
+    parser.add_argument('--cpus', type=int, required=True,
+                        help='cores available to STREAM')
+    parser.add_argument('--threads', type=lambda s: [int(t) for t in s.split(',')],
+                        help='OMP_NUM_THREADS values (default: --cpus)')
+    parser.add_argument('--bind', type=lambda s: s.split(','),
+                        default=['spread', 'close', 'false'],
+                        help='OMP_PROC_BIND values')
+    parser.add_argument('--hugepages', type=lambda s: [bool(int(h)) for h in s.split(',')],
+                        default=[True, False],
+                        help='hugepage settings to try, e.g. 1,0')
+    parser.add_argument('--start-size', type=int, default=2500,
+                        help='array size in Mi-elements for the settings sweep')
+    parser.add_argument('--min-size', type=int, default=256,
+                        help='smallest array size in Mi-elements')
+    parser.add_argument('--growth', type=float, default=1.5,
+                        help='factor between successive array sizes')
+    parser.add_argument('--mem-fraction', type=float, default=0.8,
+                        help='fraction of the available memory to use at most')
+    parser.add_argument('--plateau', type=float, default=0.01,
+                        help='relative improvement below which the bandwidth is flat')
+    parser.add_argument('--patience', type=int, default=2,
+                        help='number of flat sizes before stopping')
+    parser.add_argument('--tolerance', type=float, default=0.02,
+                        help='select the smallest array within this of the plateau')
+    parser.add_argument('-n', '--ntimes', type=int, default=10)
+    parser.add_argument('-o', '--output', default='stream_sitedata.py')
+    args = parser.parse_args()
+    args.threads = args.threads or [args.cpus]
+
+    max_size = args.start_size
+    memory = available_memory()
+    if memory is not None:
+        max_size = int(memory * args.mem_fraction / BYTES_PER_SIZE)
+        args.start_size = min(args.start_size, max_size)
+
+    # Each array should be at least four times the size of the caches
+    min_size = max(args.min_size,
+                   -(-4 * last_level_cache() * 3 // BYTES_PER_SIZE))
+    min_size = min(min_size, max_size)
+    print(f'autotune: array sizes {min_size}-{max_size} Mi-elements')
+
+    best = sweep_settings(args, args.start_size)
+    if best is None:
+        sys.exit('autotune: no STREAM run validated')
+
+    _, threads, bind, hugepages = best
+    results = sweep_sizes(args, threads, bind, hugepages, min_size, max_size)
+    if not results:
+        sys.exit('autotune: no STREAM run validated')
+
+    size, triad, plateau = select_size(results, args.tolerance)
+    print(f'Best: size={size} threads={threads} bind={bind} '
+          f'hugepages={int(hugepages)} Triad={triad:.1f} '
+          f'Plateau={plateau:.1f}')
+
+    sitedata = suggest(args, size, threads, bind, hugepages)
+    with open(args.output, 'w') as fp:
+        fp.write(sitedata)
+
+    print('Suggested site data:')
+    sys.stdout.write(sitedata)
+
+
+if __name__ == '__main__':
+    main()
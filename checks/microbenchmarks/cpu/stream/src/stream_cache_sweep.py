@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+#
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Sweep the STREAM working set from the L1 cache to the memory.
+#
+# STREAM is run in NUMA mode, where each thread works on its own part of the
+# arrays, with the per-thread working set doubled from --min-kib until it is
+# well beyond the share of the last level cache of each thread.  The kernels
+# are repeated inside the timed region, so that every timing moves about
+# --target-bytes.  The bandwidth of each cache level is the best Triad rate
+# of the working sets fitting in half of its share, and the memory bandwidth
+# the median of the working sets beyond four times the last level cache.
+#
+
+import argparse
+import glob
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+
+TRIAD = re.compile(r'^Triad:\s+([0-9.]+)\s+[0-9.]+\s+[0-9.]+\s+[0-9.]+$',
+                   re.MULTILINE)
+
+# Bytes of the three arrays per element
+BYTES_PER_ELEMENT = 3 * 8
+
+
+def _read(filename):
+    with open(filename) as fp:
+        return fp.read().strip()
+
+
+def _parse_size(size):
+    units = {'K': 1024, 'M': 1024**2, 'G': 1024**3}
+    if size[-1] in units:
+        return int(size[:-1]) * units[size[-1]]
+
+    return int(size)
+
+
+def _count_cpus(cpulist):
+    count = 0
+    for part in cpulist.split(','):
+        lo, _, hi = part.partition('-')
+        count += int(hi or lo) - int(lo) + 1
+
+    return count
+
+
+def cache_levels(cpu=0):
+    '''Return ``[(level, bytes per cpu), ...]`` of the data caches.'''
+
+    levels = []
+    pattern = f'/sys/devices/system/cpu/cpu{cpu}/cache/index[0-9]*'
+    for index in sorted(glob.glob(pattern)):
+        try:
+            if _read(os.path.join(index, 'type')) == 'Instruction':
+                continue
+
+            level = int(_read(os.path.join(index, 'level')))
+            size = _parse_size(_read(os.path.join(index, 'size')))
+            shared = _count_cpus(_read(os.path.join(index,
+                                                    'shared_cpu_list')))
+        except (OSError, ValueError):
+            continue
+
+        levels.append((level, size // shared))
+
+    return sorted(levels)
+
+
+def run_stream(args, kib):
+    '''Run STREAM with a per-thread working set; return the Triad rate.'''
+
+    elements = kib * 1024 * args.threads // BYTES_PER_ELEMENT
+    repeats = max(1, args.target_bytes // (kib * 1024 * args.threads))
+    cmd = [args.binary, '-N', '-s', str(elements), '-r', str(repeats),
+           '-n', str(args.ntimes)]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, universal_newlines=True)
+    match = TRIAD.search(proc.stdout)
+    if not match or 'Solution Validates' not in proc.stdout:
+        sys.stdout.write(proc.stdout)
+        return None
+
+    triad = float(match.group(1))
+    print(f'sweep: {kib} KiB per thread, {repeats} repeats, '
+          f'Triad {triad:.1f} MB/s', flush=True)
+    return triad
+
+
+def main():
+    parser = argparse.ArgumentParser(description='STREAM cache sweep')
+    parser.add_argument('--binary', required=True)
+    parser.add_argument('--threads', type=int, required=True)
+    parser.add_argument('--min-kib', type=int, default=4,
+                        help='smallest working set per thread in KiB')
+    parser.add_argument('--max-size', type=int, default=2500,
+                        help='largest array size in Mi-elements')
+    parser.add_argument('--target-bytes', type=int, default=4 * 1024**3,
+                        help='bytes moved by each timed kernel')
+    parser.add_argument('-n', '--ntimes', type=int, default=5)
+    args = parser.parse_args()
+
+    levels = cache_levels()
+    for level, size in levels:
+        print(f'Cache L{level}: {size // 1024} KiB per cpu')
+
+    llc = levels[-1][1] if levels else 64 * 1024**2
+    max_kib = min(16 * llc // 1024,
+                  args.max_size * 1024**2 * BYTES_PER_ELEMENT //
+                  (1024 * args.threads))
+    results = []
+    kib = args.min_kib
+    while kib <= max_kib:
+        triad = run_stream(args, kib)
+        if triad is not None:
+            results.append((kib, triad))
+
+        kib *= 2
+
+    if not results:
+        sys.exit('sweep: no STREAM run validated')
+
+    lower = 0
+    for level, size in levels:
+        fitting = [t for k, t in results if lower < k * 1024 <= size // 2]
+        if fitting:
+            print(f'Level L{level}: {max(fitting):.1f} MB/s')
+
+        lower = size
+
+    dram = [t for k, t in results if k * 1024 >= 4 * llc]
+    if dram:
+        print(f'Level DRAM: {statistics.median(dram):.1f} MB/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import math
 import os
 
 import reframe as rfm
@@ -10,6 +11,25 @@ import reframe.utility.sanity as sn
 import reframe.utility.udeps as udeps
 
 from reframe.core.backends import getlauncher
+from reframe.core.exceptions import SanityError
+
+buildcache = rfm.utility.import_module('....common.buildcache')
+sitedata = rfm.utility.import_module('....common.sitedata')
+
+KERNELS = ('Copy', 'Scale', 'Add', 'Triad')
+
+
+@sn.deferrable
+def coefficient_of_variation(times):
+    '''Standard deviation over mean of the times, skipping the first one.'''
+
+    times = list(times)[1:]
+    if len(times) < 2:
+        return 0.0
+
+    mean = sum(times) / len(times)
+    var = sum((t - mean)**2 for t in times) / (len(times) - 1)
+    return math.sqrt(var) / mean
 
 
 class build_stream(rfm.CompileOnlyRegressionTest):
@@ -19,21 +39,88 @@ class build_stream(rfm.CompileOnlyRegressionTest):
     sourcepath = 'stream.c'
     build_system = 'SingleSource'
 
-    @run_before('compile')
-    def prepare_build(self):
-        static = '-static' if self.current_system.name != 'alvis' and self.current_system.name != 'vera' else ''
+    #: Reuse the binary of an earlier build with the same sources, compiler
+    #: flags, modules and partition from the shared build cache
+    use_build_cache = variable(bool, value=True)
+
+    def build_flags(self, system, envname):
+        static = '-static' if system != 'alvis' and system != 'vera' else ''
         self.prgenv_flags = {
             'foss': ['-fopenmp', '-O3', '-march=native', static],
             'intel': ['-qopenmp', '-O3', '-xHost', '-ip', '-ansi-alias', '-fno-alias', static, '-qopt-prefetch-distance=64,8', '-qopt-streaming-cache-evict=0', '-qopt-streaming-stores always'],
         }
 
-        envname = self.current_environ.name.split('_')[0]
-        self.build_system.cflags = self.prgenv_flags.get(envname, ['-O3'])
+        return self.prgenv_flags.get(envname.split('_')[0], ['-O3'])
+
+    @run_before('setup')
+    def lookup_build_cache(self):
+        # As a fixture, the test is pinned to a single partition and
+        # programming environment, so the key is known before the build job
+        # is created
+        self.cache_key = None
+        self.cached_binary = None
+        if (not self.use_build_cache or len(self.valid_systems) != 1 or
+                len(self.valid_prog_environs) != 1):
+            return
+
+        partition = self.valid_systems[0]
+        envname = self.valid_prog_environs[0]
+        environ = buildcache.find_environ(partition, envname)
+        if environ is None:
+            return
+
+        cflags = self.build_flags(partition.split(':')[0], envname)
+        source = os.path.join(self.prefix, self.sourcesdir, self.sourcepath)
+        self.cache_key = buildcache.build_key([source], partition, environ,
+                                              cflags, self.modules)
+        self.cached_binary = buildcache.lookup(self.cache_key, 'stream')
+        if self.cached_binary:
+            # Copying the cached binary needs no compute node
+            self.build_locally = True
+
+    @run_before('compile')
+    def prepare_build(self):
+        if self.cached_binary:
+            self.executable = os.path.join('.', self.unique_name)
+            self.build_system = 'CustomBuild'
+            self.build_system.commands = [
+                f'cp {self.cached_binary} {self.executable}'
+            ]
+            return
+
+        self.build_system.cflags = self.build_flags(self.current_system.name,
+                                                    self.current_environ.name)
 
     @sanity_function
     def validate_build(self):
         return sn.assert_not_found('error', self.stderr)
 
+    @run_after('sanity')
+    def store_build(self):
+        if (self.cache_key and not self.cached_binary and
+                not self.is_dry_run()):
+            buildcache.store(
+                self.cache_key,
+                os.path.join(self.stagedir, self.executable), 'stream',
+                partition=self.current_partition.fullname,
+                environ=self.current_environ.name,
+                cflags=self.build_system.cflags
+            )
+
+
+class build_stream_cached(build_stream):
+    '''STREAM built without streaming stores.
+
+    Non-temporal stores write around the caches, so with them the Triad of
+    a cache-sized working set measures the stores to the memory rather than
+    the cache level.
+    '''
+
+    def build_flags(self, system, envname):
+        return ['-qopt-streaming-stores never'
+                if flag == '-qopt-streaming-stores always' else flag
+                for flag in super().build_flags(system, envname)]
+
 
 class StreamTest2Base(rfm.RunOnlyRegressionTest):
     '''Base class of new Streams test'''
@@ -46,10 +133,18 @@ class StreamTest2Base(rfm.RunOnlyRegressionTest):
 
     stream_binary = fixture(build_stream, scope='environment')
 
+    #: Run STREAM in NUMA mode (``-N``) and report the bandwidth of each
+    #: NUMA node
+    numa_mode = variable(bool, value=False)
+
     @sanity_function
     def validate_solution(self):
         return sn.assert_found(r'Solution Validates: avg error less than', self.stdout)
 
+    @run_before('performance')
+    def set_calibrated_reference(self):
+        sitedata.apply_calibrated_reference(self)
+
 @rfm.simple_test
 class StreamTest2(StreamTest2Base):
     '''This test checks the stream test:
@@ -65,69 +160,6 @@ class StreamTest2(StreamTest2Base):
     valid_prog_environs = ['%s_%s' % (tc, tv) for tc in ['foss', 'intel']
         for tv in ['2021b', '2022a', '2023b']]
 
-    stream_cpus_per_task = {
-        'kebnekaise:local': 28,
-        'kebnekaise:bdw': 28,
-        'kebnekaise:sky': 28,
-        'kebnekaise:gpu': 28,
-        'kebnekaise:knl': 68,
-        'kebnekaise:lm': 72,
-        'kebnekaise:zen3': 128,
-        'kebnekaise:zen4': 256,
-        'kebnekaise:2xl40s': 48,
-        'kebnekaise:4xh100': 96,
-        'aigert:zen4': 256,
-        'UmU-Cloud:default': 64,
-        'vera:skylake': 32,
-        'vera:icelake': 64,
-        'alvis:8xT4': 32,
-        'alvis:2xV100': 16,
-        'alvis:4xV100': 32,
-        'alvis:4xA100_MEM256': 64,
-        'alvis:4xA100_MEM512': 64,
-        'alvis:4xA100fat': 64,
-        'alvis:4xA40': 64,
-    }
-    thread_reduction = {
-        # Due to the wekanode process we need to reduce number of OMP threads on A100 nodes
-        'alvis:4xA100_MEM256': 2,
-        'alvis:4xA100_MEM512': 2,
-        'alvis:4xA100fat': 2,
-    }
-    # Size of array in Mi-elements (*1024^2), total memory usage is size * 1024^2 * 8 * 3
-    stream_array = {
-        'kebnekaise:local': 4500,
-        'kebnekaise:bdw': 4500,
-        'kebnekaise:sky': 4500,
-        'kebnekaise:gpu': 4500,
-        'kebnekaise:knl': 6800,
-        'kebnekaise:lm': 24000, # 121000, for using the whole memory, but that takes forever.
-        'kebnekaise:zen3': 42000,
-        'kebnekaise:zen4': 26000,
-        'kebnekaise:2xl40s': 13000,
-        'kebnekaise:4xh100': 26000,
-        'aigert:zen4': 30000,
-        'UmU-Cloud:default': 21200,
-        'vera:skylake': 3600,
-        'vera:icelake': 20000,
-        'alvis:8xT4': 22900,
-        'alvis:2xV100': 30900,
-        'alvis:4xV100': 30900,
-        # Due to the wekanode process we need to reduce memory on A100 nodes
-        'alvis:4xA100_MEM256': 9800,
-        'alvis:4xA100_MEM512': 20000,
-        'alvis:4xA100fat': 41000,
-        'alvis:4xA40': 10400,
-    }
-    use_omp_binding = {
-        # Due to the wekanode process we can't use OMP binding on A100 nodes
-        'alvis:4xA100_MEM256': False,
-        'alvis:4xA100_MEM512': False,
-        'alvis:4xA100fat': False,
-    }
-    # Default is to use hugepages, this is for turning it off
-    disable_hugepages = {
-    }
     default_variables = {
         'OMP_PLACES': 'threads',
         'OMP_PROC_BIND': 'spread'
@@ -323,8 +355,8 @@ class StreamTest2(StreamTest2Base):
     def prepare_test(self):
         '''Setup test parameters and reference values'''
 
-        self.num_cpus_per_task = self.stream_cpus_per_task.get(
-            self.current_partition.fullname, 1)
+        self.num_cpus_per_task = sitedata.partition_value(
+            self, 'stream', 'CPUS_PER_TASK', 1)
         # This is for the knl threads-per-core resource
         self.extra_resources = {
             'threads': {'threads': 4},
@@ -334,10 +366,17 @@ class StreamTest2(StreamTest2Base):
         if self.current_partition.fullname == 'kebnekaise:knl':
             omp_threads *= 4
         
-        thread_reduction = self.thread_reduction.get(self.current_partition.fullname, 0)
-        use_omp_binding = self.use_omp_binding.get(self.current_partition.fullname, True)
+        thread_reduction = sitedata.partition_value(self, 'stream', 'THREAD_REDUCTION', 0)
+        use_omp_binding = sitedata.partition_value(self, 'stream', 'USE_OMP_BINDING', True)
         if use_omp_binding:
-            self.env_vars = self.default_variables
+            self.env_vars = dict(self.default_variables)
+            self.env_vars['OMP_PROC_BIND'] = sitedata.partition_value(
+                self, 'stream', 'PROC_BIND', self.env_vars['OMP_PROC_BIND'])
+        elif self.numa_mode:
+            # The bandwidth per NUMA node needs bound threads; the cores are
+            # those of the job's cpuset, which leaves out the cores of e.g.
+            # the wekanode process
+            self.env_vars = {'OMP_PLACES': 'cores', 'OMP_PROC_BIND': 'spread'}
         self.env_vars['OMP_NUM_THREADS'] = str(omp_threads-thread_reduction)
 
         envname = self.current_environ.name.split('_')[0]
@@ -357,15 +396,59 @@ class StreamTest2(StreamTest2Base):
         self.job.launcher = getlauncher('local')()
 
     @performance_function('MB/s')
-    def extract_bw(self, kind='Copy'):
-        '''Generic performance extraction function.'''
+    def extract_bw(self, kind='Copy', node=None):
+        '''Generic performance extraction function.
 
-        if kind not in ('Copy', 'Scale', 'Add', 'Triad'):
+        With ``node``, extract the bandwidth of that NUMA node.
+        '''
+
+        if kind not in KERNELS:
             raise ValueError(f'illegal value in argument kind ({kind!r})')
 
+        if node is not None:
+            return sn.extractsingle(rf'^{kind}:\s+{node}\s+\d+\s+([0-9.]+)$',
+                                    self.stdout, 1, float)
+
         return sn.extractsingle(rf'^{kind}:\s+([0-9.]+)\s+[0-9.]+\s+[0-9.]+\s+[0-9.]+$',
                                       self.stdout, 1, float)
 
+    def summary_value(self, kind, column):
+        '''Best rate or Avg, Min or Max time of a kernel in the summary.'''
+
+        idx = ('Best', 'Avg', 'Min', 'Max').index(column) + 1
+        return sn.extractsingle(rf'^{kind}:\s+([0-9.]+)\s+([0-9.]+)\s+([0-9.]+)\s+([0-9.]+)$',
+                                self.stdout, idx, float)
+
+    @performance_function('')
+    def avg_best_ratio(self, kind='Triad'):
+        '''Average over best time of a kernel.'''
+
+        return self.summary_value(kind, 'Avg') / self.summary_value(kind, 'Min')
+
+    @performance_function('')
+    def time_cv(self, kind='Triad'):
+        '''Coefficient of variation of the iteration times of a kernel.'''
+
+        times = sn.extractall(
+            r'^Iteration\s+\d+:\s+([0-9.]+)\s+([0-9.]+)\s+([0-9.]+)\s+([0-9.]+)$',
+            self.stdout, KERNELS.index(kind) + 1, float)
+        return coefficient_of_variation(times)
+
+    @performance_function('MB/s')
+    def slowest_bw(self, kind='Triad'):
+        '''Bandwidth of the slowest iteration of a kernel.'''
+
+        return (self.summary_value(kind, 'Best') * self.summary_value(kind, 'Min') /
+                self.summary_value(kind, 'Max'))
+
+    @performance_function('')
+    def numa_balance(self, kind='Triad'):
+        '''Bandwidth of the slowest NUMA node relative to the fastest.'''
+
+        bw = sn.extractall(rf'^{kind}:\s+\d+\s+\d+\s+([0-9.]+)$',
+                           self.stdout, 1, float)
+        return sn.min(bw) / sn.max(bw)
+
     @run_before('performance')
     def set_perf_variables(self):
         '''Build the dictionary with all the performance variables.'''
@@ -375,7 +458,26 @@ class StreamTest2(StreamTest2Base):
             'Scale': self.extract_bw('Scale'),
             'Add': self.extract_bw('Add'),
             'Triad': self.extract_bw('Triad'),
+            # Run to run variation, e.g. from noisy neighbours on shared nodes
+            'Triad_avg_best': self.avg_best_ratio('Triad'),
+            'Triad_cv': self.time_cv('Triad'),
+            'Triad_slowest': self.slowest_bw('Triad'),
         }
+        if self.numa_mode:
+            try:
+                nodes = sn.evaluate(sn.extractall(
+                    r'^Copy:\s+(\d+)\s+\d+\s+[0-9.]+$', self.stdout, 1, int))
+            except SanityError:
+                # No output, e.g. in a dry run
+                nodes = []
+
+            for node in nodes:
+                for kind in KERNELS:
+                    self.perf_variables[f'{kind}_node{node}'] = (
+                        self.extract_bw(kind, node)
+                    )
+
+            self.perf_variables['Triad_balance'] = self.numa_balance()
 
     @run_before('run')
     def set_executable(self):
@@ -383,12 +485,14 @@ class StreamTest2(StreamTest2Base):
             self.stream_binary.stagedir,
             self.stream_binary.executable
         )
-        mem_sz = self.stream_array.get(self.current_partition.fullname, 2500)*1024*1024
-        disable_hugepages = self.disable_hugepages.get(self.current_partition.fullname, False)
+        mem_sz = sitedata.partition_value(self, 'stream', 'ARRAY_SIZE', 2500)*1024*1024
+        disable_hugepages = sitedata.partition_value(self, 'stream', 'DISABLE_HUGEPAGES', False)
         hp='-h'
         if disable_hugepages:
             hp=''
-        self.executable_opts = [hp, "-s", "%s" % mem_sz]
+        self.executable_opts = [hp, "-s", "%s" % mem_sz, "-t"]
+        if self.numa_mode:
+            self.executable_opts.append('-N')
 
 
 @rfm.simple_test
@@ -398,3 +502,168 @@ class StreamTest2Maintenance(StreamTest2):
     valid_prog_environs = ['intel_2022a']
 
     tags = {'maintenance'}
+
+
+@rfm.simple_test
+class StreamTest2Numa(StreamTest2):
+    '''NUMA-aware version of StreamTest2
+
+    Each thread first-touches its own part of the arrays, so the bandwidth
+    of every NUMA node is measured separately and a slow socket or memory
+    channel shows up in its own performance variables and in the ratio of
+    the slowest to the fastest node.
+    '''
+
+    descr = 'STREAM Benchmark per NUMA node'
+    numa_mode = True
+    valid_prog_environs = ['intel_2022a']
+
+    tags = {'maintenance', 'reboot'}
+
+    @sanity_function
+    def validate_solution(self):
+        # The bandwidth of unbound threads is not that of their NUMA node
+        return sn.all([
+            sn.assert_found(r'Solution Validates: avg error less than',
+                            self.stdout),
+            sn.assert_not_found(r'threads may migrate between NUMA nodes',
+                                self.stdout),
+        ])
+
+    @run_after('setup')
+    def set_numa_reference(self):
+        # All NUMA nodes of a partition are expected to be equally fast
+        self.reference.update({'*': {
+            'Triad_balance': (1.0, -0.1, None, ''),
+        }})
+
+
+@rfm.simple_test
+class StreamCacheSweep(StreamTest2):
+    '''Bandwidth of each level of the memory hierarchy
+
+    Sweeps the working set per thread from the L1 cache to the memory on a
+    log scale and reports the Triad bandwidth of each cache level and of
+    the memory.  This catches changes of the cache and prefetcher settings
+    that the DRAM-sized StreamTest2 does not see, but only once the
+    references of the partition have been calibrated from its perflogs;
+    until then the check only reports the bandwidths.
+    '''
+
+    descr = 'STREAM cache hierarchy sweep'
+    sourcesdir = 'src'
+    valid_prog_environs = ['intel_2022a']
+
+    # The cache levels must be measured without streaming stores
+    stream_binary = fixture(build_stream_cached, scope='environment')
+
+    tags = {'maintenance'}
+
+    @run_after('setup')
+    def set_level_reference(self):
+        # Placeholders with a lower bound, so that ``perflog-store
+        # calibrate`` turns them into floors; until then no level can fail
+        self.reference = {
+            '*': {f'{level}_Triad': (0, -0.1, None, 'MB/s')
+                  for level in ('L1', 'L2', 'L3', 'DRAM')},
+        }
+
+    @run_before('run')
+    def set_executable(self):
+        self.executable = 'python3'
+        self.executable_opts = [
+            'stream_cache_sweep.py',
+            '--binary', os.path.join(self.stream_binary.stagedir,
+                                     self.stream_binary.executable),
+            '--threads', self.env_vars['OMP_NUM_THREADS'],
+            '--max-size', str(sitedata.partition_value(
+                self, 'stream', 'ARRAY_SIZE', 2500)),
+        ]
+
+    @sanity_function
+    def validate_solution(self):
+        return sn.assert_found(r'^Level \S+: [0-9.]+ MB/s', self.stdout)
+
+    @performance_function('MB/s')
+    def extract_level_bw(self, level='DRAM'):
+        return sn.extractsingle(rf'^Level {level}: ([0-9.]+) MB/s',
+                                self.stdout, 1, float)
+
+    @run_before('performance')
+    def set_perf_variables(self):
+        try:
+            levels = sn.evaluate(sn.extractall(r'^Level (\S+): [0-9.]+ MB/s',
+                                               self.stdout, 1))
+        except SanityError:
+            # No output, e.g. in a dry run
+            levels = []
+
+        self.perf_variables = {
+            f'{level}_Triad': self.extract_level_bw(level) for level in levels
+        }
+
+
+@rfm.simple_test
+class StreamAutotune(StreamTest2):
+    '''Autotune the STREAM settings of a partition.
+
+    Sweeps OMP_NUM_THREADS, OMP_PROC_BIND and the hugepages at the current
+    array size, then grows the array with the best settings until the
+    bandwidth is flat.  The smallest array reaching the plateau and the
+    best settings are written to stream_sitedata.py in the output directory,
+    as suggested entries of checks/common/tables/stream.py.
+    '''
+
+    descr = 'STREAM autotuning'
+    sourcesdir = 'src'
+    time_limit = '4h'
+    keep_files = ['stream_sitedata.py']
+
+    tags = {'autotune'}
+
+    @run_after('setup')
+    def unset_reference(self):
+        self.reference = {}
+
+    @run_before('run')
+    def set_executable(self):
+        cpus = self.num_cpus_per_task
+        if self.current_partition.fullname == 'kebnekaise:knl':
+            cpus *= 4
+
+        reduction = sitedata.partition_value(self, 'stream',
+                                             'THREAD_REDUCTION', 0)
+        threads = sorted({cpus, cpus - reduction, cpus - 2, cpus // 2},
+                         reverse=True)
+        self.executable = 'python3'
+        self.executable_opts = [
+            'stream_autotune.py',
+            '--binary', os.path.join(self.stream_binary.stagedir,
+                                     self.stream_binary.executable),
+            '--partition', self.current_partition.fullname,
+            '--cpus', str(cpus),
+            '--threads', ','.join(str(t) for t in threads if t > 0),
+            '--start-size', str(sitedata.partition_value(
+                self, 'stream', 'ARRAY_SIZE', 2500)),
+        ]
+
+    @sanity_function
+    def validate_solution(self):
+        return sn.assert_found(r'^Suggested site data:', self.stdout)
+
+    def extract_best(self, key, conv=int):
+        return sn.extractsingle(rf'^Best: .*\b{key}=([0-9.]+)', self.stdout,
+                                1, conv)
+
+    @run_before('performance')
+    def set_perf_variables(self):
+        self.perf_variables = {
+            'Triad': sn.make_performance_function(
+                self.extract_best('Triad', float), 'MB/s'),
+            'plateau_Triad': sn.make_performance_function(
+                self.extract_best('Plateau', float), 'MB/s'),
+            'array_size': sn.make_performance_function(
+                self.extract_best('size'), 'Mi-elements'),
+            'threads': sn.make_performance_function(
+                self.extract_best('threads'), 'threads'),
+        }
@@ -7,34 +7,33 @@
 # Hooks specific to the HPC2N GPU microbenchmark tests.
 #
 
+import os
+
+import reframe.utility as util
+
+gpus = util.import_module_from_file(
+    os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, 'common',
+                 'gpus.py')
+)
+
 
 def set_gpu_arch(self):
-    '''Set the compile options for the gpu microbenchmarks.'''
+    '''Set the compile options for the gpu microbenchmarks.
+
+    The build and architecture of the partitions with GPU devices in the
+    configuration come from the GPU registry.
+    '''
 
     cs = self.current_system.name
     cp = self.current_partition.fullname
-    cn = self.current_partition.name
+    gpu = gpus.gpu_info(self.current_partition)
     self.gpu_arch = None
 
     # Nvidia options
     self.gpu_build = 'cuda'
-    if cs in {'alvis', 'kebnekaise'}:
-        if 'K80' in cn:
-            self.gpu_arch = '37'
-        if 'V100' in cn:
-            self.gpu_arch = '70'
-        if 'T4' in cn:
-            self.gpu_arch = '75'
-        if 'A40' in cn:
-            self.gpu_arch = '86'
-        if 'A6000' in cn:
-            self.gpu_arch = '86'
-        if 'A100' in cn:
-            self.gpu_arch = '80'
-        if 'l40' in cn:
-            self.gpu_arch = '89'
-        if 'h100' in cn:
-            self.gpu_arch = '90'
+    if gpu is not None and gpu.arch is not None:
+        self.gpu_build = gpu.build
+        self.gpu_arch = gpus.compute_arch(gpu)
     elif cs in {'UmU-Cloud'}:
         self.gpu_arch = '80'
     elif cs in {'dom', 'daint'}:
@@ -64,21 +63,8 @@ def set_gpu_arch(self):
 def set_num_gpus_per_node(self):
     '''Set the GPUs per node for the GPU microbenchmarks.'''
 
-    cs = self.current_system.name
-    cp = self.current_partition.fullname
-    cn = self.current_partition.name
-
-    if cs in {'alvis', 'kebnekaise'}:
-        if cn in {'1xK80', '2xV100', '2xA6000', '2xV100', '2xA100', '2xMI100'}:
-            self.num_gpus_per_node = 2
-        elif cn in {'2xK80', '4xV100', '4xA100_MEM256', '4xA100_MEM512', '4xA100fat', '4xA40'}:
-            self.num_gpus_per_node = 4
-        elif cn in {'4xK80', '8xT4'}:
-            self.num_gpus_per_node = 8
-
-    if self.num_gpus_per_node is None:
-        gpu_devices = self.current_partition.select_devices('gpu')
-        if gpu_devices:
-            self.num_gpus_per_node = gpu_devices[0].num_devices
-        else:
-            self.num_gpus_per_node = 1
+    gpu = gpus.gpu_info(self.current_partition)
+    if gpu is not None:
+        self.num_gpus_per_node = gpu.count
+    elif self.num_gpus_per_node is None:
+        self.num_gpus_per_node = 1
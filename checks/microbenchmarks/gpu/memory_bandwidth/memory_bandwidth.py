@@ -108,6 +108,22 @@ class gpu_bandwidth_check(GpuBandwidth, SystemConfigHPC2N):
         },
     }
 
+    #: Fraction of the peak memory bandwidth of the GPU expected of the
+    #: device to device copies on partitions without a d2d reference
+    peak_bw_fraction = variable(float, value=0.7)
+
+    @run_after('setup')
+    def set_peak_reference(self):
+        gpu = hooks.gpus.gpu_info(self.current_partition)
+        partition = self.current_partition.fullname
+        if (gpu is None or gpu.peak_bw is None or
+            f'{partition}:d2d' in self.reference):
+            return
+
+        self.reference[f'{partition}:d2d'] = (
+            self.peak_bw_fraction * gpu.peak_bw, -0.1, None, 'GB/s'
+        )
+
 
 @rfm.simple_test
 class gpu_bandwidth_d2d_check(GpuBandwidthD2D, SystemConfigHPC2N):
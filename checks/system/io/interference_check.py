@@ -0,0 +1,211 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import getpass
+import os
+
+import reframe as rfm
+import reframe.utility.sanity as sn
+
+from reframe.core.backends import getlauncher
+from reframe.core.exceptions import SanityError
+
+sitedata = rfm.utility.import_module('...common.sitedata')
+iorout = rfm.utility.import_module('...common.parsers.ior')
+mdtestout = rfm.utility.import_module('...common.parsers.mdtest')
+
+
+@sn.deferrable
+def phase_rate(filename, phase, mdtest_phase):
+    '''Return the mean rate of ``mdtest_phase`` of the mdtest run of a
+    phase.'''
+
+    with open(filename) as fp:
+        outputs = mdtestout.sections(fp.read(),
+                                     r'^interference phase: (\S+)$')
+
+    summaries = mdtestout.parse(outputs.get(phase, ''))
+    if not summaries or mdtest_phase not in summaries[-1].rate:
+        raise SanityError(f'no {mdtest_phase} rate of the {phase} phase')
+
+    return summaries[-1].rate[mdtest_phase].mean
+
+
+@sn.deferrable
+def ior_bw(filename, operation):
+    '''Return the bandwidth of ``operation`` of an IOR JSON summary.'''
+
+    _, summaries = iorout.parse_file(filename)
+    summary = iorout.find_summary(summaries, operation)
+    if summary is None:
+        raise SanityError(f'no IOR {operation} summary in {filename}')
+
+    return summary.bw_max
+
+
+@rfm.simple_test
+class MDtestIorInterference(rfm.RunOnlyRegressionTest):
+    '''Metadata rates and streaming bandwidth of a file system under each
+    other's load
+
+    mdtest runs on the first node and IOR on the second.  Each runs once
+    alone and once while the other runs in a loop in the background, and
+    the ratio of the loaded to the unloaded rate shows how much the one
+    workload slows down the other.
+    '''
+
+    base_dir = parameter(['/pfs/stor10/io-test',
+                          '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test',
+                          '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test',
+                          '/scratch',
+                          ])
+    username = getpass.getuser()
+    num_nodes = 2
+    time_limit = '90m'
+    maintainers = ['ÅS']
+    tags = {'ops', 'interference'}
+
+    # mdtest phases reported alone and under load
+    phases = ['file_create', 'file_stat', 'file_read', 'file_removal']
+
+    @run_after('init')
+    def set_description(self):
+        self.descr = f'mdtest and IOR interference check ({self.base_dir})'
+
+    @run_after('init')
+    def add_fs_tags(self):
+        self.tags |= {self.base_dir}
+
+    @run_after('init')
+    def set_valid_systems(self):
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.valid_systems = settings['valid_systems']
+        self.valid_prog_environs = settings.get('valid_prog_environs',
+                                                ['builtin'])
+
+    @run_after('init')
+    def set_modules(self):
+        module = {
+            'kebnekaise': ['gompi/2023b', 'IOR/4.0.0'],
+            'alvis': ['IOR/3.3.0-gompi-2022a'],
+        }
+        self.modules = module.get(self.current_system.name, [])
+
+    @run_after('setup')
+    def skip_local_fs(self):
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.skip_if(not settings['shared'],
+                     f'{self.base_dir} is not shared between the nodes')
+
+    @run_before('run')
+    def set_tasks(self):
+        self.mdtest_tasks = sitedata.fs_settings(
+            self, 'mdtest', 'NODE').get('num_tasks_per_node', 1)
+        self.ior_tasks = sitedata.fs_settings(
+            self, 'ior', 'FS').get('num_tasks_per_node', 1)
+        self.num_tasks_per_node = max(self.mdtest_tasks, self.ior_tasks)
+        self.num_tasks = self.num_tasks_per_node * self.num_nodes
+
+    @run_before('run')
+    def prepare_run(self):
+        os.umask(2)
+        part = self.current_partition.name
+        mdtest_dir = os.path.join(self.base_dir, self.username, '.mdtest')
+        ior_dir = os.path.join(self.base_dir, self.username, '.ior')
+        self.prerun_cmds = [f'mkdir -p {mdtest_dir} {ior_dir}']
+
+        launch = self.job.launcher.run_command(self.job)
+        mdtest_settings = sitedata.fs_settings(self, 'mdtest', 'NODE')
+        ior_settings = sitedata.fs_settings(self, 'ior', 'FS')
+
+        def mdtest(name, iterations):
+            return ' '.join([
+                launch, '--nodes=1', f'--ntasks={self.mdtest_tasks}',
+                '--relative=0', 'mdtest', '-F', '-u', '-i', iterations,
+                '-n', mdtest_settings['interference_files_per_proc'],
+                '-a', mdtest_settings['io_api'],
+                '-d', os.path.join(mdtest_dir, f'.mdtest-{name}.{part}')
+            ])
+
+        def ior(name, iterations, summary_file=None):
+            opts = ['-w', '-r', '-e', '-F', '-i', iterations,
+                    '-t', ior_settings['ior_xfr_size'],
+                    '-b', ior_settings['interference_block_size'],
+                    '-D', str(ior_settings['interference_deadline']),
+                    '-a', ior_settings['ior_access_type'], '-A', '-1',
+                    '-o', os.path.join(ior_dir, f'.ior-{name}.{part}')]
+            if summary_file:
+                opts += ['-O', 'summaryFormat=JSON',
+                         '-O', f'summaryFile={summary_file}']
+
+            return ' '.join([launch, '--nodes=1', f'--ntasks={self.ior_tasks}',
+                             '--relative=1', 'ior'] + opts)
+
+        # The background load repeats until the measured run has finished
+        commands = [
+            'echo "interference phase: alone"',
+            mdtest('interference', '1'),
+            ior('interference', '1', 'ior-alone.json'),
+            'echo "interference phase: loaded"',
+            f"{ior('load', '1000')} > ior-load.out 2>&1 &",
+            'load=$!',
+            mdtest('interference', '1'),
+            'kill $load; wait $load',
+            f"{mdtest('load', '1000')} > mdtest-load.out 2>&1 &",
+            'load=$!',
+            ior('interference', '1', 'ior-loaded.json'),
+            'kill $load; wait $load',
+        ]
+        with open(os.path.join(self.stagedir, 'interference.sh'), 'w') as fp:
+            fp.write('\n'.join(commands) + '\n')
+
+        self.job.launcher = getlauncher('local')()
+        self.executable = 'bash'
+        self.executable_opts = ['interference.sh']
+
+        # The killed background runs leave their files behind
+        self.postrun_cmds = [
+            f'rm -rf {mdtest_dir}/.mdtest-load.{part}',
+            f'rm -f {ior_dir}/.ior-load.{part}.*',
+        ]
+
+    def summary_file(self, phase):
+        return os.path.join(self.stagedir, f'ior-{phase}.json')
+
+    @sanity_function
+    def assert_output(self):
+        return sn.all([
+            sn.assert_eq(
+                sn.count(sn.findall(r'^\s+File removal\s+:?\s', self.stdout)),
+                2),
+            sn.assert_gt(ior_bw(self.summary_file('alone'), 'write'), 0),
+            sn.assert_gt(ior_bw(self.summary_file('loaded'), 'write'), 0),
+        ])
+
+    @run_before('performance')
+    def set_perf_variables(self):
+        self.perf_variables = {}
+        for var in self.phases:
+            alone = phase_rate(self.stdout, 'alone', var)
+            loaded = phase_rate(self.stdout, 'loaded', var)
+            self.perf_variables.update({
+                f'{var}_alone': sn.make_performance_function(alone,
+                                                             'files/s'),
+                f'{var}_loaded': sn.make_performance_function(loaded,
+                                                              'files/s'),
+                f'{var}_ratio': sn.make_performance_function(loaded / alone,
+                                                             ''),
+            })
+
+        for op in ('write', 'read'):
+            alone = ior_bw(self.summary_file('alone'), op)
+            loaded = ior_bw(self.summary_file('loaded'), op)
+            self.perf_variables.update({
+                f'{op}_bw_alone': sn.make_performance_function(alone,
+                                                               'MiB/s'),
+                f'{op}_bw_loaded': sn.make_performance_function(loaded,
+                                                                'MiB/s'),
+                f'{op}_bw_ratio': sn.make_performance_function(loaded / alone,
+                                                               ''),
+            })
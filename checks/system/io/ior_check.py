@@ -9,6 +9,38 @@ import os
 import reframe as rfm
 import reframe.utility.sanity as sn
 
+from reframe.core.backends import getlauncher
+from reframe.core.exceptions import SanityError
+
+sitedata = rfm.utility.import_module('...common.sitedata')
+iorout = rfm.utility.import_module('...common.parsers.ior')
+
+
+@sn.deferrable
+def ior_summary(filename, operation, refnum=-1):
+    '''Return the IOR summary of ``operation`` of the test with reference
+    number ``refnum``.'''
+
+    _, summaries = iorout.parse_file(filename)
+    summary = iorout.find_summary(summaries, operation, refnum)
+    if summary is None:
+        raise SanityError(f'no IOR {operation} summary in {filename}')
+
+    return summary
+
+
+@sn.deferrable
+def ior_mean(filename, operation, field, refnum=-1):
+    '''Return the mean of ``field`` over the IOR iterations of
+    ``operation``.'''
+
+    results, _ = iorout.parse_file(filename)
+    value = iorout.mean(results, operation, field, refnum)
+    if value is None:
+        raise SanityError(f'no IOR {operation} results in {filename}')
+
+    return value
+
 
 class IorCheck(rfm.RunOnlyRegressionTest):
     base_dir = parameter(['/pfs/stor10/io-test',
@@ -17,6 +49,8 @@ class IorCheck(rfm.RunOnlyRegressionTest):
                           '/scratch',
                           ])
     username = getpass.getuser()
+    # The JSON summary of IOR, in the stage directory
+    summary_file = variable(str, value='ior-summary.json')
     time_limit = '60m'
     maintainers = ['SO', 'GLR', 'ÅS']
     tags = {'ops', 'production'}
@@ -29,182 +63,31 @@ class IorCheck(rfm.RunOnlyRegressionTest):
     def add_fs_tags(self):
         self.tags |= {self.base_dir}
 
-    @run_after('init')
-    def set_fs_information(self):
-        self.fs = {
-            '/pfs/stor10/io-test': {
-                'valid_systems': ['kebnekaise'],
-                'kebnekaise': {
-                    'num_tasks': 28,
-                    'num_tasks_per_node': 28,
-                },
-                'kebnekaise:zen3': {
-                    'num_tasks': 128,
-                    'num_tasks_per_node': 128,
-                },
-                'kebnekaise:zen4': {
-                    'num_tasks': 256,
-                    'num_tasks_per_node': 256,
-                },
-                'kebnekaise:8xa40': {
-                    'num_tasks': 64,
-                    'num_tasks_per_node': 64,
-                },
-                'kebnekaise:2xl40s': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'kebnekaise:6xl40s': {
-                    'num_tasks': 60,
-                    'num_tasks_per_node': 60,
-                },
-                'kebnekaise:4xh100': {
-                    'num_tasks': 96,
-                    'num_tasks_per_node': 96,
-                },
-                'ior_block_size': '480g',
-                'reference': {
-                    'write_bw': (5400, -0.1, None, 'MiB/s'),
-                    'read_bw': (5300, -0.1, None, 'MiB/s'),
-                },
-            },
-            '/scratch': {
-                'valid_systems': ['kebnekaise'],
-                'kebnekaise:zen4': {
-                    'num_tasks': 256,
-                    'num_tasks_per_node': 256,
-                },
-                'kebnekaise:2xl40s': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'kebnekaise:4xh100': {
-                    'num_tasks': 96,
-                    'num_tasks_per_node': 96,
-                },
-                'ior_block_size': '10g',
-            },
-            '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test': {
-                'valid_systems': ['alvis'],
-                'alvis:CPUonly': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                },
-                'alvis:2xV100': {
-                    'num_tasks': 16,
-                    'num_tasks_per_node': 16,
-                },
-                'alvis:4xV100': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                },
-                'alvis:4xA40': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'alvis:4xA100_MEM256': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'alvis:4xA100_MEM512': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'reference': {
-                    'write_bw': (3100, -0.1, None, 'MiB/s'),
-                    'read_bw': (2500, -0.1, None, 'MiB/s'),
-                },
-                'ior_block_size': '240g',
-            },
-            '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test': {
-                'valid_systems': ['alvis'],
-                'alvis:CPUonly': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                },
-                'alvis:2xV100': {
-                    'num_tasks': 16,
-                    'num_tasks_per_node': 16,
-                    'ior_access_type': 'POSIX',
-                },
-                'alvis:4xV100': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                    'ior_access_type': 'POSIX',
-                },
-                'alvis:4xA40': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                    'ior_access_type': 'POSIX',
-                },
-                'alvis:4xA100_MEM256': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'alvis:4xA100_MEM512': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'ior_block_size': '240g',
-                'reference': {
-                    'write_bw': (6700, -0.1, None, 'MiB/s'),
-                    'read_bw': (6100, -0.1, None, 'MiB/s'),
-                },
-            },
-        }
-
-        # Setting some default values
-        for data in self.fs.values():
-            data.setdefault('ior_block_size', '24g')
-            data.setdefault('ior_xfr_size', '4m')
-            data.setdefault('ior_access_type', 'MPIIO')
-            data.setdefault(
-                'reference',
-                {
-                    'read_bw': (0, None, None, 'MiB/s'),
-                    'write_bw': (0, None, None, 'MiB/s')
-                }
-            )
-            data.setdefault('dummy', {})  # entry for unknown systems
-
     @run_after('init')
     def set_performance_reference(self):
         # Converting the references from each fs to per system.
         self.reference = {
-            '*': self.fs[self.base_dir]['reference']
+            '*': sitedata.fs_settings(self, 'ior', 'FS')['reference']
         }
 
+    @run_before('performance')
+    def set_calibrated_reference(self):
+        sitedata.apply_calibrated_reference(self)
+
     @run_after('init')
     def set_valid_systems(self):
-        self.valid_systems = self.fs[self.base_dir]['valid_systems']
-
-        cur_sys = self.current_system.name
-        if cur_sys not in self.fs[self.base_dir]:
-            cur_sys = 'dummy'
-
-        vpe = 'valid_prog_environs'
-        penv = self.fs[self.base_dir][cur_sys].get(vpe, ['builtin'])
-        self.valid_prog_environs = penv
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.valid_systems = settings['valid_systems']
+        self.valid_prog_environs = settings.get('valid_prog_environs',
+                                                ['builtin'])
 
 
     @run_before('run')
     def set_tasks(self):
-        cur_sys = self.current_system.name
-        fullname = self.current_partition.fullname
-        if cur_sys not in self.fs[self.base_dir]:
-            cur_sys = 'dummy'
-        if fullname not in self.fs[self.base_dir]:
-            fullname = cur_sys
-
-        tpn = self.fs[self.base_dir][cur_sys].get('num_tasks_per_node', 1)
-        tpn = self.fs[self.base_dir][fullname].get('num_tasks_per_node', tpn)
-        cpt = self.fs[self.base_dir][cur_sys].get('cpus_per_task', 1)
-        cpt = self.fs[self.base_dir][fullname].get('cpus_per_task', cpt)
-        nt = self.fs[self.base_dir][cur_sys].get('num_tasks', 1)
-        nt = self.fs[self.base_dir][fullname].get('num_tasks', nt)
-        self.num_tasks = nt
-        self.num_tasks_per_node = tpn
-        self.num_cpus_per_task = cpt
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.num_tasks = settings.get('num_tasks', 1)
+        self.num_tasks_per_node = settings.get('num_tasks_per_node', 1)
+        self.num_cpus_per_task = settings.get('cpus_per_task', 1)
 
     @run_after('init')
     def set_modules(self):
@@ -216,13 +99,6 @@ class IorCheck(rfm.RunOnlyRegressionTest):
 
     @run_before('run')
     def prepare_run(self):
-        cur_sys = self.current_system.name
-        fullname = self.current_partition.fullname
-        if cur_sys not in self.fs[self.base_dir]:
-            cur_sys = 'dummy'
-        if fullname not in self.fs[self.base_dir]:
-            fullname = cur_sys
-
         # Default umask is 0022, which generates file permissions -rw-r--r--
         # we want -rw-rw-r-- so we set umask to 0002
         os.umask(2)
@@ -233,40 +109,62 @@ class IorCheck(rfm.RunOnlyRegressionTest):
         self.executable = 'ior'
 
         # executable options depends on the file system
-        block_size = self.fs[self.base_dir]['ior_block_size']
-        block_size = self.fs[self.base_dir][cur_sys].get('ior_block_size', block_size)
-        block_size = self.fs[self.base_dir][fullname].get('ior_block_size', block_size)
-
-        xfr_size = self.fs[self.base_dir]['ior_xfr_size']
-        xfr_size = self.fs[self.base_dir][cur_sys].get('ior_xfr_size', xfr_size)
-        xfr_size = self.fs[self.base_dir][fullname].get('ior_xfr_size', xfr_size)
-
-        access_type = self.fs[self.base_dir]['ior_access_type']
-        access_type = self.fs[self.base_dir][cur_sys].get('ior_access_type', access_type)
-        access_type = self.fs[self.base_dir][fullname].get('ior_access_type', access_type)
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        block_size = settings['ior_block_size']
+        xfr_size = settings['ior_xfr_size']
+        access_type = settings['ior_access_type']
 
         self.executable_opts += ['-F', '-C ', '-Q', str(self.num_tasks_per_node), '-t', xfr_size , '-D 1200',
                                 '-b', block_size, '-a', access_type,
                                 '-A -1',  # Refnumber used for matching the correct output lines
+                                '-O', 'summaryFormat=JSON',
+                                '-O', f'summaryFile={self.summary_file}',
                                 '-o', test_file]
 
+    def operations(self):
+        '''Return the IOR operations of the run.'''
 
-@rfm.simple_test
-class IorWriteCheck(IorCheck):
-    executable_opts = ['-w', '-k']
-    tags |= {'write'}
+        return [op for flag, op in (('-w', 'write'), ('-r', 'read'))
+                if flag in self.executable_opts]
 
     @sanity_function
     def assert_output(self):
-        return sn.assert_found(r'^Max Write: ', self.stdout)
+        summary_file = os.path.join(self.stagedir, self.summary_file)
+        return sn.all([
+            sn.assert_eq(sn.getattr(ior_summary(summary_file, op),
+                                    'operation'), op)
+            for op in self.operations()
+        ])
+
+    @run_before('performance')
+    def set_perf_variables(self):
+        # Besides the bandwidth, the IOPS, latency and open/close times show
+        # a regression of the metadata servers, and the variation of the
+        # bandwidth over the iterations an unstable file system
+        summary_file = os.path.join(self.stagedir, self.summary_file)
+        self.perf_variables = {}
+        for op in self.operations():
+            summary = ior_summary(summary_file, op)
+            self.perf_variables.update({
+                f'{op}_bw': sn.make_performance_function(
+                    sn.getattr(summary, 'bw_max'), 'MiB/s'),
+                f'{op}_bw_cv': sn.make_performance_function(
+                    sn.deferrable(iorout.variation)(summary), ''),
+                f'{op}_iops': sn.make_performance_function(
+                    sn.getattr(summary, 'ops_mean'), 'IOPS'),
+                f'{op}_latency': sn.make_performance_function(
+                    ior_mean(summary_file, op, 'latency'), 's'),
+                f'{op}_open_time': sn.make_performance_function(
+                    ior_mean(summary_file, op, 'open'), 's'),
+                f'{op}_close_time': sn.make_performance_function(
+                    ior_mean(summary_file, op, 'close'), 's'),
+            })
 
-    @run_after('init')
-    def set_perf_patterns(self):
-        self.perf_patterns = {
-            'write_bw': sn.extractsingle(
-                r'^write\s+(?P<write_bw>\S+)\s+.*\s+-1$', self.stdout,
-                'write_bw', float)
-        }
+
+@rfm.simple_test
+class IorWriteCheck(IorCheck):
+    executable_opts = ['-w', '-k']
+    tags |= {'write'}
 
 
 @rfm.simple_test
@@ -274,41 +172,297 @@ class IorReadCheck(IorCheck):
     executable_opts = ['-r']
     tags |= {'read'}
 
-    @sanity_function
-    def assert_output(self):
-        return sn.assert_found(r'^Max Read: ', self.stdout)
-
-    @run_after('init')
-    def set_perf_patterns(self):
-        self.perf_patterns = {
-            'read_bw': sn.extractsingle(
-                r'^read\s+(?P<read_bw>\S+)\s+.*\s+-1$', self.stdout,
-                'read_bw', float)
-        }
-
     @run_after('init')
     def set_deps(self):
         variant = IorWriteCheck.get_variant_nums(base_dir=self.base_dir)[0]
         self.depends_on(IorWriteCheck.variant_name(variant))
 
 
+@rfm.simple_test
+class IorCacheBypassReadCheck(IorCheck):
+    '''IOR read bandwidth with the caches of the client defeated
+
+    The file is written with ``-k`` and read back by a second IOR run, with
+    one of the strategies keeping the reads out of the page cache:
+
+    * ``reorder``: every task reads the file of a task on the other node
+      (``-C``),
+    * ``random``: the tasks read the files of randomly chosen tasks
+      (``-Z``).  IOR may pick a task on the same node, so on two nodes about
+      half of the reads can still come from the page cache of the writer;
+      this only partly defeats the cache and relies on the ``max_node_bw``
+      bound below,
+    * ``odirect``: the reads bypass the page cache (POSIX ``O_DIRECT``),
+    * ``drop_caches``: the page cache is dropped between the write and the
+      read, on the file systems with a ``drop_caches_cmd``.
+
+    A read bandwidth above ``max_node_bw`` per node cannot come from the
+    storage and fails the sanity check.
+    '''
+
+    strategy = parameter(['reorder', 'random', 'odirect', 'drop_caches'],
+                         loggable=True)
+    executable_opts = ['-r']
+    tags = {'ops', 'read', 'cache'}
+
+    @run_after('init')
+    def set_description(self):
+        self.descr = f'IOR {self.strategy} read check ({self.base_dir})'
+
+    @run_after('init')
+    def set_num_nodes(self):
+        # The reordering strategies read from the other node; -Z only for
+        # part of the tasks
+        self.num_nodes = 2 if self.strategy in ('reorder', 'random') else 1
+
+    @run_after('setup')
+    def skip_unsupported(self):
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.skip_if(self.num_nodes > 1 and not settings['shared'],
+                     f'{self.base_dir} is not shared between the nodes')
+        self.skip_if(self.strategy == 'drop_caches' and
+                     not settings['drop_caches_cmd'],
+                     f'the page cache cannot be dropped on {self.base_dir}')
+
+    @run_before('run')
+    def set_tasks(self):
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.num_tasks_per_node = settings.get('num_tasks_per_node', 1)
+        self.num_tasks = self.num_tasks_per_node * self.num_nodes
+        self.num_cpus_per_task = settings.get('cpus_per_task', 1)
+
+    @run_before('run')
+    def prepare_run(self):
+        os.umask(2)
+        test_dir = os.path.join(self.base_dir, self.username, '.ior')
+        test_file = os.path.join(
+            test_dir,
+            f'.ior-{self.strategy}.{self.current_partition.name}'
+        )
+
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        api = settings['ior_access_type']
+        if self.strategy == 'odirect':
+            api = 'POSIX'
+
+        opts = ['-F', '-Q', str(self.num_tasks_per_node),
+                '-t', settings['ior_xfr_size'],
+                '-b', settings['ior_block_size'], '-D', '1200', '-a', api,
+                '-A', '-1', '-o', test_file]
+        launch = self.job.launcher.run_command(self.job)
+        self.prerun_cmds = [
+            f'mkdir -p {test_dir}',
+            ' '.join([launch, 'ior', '-w', '-k', '-e'] + opts),
+        ]
+        if self.strategy == 'drop_caches':
+            self.prerun_cmds += ['sync', settings['drop_caches_cmd']]
+
+        self.executable = 'ior'
+        self.executable_opts = ['-r'] + opts + [
+            '-O', 'summaryFormat=JSON',
+            '-O', f'summaryFile={self.summary_file}'
+        ]
+        self.executable_opts += {
+            'reorder': ['-C'],
+            'random': ['-Z'],
+            'odirect': ['--posix.odirect'],
+            'drop_caches': [],
+        }[self.strategy]
+
+    @sanity_function
+    def assert_output(self):
+        summary_file = os.path.join(self.stagedir, self.summary_file)
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        max_bw = settings['max_node_bw'] * self.num_nodes
+        return sn.assert_le(
+            sn.getattr(ior_summary(summary_file, 'read'), 'bw_max'), max_bw,
+            msg='read bandwidth of {0} MiB/s is above the {1} MiB/s of the '
+                'nodes, the reads were cached'
+        )
+
+
 @rfm.simple_test
 class IorWriteReadCheck(IorCheck):
     executable_opts = ['-w', '-r']
     tags = {'ops', 'maintenance'}
     tags |= {'write', 'read'}
 
-    @sanity_function
-    def assert_output(self):
-        return sn.assert_found(r'^write\s+.*\s+-1$', self.stdout) and sn.assert_found(r'^read\s+.*\s+-1$', self.stdout)
+
+@rfm.simple_test
+class IorScalingCheck(IorCheck):
+    '''IOR bandwidth of a file system over the number of nodes
+
+    Every task writes and reads back ``scaling_block_size``, so the data per
+    task is the same on any number of nodes.  The node counts of a file
+    system run one after the other, each depending on the previous one, and
+    the efficiency is the bandwidth per node relative to the single node
+    run.  A flat aggregate bandwidth shows the ceiling of the servers or the
+    network path to them.
+    '''
+
+    num_nodes = parameter([1, 2, 4, 8, 16], loggable=True)
+    tags = {'ops', 'scaling'}
 
     @run_after('init')
-    def set_perf_patterns(self):
-        self.perf_patterns = {
-            'write_bw': sn.extractsingle(
-                r'^write\s+(?P<write_bw>\S+)\s+.*\s+-1$', self.stdout,
-                'write_bw', float),
-            'read_bw': sn.extractsingle(
-                r'^read\s+(?P<read_bw>\S+)\s+.*\s+-1$', self.stdout,
-                'read_bw', float)
-        }
+    def set_performance_reference(self):
+        # The references of the file system are for single node runs
+        self.reference = {}
+
+    @run_after('init')
+    def skip_local_fs(self):
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.skip_if(self.num_nodes > 1 and not settings['shared'],
+                     f'{self.base_dir} is not shared between the nodes')
+
+    @run_after('init')
+    def set_dependencies(self):
+        if self.num_nodes == 1:
+            return
+
+        # Run the node counts one at a time, so they do not compete
+        previous = self.num_nodes // 2
+        self.depends_on(self.variant_name_for(previous))
+        if previous != 1:
+            self.depends_on(self.variant_name_for(1))
+
+    def variant_name_for(self, num_nodes):
+        variant = IorScalingCheck.get_variant_nums(base_dir=self.base_dir,
+                                                   num_nodes=num_nodes)[0]
+        return IorScalingCheck.variant_name(variant)
+
+    @run_before('run')
+    def set_tasks(self):
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.num_tasks_per_node = settings.get('num_tasks_per_node', 1)
+        self.num_tasks = self.num_tasks_per_node * self.num_nodes
+        self.num_cpus_per_task = settings.get('cpus_per_task', 1)
+
+    @run_before('run')
+    def prepare_run(self):
+        os.umask(2)
+        test_dir = os.path.join(self.base_dir, self.username, '.ior')
+        test_file = os.path.join(
+            test_dir, f'.ior-scaling.{self.current_partition.name}'
+        )
+        self.prerun_cmds = [f'mkdir -p {test_dir}']
+        self.executable = 'ior'
+
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.executable_opts = [
+            '-w', '-r', '-e', '-F', '-C', '-Q', str(self.num_tasks_per_node),
+            '-t', settings['ior_xfr_size'],
+            '-b', settings['scaling_block_size'],
+            '-D', str(settings['scaling_deadline']),
+            '-a', settings['ior_access_type'], '-A -1',
+            '-O', 'summaryFormat=JSON', '-O', f'summaryFile={self.summary_file}',
+            '-o', test_file
+        ]
+
+    @run_before('performance')
+    def set_scaling_perf_variables(self):
+        summary_file = os.path.join(self.stagedir, self.summary_file)
+        for op in self.operations():
+            bw = sn.getattr(ior_summary(summary_file, op), 'bw_max')
+            self.perf_variables[f'{op}_bw_per_node'] = (
+                sn.make_performance_function(bw / self.num_nodes, 'MiB/s')
+            )
+            if self.num_nodes == 1:
+                self.perf_variables[f'{op}_efficiency'] = (
+                    sn.make_performance_function(sn.defer(1.0), '')
+                )
+                continue
+
+            key = f'{self.current_partition.fullname}:{op}_bw'
+            single = self.getdep(self.variant_name_for(1)).perfvalues.get(key)
+            if single:
+                self.perf_variables[f'{op}_efficiency'] = (
+                    sn.make_performance_function(
+                        bw / (self.num_nodes * single[0]), '')
+                )
+
+
+@rfm.simple_test
+class IorSweepCheck(IorCheck):
+    '''IOR bandwidth over transfer sizes, APIs, file layouts and O_DIRECT
+
+    The cases of a file system run one after the other in one job, so that
+    they do not compete for the file system.  Each case writes and reads
+    back ``sweep_block_size`` per task, cut short by the stonewalling
+    deadline, and is identified by its IOR reference number.
+    '''
+
+    time_limit = '2h'
+    tags = {'ops', 'sweep'}
+
+    @run_after('init')
+    def set_performance_reference(self):
+        # The references of the file system are for the full size runs
+        self.reference = {}
+
+    @run_after('init')
+    def set_cases(self):
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        self.cases = []
+        for api in settings['sweep_apis']:
+            for fpp in (True, False):
+                for direct in ((False, True) if api == 'POSIX' else (False,)):
+                    for xfer in settings['sweep_xfer_sizes']:
+                        self.cases.append((api, fpp, direct, xfer))
+
+    @staticmethod
+    def case_name(api, fpp, direct, xfer):
+        layout = 'fpp' if fpp else 'shared'
+        return f"{api}_{layout}{'_direct' if direct else ''}_{xfer}"
+
+    @run_before('run')
+    def prepare_run(self):
+        os.umask(2)
+        test_dir = os.path.join(self.base_dir, self.username, '.ior')
+        test_file = os.path.join(test_dir,
+                                 f'.ior-sweep.{self.current_partition.name}')
+        self.prerun_cmds = [f'mkdir -p {test_dir}']
+
+        settings = sitedata.fs_settings(self, 'ior', 'FS')
+        launch = self.job.launcher.run_command(self.job)
+        commands = []
+        for refnum, (api, fpp, direct, xfer) in enumerate(self.cases, 1):
+            opts = ['-w', '-r', '-e', '-C', '-Q', str(self.num_tasks_per_node),
+                    '-t', xfer, '-b', settings['sweep_block_size'],
+                    '-D', str(settings['sweep_deadline']), '-a', api,
+                    '-A', str(refnum), '-o', test_file]
+            if fpp:
+                opts.append('-F')
+
+            if direct:
+                opts.append('--posix.odirect')
+
+            name = self.case_name(api, fpp, direct, xfer)
+            commands.append(f"echo 'IOR case {refnum}: {name}'")
+            commands.append(' '.join([launch, 'ior'] + opts))
+
+        # The cases are launched one by one from a script
+        with open(os.path.join(self.stagedir, 'ior_sweep.sh'), 'w') as fp:
+            fp.write('\n'.join(commands) + '\n')
+
+        self.job.launcher = getlauncher('local')()
+        self.executable = 'bash'
+        self.executable_opts = ['ior_sweep.sh']
+
+    @sanity_function
+    def assert_output(self):
+        return sn.assert_eq(
+            sn.count(sn.findall(r'^Summary of all tests:', self.stdout)),
+            len(self.cases)
+        )
+
+    @run_before('performance')
+    def set_perf_variables(self):
+        self.perf_variables = {}
+        for refnum, case in enumerate(self.cases, 1):
+            name = self.case_name(*case)
+            for op in ('write', 'read'):
+                self.perf_variables[f'{op}_bw_{name}'] = (
+                    sn.make_performance_function(sn.extractsingle(
+                        rf'^{op}\s+(\S+)\s+.*\s+{refnum}$', self.stdout, 1,
+                        float), 'MiB/s')
+                )
@@ -0,0 +1,101 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import getpass
+import os
+
+import reframe as rfm
+import reframe.utility.sanity as sn
+
+sitedata = rfm.utility.import_module('...common.sitedata')
+
+
+@rfm.simple_test
+class LocalStorageCheck(rfm.RunOnlyRegressionTest):
+    '''Random IOPS, sequential bandwidth and mmap reads of the local disk
+
+    The node-local /scratch and $TMPDIR are benchmarked like the NVMe
+    drives they are: random 4 KiB IOPS at a deep queue, sequential
+    bandwidth over the queue depths and the throughput of reading a file
+    through mmap, as the data loaders of the ML jobs staging their data
+    there do.  fio is used when it is installed, otherwise a Python driver
+    (see the driver variable); the driver used is printed in the output.
+    '''
+
+    base_dir = parameter(['/scratch', '$TMPDIR'])
+    username = getpass.getuser()
+    sourcesdir = 'src'
+    num_tasks = 1
+    time_limit = '30m'
+    maintainers = ['ÅS']
+    tags = {'ops', 'maintenance', 'localdisk'}
+
+    # auto, fio or python
+    driver = variable(str, value='auto', loggable=True)
+
+    @run_after('init')
+    def set_description(self):
+        self.descr = f'Local disk check ({self.base_dir})'
+
+    @run_after('init')
+    def add_fs_tags(self):
+        self.tags |= {self.base_dir}
+
+    @run_after('init')
+    def set_valid_systems(self):
+        settings = sitedata.fs_settings(self, 'localdisk', 'FS')
+        self.valid_systems = settings['valid_systems']
+        self.valid_prog_environs = settings.get('valid_prog_environs',
+                                                ['builtin'])
+
+    def default_reference(self):
+        '''Return the references of the directory, with one for each
+        sequential workload.'''
+
+        settings = sitedata.fs_settings(self, 'localdisk', 'FS')
+        reference = {
+            f'seq{rw}_qd{qd}': (0, -0.1, None, 'MiB/s')
+            for rw in ('read', 'write') for qd in settings['queue_depths']
+        }
+        reference.update(settings['reference'])
+        return reference
+
+    @run_after('init')
+    def set_performance_reference(self):
+        self.reference = {'*': self.default_reference()}
+
+    @run_before('performance')
+    def set_calibrated_reference(self):
+        sitedata.apply_calibrated_reference(self)
+
+    @run_before('run')
+    def prepare_run(self):
+        os.umask(2)
+        test_dir = os.path.join(self.base_dir, self.username, '.localdisk')
+        settings = sitedata.fs_settings(self, 'localdisk', 'FS')
+        self.num_cpus_per_task = settings['cpus_per_task']
+        self.prerun_cmds = [f'mkdir -p {test_dir}']
+        self.executable = 'python3'
+        self.executable_opts = [
+            'local_storage.py', '--dir', test_dir,
+            '--size', settings['file_size'],
+            '--runtime', str(settings['runtime']),
+            '--queue-depths', ','.join(str(qd) for qd in
+                                       settings['queue_depths']),
+            '--random-depth', str(settings['random_depth']),
+            '--driver', self.driver,
+        ]
+
+    @sanity_function
+    def assert_output(self):
+        return sn.assert_found(r'^local mmap_read: ', self.stdout)
+
+    @run_after('init')
+    def set_perf_variables(self):
+        self.perf_variables = {}
+        for var, (*_, unit) in self.default_reference().items():
+            self.perf_variables[var] = sn.make_performance_function(
+                sn.extractsingle(rf'^local {var}: (\S+) ', self.stdout, 1,
+                                 float), unit
+            )
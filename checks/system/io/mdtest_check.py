@@ -4,6 +4,37 @@ import os
 import reframe as rfm
 import reframe.utility.sanity as sn
 
+from reframe.core.backends import getlauncher
+from reframe.core.exceptions import SanityError
+
+sitedata = rfm.utility.import_module('...common.sitedata')
+mdtestout = rfm.utility.import_module('...common.parsers.mdtest')
+
+
+@sn.deferrable
+def mdtest_rate(filename, phase, pattern=None, section=None):
+    '''Return the :class:`MDtestStat` of the rate of ``phase``.
+
+    With a ``pattern`` the output is that of the mdtest run of ``section``
+    of a script running several, split by ``mdtestout.sections``.
+    '''
+
+    with open(filename) as fp:
+        text = fp.read()
+
+    if pattern is not None:
+        text = mdtestout.sections(text, pattern).get(str(section), '')
+
+    summaries = mdtestout.parse(text)
+    if not summaries or phase not in summaries[-1].rate:
+        raise SanityError(f'no mdtest {phase} rate in {filename}')
+
+    return summaries[-1].rate[phase]
+
+
+# The line printed before each point of MDtestSweep
+_CASE = r'^mdtest case (\d+): .*$'
+
 
 class MDtestBase(rfm.RunOnlyRegressionTest):
     base_dir = parameter(['/pfs/stor10/io-test',
@@ -16,6 +47,9 @@ class MDtestBase(rfm.RunOnlyRegressionTest):
     maintainers = ['ÅS']
     tags = {'ops', 'production', 'maintenance'}
 
+    # Name of the file system table in checks/common/tables/mdtest.py
+    site_table = None
+
     @run_after('init')
     def set_description(self):
         self.descr = f'MDtest check ({self.base_dir})'
@@ -29,36 +63,19 @@ class MDtestBase(rfm.RunOnlyRegressionTest):
         return sn.assert_found(r'^\s+File creation\s+:?\s', self.stdout) and sn.assert_found(r'^\s+Tree removal\s+:?\s', self.stdout)
 
     @run_after('init')
-    def set_perf_patterns(self):
-        self.perf_patterns = {
-            'dir_create': sn.extractsingle(
-                r'^\s+Directory creation\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<dir_create>\S+)\s+', self.stdout,
-                'dir_create', float),
-            'dir_stat': sn.extractsingle(
-                r'^\s+Directory stat\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<dir_stat>\S+)\s+', self.stdout,
-                'dir_stat', float),
-            'dir_removal': sn.extractsingle(
-                r'^\s+Directory removal\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<dir_removal>\S+)\s+', self.stdout,
-                'dir_removal', float),
-            'file_create': sn.extractsingle(
-                r'^\s+File creation\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<file_create>\S+)\s+', self.stdout,
-                'file_create', float),
-            'file_stat': sn.extractsingle(
-                r'^\s+File stat\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<file_stat>\S+)\s+', self.stdout,
-                'file_stat', float),
-            'file_read': sn.extractsingle(
-                r'^\s+File read\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<file_read>\S+)\s+', self.stdout,
-                'file_read', float),
-            'file_removal': sn.extractsingle(
-                r'^\s+File removal\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<file_removal>\S+)\s+', self.stdout,
-                'file_removal', float),
-            'tree_create': sn.extractsingle(
-                r'^\s+Tree creation\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<tree_create>\S+)\s+', self.stdout,
-                'tree_create', float),
-            'tree_removal': sn.extractsingle(
-                r'^\s+Tree removal\s+:?\s+[0-9.]+\s+[0-9.]+\s+(?P<tree_removal>\S+)\s+', self.stdout,
-                'tree_removal', float),
-        }
+    def set_perf_variables(self):
+        # The mean rate of each phase and its spread over the iterations
+        self.perf_variables = {}
+        for phase, _, unit in mdtestout.PHASES:
+            rate = mdtest_rate(self.stdout, phase)
+            self.perf_variables[phase] = sn.make_performance_function(
+                sn.getattr(rate, 'mean'), unit
+            )
+            for column in ('max', 'min', 'std'):
+                self.perf_variables[f'{phase}_{column}'] = (
+                    sn.make_performance_function(sn.getattr(rate, column),
+                                                 unit)
+                )
 
     @run_after('init')
     def set_modules(self):
@@ -68,72 +85,31 @@ class MDtestBase(rfm.RunOnlyRegressionTest):
         }
         self.modules = module.get(self.current_system.name, [])
 
-    @run_after('init')
-    def set_fs_information(self):
-        # Setting some default values
-        for data in self.fs.values():
-            data.setdefault('nr_dirs_files_per_proc', '20000')
-            data.setdefault('iterations', '3')
-            data.setdefault('io_api', 'POSIX')
-            data.setdefault('stride', '0')
-            data.setdefault('unique_dir_per_task', True)
-            data.setdefault('hierarch_depth', '3')
-            data.setdefault('hierarch_branch', '3')
-            data.setdefault('bytes_per_file', '0')
-            data.setdefault('stonewall_timer', '300')
-            data.setdefault(
-                'reference',
-                {
-                    'dir_create': (0, -0.1, None, 'dirs/s'),
-                    'dir_stat': (0, -0.1, None, 'dirs/s'),
-                    'dir_removal': (0, -0.1, None, 'dirs/s'),
-                    'file_create': (0, -0.1, None, 'files/s'),
-                    'file_stat': (0, -0.1, None, 'files/s'),
-                    'file_read': (0, -0.1, None, 'files/s'),
-                    'file_removal': (0, -0.1, None, 'files/s'),
-                    'tree_create': (0, -0.1, None, 'dirs/s'),
-                    'tree_removal': (0, -0.1, None, 'dirs/s'),
-                },
-            )
-            data.setdefault('dummy', {})  # entry for unknown systems
-
     @run_after('init')
     def set_valid_systems(self):
-        self.valid_systems = self.fs[self.base_dir]['valid_systems']
-
-        cur_sys = self.current_system.name
-        if cur_sys not in self.fs[self.base_dir]:
-            cur_sys = 'dummy'
-
-        vpe = 'valid_prog_environs'
-        penv = self.fs[self.base_dir][cur_sys].get(vpe, ['builtin'])
-        self.valid_prog_environs = penv
+        settings = sitedata.fs_settings(self, 'mdtest', self.site_table)
+        self.valid_systems = settings['valid_systems']
+        self.valid_prog_environs = settings.get('valid_prog_environs',
+                                                ['builtin'])
 
     @run_before('run')
     def set_performance_reference(self):
         # Converting the references from each fs to per system.
         self.reference = {
-            '*': self.fs[self.base_dir]['reference']
+            '*': sitedata.fs_settings(self, 'mdtest',
+                                      self.site_table)['reference']
         }
 
+    @run_before('performance')
+    def set_calibrated_reference(self):
+        sitedata.apply_calibrated_reference(self)
+
     @run_before('run')
     def set_tasks(self):
-        cur_sys = self.current_system.name
-        fullname = self.current_partition.fullname
-        if cur_sys not in self.fs[self.base_dir]:
-            cur_sys = 'dummy'
-        if fullname not in self.fs[self.base_dir]:
-            fullname = cur_sys
-
-        tpn = self.fs[self.base_dir][cur_sys].get('num_tasks_per_node', 1)
-        tpn = self.fs[self.base_dir][fullname].get('num_tasks_per_node', tpn)
-        cpt = self.fs[self.base_dir][cur_sys].get('cpus_per_task', 1)
-        cpt = self.fs[self.base_dir][fullname].get('cpus_per_task', cpt)
-        nt = self.fs[self.base_dir][cur_sys].get('num_tasks', 1)
-        nt = self.fs[self.base_dir][fullname].get('num_tasks', nt)
-        self.num_tasks = nt
-        self.num_tasks_per_node = tpn
-        self.num_cpus_per_task = cpt
+        settings = sitedata.fs_settings(self, 'mdtest', self.site_table)
+        self.num_tasks = settings.get('num_tasks', 1)
+        self.num_tasks_per_node = settings.get('num_tasks_per_node', 1)
+        self.num_cpus_per_task = settings.get('cpus_per_task', 1)
 
     @run_before('run')
     def prepare_run_base(self):
@@ -146,13 +122,14 @@ class MDtestBase(rfm.RunOnlyRegressionTest):
         self.prerun_cmds = [f'mkdir -p {test_dir}']
         self.executable = 'mdtest'
 
-        nr_files = self.fs[self.base_dir]['nr_dirs_files_per_proc']
-        iterations = self.fs[self.base_dir]['iterations']
-        stonewall_timer = self.fs[self.base_dir]['stonewall_timer']
-        bytes_per_file = self.fs[self.base_dir]['bytes_per_file']
-        hierarch_depth = self.fs[self.base_dir]['hierarch_depth']
-        hierarch_branch = self.fs[self.base_dir]['hierarch_branch']
-        unique_dir = self.fs[self.base_dir]['unique_dir_per_task']
+        settings = sitedata.fs_settings(self, 'mdtest', self.site_table)
+        nr_files = settings['nr_dirs_files_per_proc']
+        iterations = settings['iterations']
+        stonewall_timer = settings['stonewall_timer']
+        bytes_per_file = settings['bytes_per_file']
+        hierarch_depth = settings['hierarch_depth']
+        hierarch_branch = settings['hierarch_branch']
+        unique_dir = settings['unique_dir_per_task']
 
         self.executable_opts = ['-Y', '-i', iterations, '-n', nr_files,
                                 '-d', target_dir]
@@ -171,150 +148,14 @@ class MDtestNode(MDtestBase):
     # Single node test
     tags |= {'full'}
 
-    def __init__(self):
-        self.fs = {
-            '/pfs/stor10/io-test': {
-                'valid_systems': ['kebnekaise'],
-                'kebnekaise': {
-                    'num_tasks': 28,
-                    'num_tasks_per_node': 28,
-                },
-                'kebnekaise:zen3': {
-                    'num_tasks': 128,
-                    'num_tasks_per_node': 128,
-                },
-                'kebnekaise:zen4': {
-                    'num_tasks': 256,
-                    'num_tasks_per_node': 256,
-                },
-                'kebnekaise:2xl40s': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'kebnekaise:6xl40s': {
-                    'num_tasks': 60,
-                    'num_tasks_per_node': 60,
-                },
-                'kebnekaise:8xa40': {
-                    'num_tasks': 64,
-                    'num_tasks_per_node': 64,
-                },
-                'kebnekaise:4xh100': {
-                    'num_tasks': 96,
-                    'num_tasks_per_node': 96,
-                },
-                'reference': {
-                    'dir_create': (13000, -0.1, None, 'dirs/s'),
-                    'dir_stat': (23000, -0.1, None, 'dirs/s'),
-                    'dir_removal': (14000, -0.1, None, 'dirs/s'),
-                    'file_create': (6500, -0.1, None, 'files/s'),
-                    'file_stat': (30000, -0.1, None, 'files/s'),
-                    'file_read': (10000, -0.1, None, 'files/s'),
-                    'file_removal': (15000, -0.1, None, 'files/s'),
-                    'tree_create': (500, -0.1, None, 'dirs/s'),
-                    'tree_removal': (400, -0.1, None, 'dirs/s'),
-                },
-            },
-            '/scratch': {
-                'valid_systems': ['kebnekaise'],
-                'kebnekaise:zen4': {
-                    'num_tasks': 256,
-                    'num_tasks_per_node': 256,
-                },
-                'kebnekaise:2xl40s': {
-                    'num_tasks': 48,
-                    'num_tasks_per_node': 48,
-                },
-                'kebnekaise:4xh100': {
-                    'num_tasks': 96,
-                    'num_tasks_per_node': 96,
-                },
-            },
-            '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test': {
-                'valid_systems': ['alvis'],
-                'nr_dirs_files_per_proc': '1000',
-                'alvis:CPUonly': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                },
-                'alvis:2xV100': {
-                    'num_tasks': 16,
-                    'num_tasks_per_node': 16,
-                },
-                'alvis:4xV100': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                },
-                'alvis:4xA40': {
-                    'num_tasks': 64,
-                    'num_tasks_per_node': 64,
-                },
-                'alvis:4xA100_MEM256': {
-                    'num_tasks': 63,
-                    'num_tasks_per_node': 63,
-                },
-                'alvis:4xA100_MEM512': {
-                    'num_tasks': 63,
-                    'num_tasks_per_node': 63,
-                },
-                'reference': {
-                    'dir_create': (3000, -0.1, None, 'dirs/s'),
-                    'dir_stat': (60000, -0.1, None, 'dirs/s'),
-                    'dir_removal': (1000, -0.1, None, 'dirs/s'),
-                    'file_create': (4000, -0.1, None, 'files/s'),
-                    'file_stat': (60000, -0.1, None, 'files/s'),
-                    'file_read': (35000, -0.1, None, 'files/s'),
-                    'file_removal': (1500, -0.1, None, 'files/s'),
-                    'tree_create': (37, -0.1, None, 'dirs/s'),
-                    'tree_removal': (9, -0.1, None, 'dirs/s'),
-                },
-            },
-            '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test': {
-                'valid_systems': ['alvis'],
-                'alvis:CPUonly': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                },
-                'alvis:2xV100': {
-                    'num_tasks': 16,
-                    'num_tasks_per_node': 16,
-                },
-                'alvis:4xV100': {
-                    'num_tasks': 32,
-                    'num_tasks_per_node': 32,
-                },
-                'alvis:4xA40': {
-                    'num_tasks': 64,
-                    'num_tasks_per_node': 64,
-                },
-                'alvis:4xA100_MEM256': {
-                    'num_tasks': 63,
-                    'num_tasks_per_node': 63,
-                },
-                'alvis:4xA100_MEM512': {
-                    'num_tasks': 63,
-                    'num_tasks_per_node': 63,
-                },
-                'reference': {
-                    'dir_create': (64000, -0.1, None, 'dirs/s'),
-                    'dir_stat': (95000, -0.1, None, 'dirs/s'),
-                    'dir_removal': (70000, -0.1, None, 'dirs/s'),
-                    'file_create': (60000, -0.1, None, 'files/s'),
-                    'file_stat': (120000, -0.1, None, 'files/s'),
-                    'file_read': (55000, -0.1, None, 'files/s'),
-                    'file_removal': (70000, -0.1, None, 'files/s'),
-                    'tree_create': (250, -0.1, None, 'dirs/s'),
-                    'tree_removal': (450, -0.1, None, 'dirs/s'),
-                },
-            },
-        }
-
+    site_table = 'NODE'
 
     @run_before('run')
     def prepare_run(self):
         # executable options depends on the file system
-        io_api = self.fs[self.base_dir]['io_api']
-        stride = self.fs[self.base_dir]['stride']
+        settings = sitedata.fs_settings(self, 'mdtest', self.site_table)
+        io_api = settings['io_api']
+        stride = settings['stride']
         self.executable_opts += ['-a', io_api,
                                 '-N', stride]
 
@@ -324,59 +165,99 @@ class MDtestSingle(MDtestBase):
     # Single thread test
     tags |= {'single'}
 
-    def __init__(self):
-        self.fs = {
-            '/pfs/stor10/io-test': {
-                'valid_systems': ['kebnekaise'],
-                'nr_dirs_files_per_proc': '100000',
-                'iterations': '5',
-                'reference': {
-                    'dir_create': (1900, -0.1, None, 'dirs/s'),
-                    'dir_stat': (2100, -0.1, None, 'dirs/s'),
-                    'dir_removal': (1800, -0.1, None, 'dirs/s'),
-                    'file_create': (900, -0.1, None, 'files/s'),
-                    'file_stat': (950, -0.1, None, 'files/s'),
-                    'file_read': (1100, -0.1, None, 'files/s'),
-                    'file_removal': (1700, -0.1, None, 'files/s'),
-                    'tree_create': (850, -0.1, None, 'dirs/s'),
-                    'tree_removal': (1200, -0.1, None, 'dirs/s'),
-                },
-            },
-            '/scratch': {
-                'valid_systems': ['kebnekaise'],
-                'nr_dirs_files_per_proc': '100000',
-                'iterations': '5',
-            },
-            '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test': {
-                'valid_systems': ['alvis'],
-                'nr_dirs_files_per_proc': '100000',
-                'iterations': '5',
-                'reference': {
-                    'dir_create': (1700, -0.1, None, 'dirs/s'),
-                    'dir_stat': (155000, -0.1, None, 'dirs/s'),
-                    'dir_removal': (1700, -0.1, None, 'dirs/s'),
-                    'file_create': (3400, -0.1, None, 'files/s'),
-                    'file_stat': (138000, -0.1, None, 'files/s'),
-                    'file_read': (138000, -0.1, None, 'files/s'),
-                    'file_removal': (3300, -0.1, None, 'files/s'),
-                    'tree_create': (3600, -0.1, None, 'dirs/s'),
-                    'tree_removal': (900, -0.1, None, 'dirs/s'),
-                },
-            },
-            '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test': {
-                'valid_systems': ['alvis'],
-                'nr_dirs_files_per_proc': '100000',
-                'iterations': '5',
-                'reference': {
-                    'dir_create': (2500, -0.1, None, 'dirs/s'),
-                    'dir_stat': (16000, -0.1, None, 'dirs/s'),
-                    'dir_removal': (2000, -0.1, None, 'dirs/s'),
-                    'file_create': (2500, -0.1, None, 'files/s'),
-                    'file_stat': (27000, -0.1, None, 'files/s'),
-                    'file_read': (32000, -0.1, None, 'files/s'),
-                    'file_removal': (2500, -0.1, None, 'files/s'),
-                    'tree_create': (1200, -0.1, None, 'dirs/s'),
-                    'tree_removal': (700, -0.1, None, 'dirs/s'),
-                },
-            },
-        }
+    site_table = 'SINGLE'
+
+
+@rfm.simple_test
+class MDtestSweep(MDtestBase):
+    '''Metadata rates of a node over the shape of the directory tree
+
+    The points sweep the depth and branch factor of the tree, the items per
+    directory and the file size, and run one after the other in one job.
+    The points with a branch factor of 1 are cut short by the stonewall
+    timer.
+    '''
+
+    time_limit = '2h'
+    tags = {'ops', 'sweep'}
+
+    site_table = 'NODE'
+
+    # Phases reported for each point
+    phases = ['dir_create', 'file_create', 'file_stat', 'file_removal']
+
+    @run_after('init')
+    def set_cases(self):
+        settings = sitedata.fs_settings(self, 'mdtest', self.site_table)
+        self.cases = []
+        for depth in settings['sweep_depths']:
+            for branch in settings['sweep_branches']:
+                for items in settings['sweep_items_per_dir']:
+                    for size in settings['sweep_bytes_per_file']:
+                        self.cases.append((depth, branch, items, size))
+
+    @staticmethod
+    def case_name(depth, branch, items, size):
+        return f'z{depth}_b{branch}_I{items}_s{size}'
+
+    @run_before('run')
+    def set_performance_reference(self):
+        # The references of the file system are for the fixed runs
+        self.reference = {}
+
+    @run_before('run')
+    def prepare_run_base(self):
+        os.umask(2)
+        test_dir = os.path.join(self.base_dir, self.username, '.mdtest')
+        self.prerun_cmds = [f'mkdir -p {test_dir}']
+
+        settings = sitedata.fs_settings(self, 'mdtest', self.site_table)
+        launch = self.job.launcher.run_command(self.job)
+        commands = []
+        for num, (depth, branch, items, size) in enumerate(self.cases, 1):
+            target_dir = os.path.join(
+                test_dir, f'.mdtest-sweep.{self.current_partition.name}.{num}'
+            )
+            opts = ['-Y', '-i', '1', '-I', items, '-z', depth, '-b', branch,
+                    '-a', settings['io_api'], '-N', settings['stride'],
+                    '-d', target_dir]
+            if settings['unique_dir_per_task']:
+                opts.append('-u')
+
+            if size != '0':
+                opts += ['-w', size, '-e', size]
+
+            if branch == '1':
+                opts += ['-W', settings['sweep_stonewall_timer']]
+
+            name = self.case_name(depth, branch, items, size)
+            commands.append(f"echo 'mdtest case {num}: {name}'")
+            commands.append(' '.join([launch, 'mdtest'] + opts))
+
+        # The points are launched one by one from a script
+        with open(os.path.join(self.stagedir, 'mdtest_sweep.sh'), 'w') as fp:
+            fp.write('\n'.join(commands) + '\n')
+
+        self.job.launcher = getlauncher('local')()
+        self.executable = 'bash'
+        self.executable_opts = ['mdtest_sweep.sh']
+
+    @sanity_function
+    def assert_output(self):
+        return sn.assert_eq(
+            sn.count(sn.findall(r'^\s+File removal\s+:?\s', self.stdout)),
+            len(self.cases)
+        )
+
+    @run_before('performance')
+    def set_perf_variables(self):
+        self.perf_variables = {}
+        for num, case in enumerate(self.cases, 1):
+            name = self.case_name(*case)
+            for phase in self.phases:
+                unit = 'dirs/s' if phase.startswith('dir') else 'files/s'
+                rate = mdtest_rate(self.stdout, phase, _CASE, num)
+                self.perf_variables[f'{phase}_{name}'] = (
+                    sn.make_performance_function(sn.getattr(rate, 'mean'),
+                                                 unit)
+                )
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+#
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Benchmark the node-local disk.
+#
+# Random 4 KiB reads and writes at a deep queue, sequential 1 MiB reads and
+# writes at each of --queue-depths, and the read throughput of the file
+# through mmap.  The random and sequential workloads run with fio when it is
+# installed, with libaio and O_DIRECT, and otherwise with a Python driver
+# keeping the queue full with one thread per outstanding I/O, with O_DIRECT
+# where the file system supports it.  The mmap read drops the page cache of
+# the file first and sums it with NumPy if available.
+#
+
+import argparse
+import concurrent.futures
+import json
+import mmap
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+import zlib
+
+
+MiB = 1024**2
+
+
+def parse_size(size):
+    '''Return the bytes of a size like ``8g``.'''
+
+    units = {'k': 1024, 'm': MiB, 'g': 1024**3, 't': 1024**4}
+    if size[-1].lower() in units:
+        return int(float(size[:-1]) * units[size[-1].lower()])
+
+    return int(size)
+
+
+def run_fio(args, rw, bs, iodepth):
+    '''Return the IOPS and MiB/s of one fio job.'''
+
+    cmd = ['fio', '--name=local', f'--filename={args.file}',
+           f'--size={args.size}', f'--bs={bs}', f'--rw={rw}',
+           f'--iodepth={iodepth}', '--ioengine=libaio', '--direct=1',
+           f'--runtime={args.runtime}', '--time_based',
+           '--output-format=json']
+    out = subprocess.run(cmd, stdout=subprocess.PIPE, universal_newlines=True,
+                         check=True).stdout
+
+    # fio may print warnings before the JSON
+    job = json.loads(out[out.index('{'):])['jobs'][0]
+    data = job['read' if 'read' in rw else 'write']
+    return data['iops'], data['bw'] / 1024
+
+
+def open_file(path, flags):
+    '''Open ``path`` with O_DIRECT if the file system supports it; return
+    the descriptor and whether it is direct.'''
+
+    try:
+        return os.open(path, flags | os.O_DIRECT), True
+    except (OSError, AttributeError):
+        return os.open(path, flags), False
+
+
+def drop_cache(path):
+    fd = os.open(path, os.O_RDONLY)
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    os.close(fd)
+
+
+def run_python(args, rw, bs, iodepth):
+    '''Return the IOPS and MiB/s of ``iodepth`` threads doing ``rw``.'''
+
+    bs = parse_size(bs)
+    size = parse_size(args.size)
+    blocks = size // bs
+    reading = 'read' in rw
+    if reading:
+        drop_cache(args.file)
+
+    fd, direct = open_file(args.file, os.O_RDONLY if reading else os.O_WRONLY)
+    deadline = time.monotonic() + args.runtime
+
+    def worker(num):
+        # An anonymous map is page aligned, as O_DIRECT needs
+        buf = mmap.mmap(-1, bs)
+        if not reading:
+            buf.write(os.urandom(bs))
+
+        rng = random.Random(num)
+        start = num * blocks // iodepth
+        ops = 0
+        while time.monotonic() < deadline:
+            if rw.startswith('rand'):
+                offset = rng.randrange(blocks) * bs
+            else:
+                offset = (start + ops) % blocks * bs
+
+            if reading:
+                os.preadv(fd, [buf], offset)
+            else:
+                os.pwritev(fd, [buf], offset)
+
+            ops += 1
+
+        return ops
+
+    begin = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(iodepth) as pool:
+        ops = sum(pool.map(worker, range(iodepth)))
+
+    if not direct and not reading:
+        os.fsync(fd)
+
+    elapsed = time.monotonic() - begin
+    os.close(fd)
+    return ops / elapsed, ops * bs / elapsed / MiB
+
+
+def create_file(path, size):
+    '''Write ``size`` bytes of random data to ``path``.'''
+
+    block = os.urandom(MiB)
+    with open(path, 'wb') as fp:
+        for _ in range(size // MiB):
+            fp.write(block)
+
+        fp.flush()
+        os.fsync(fp.fileno())
+
+
+def mmap_read(path):
+    '''Return the MiB/s of reading ``path`` through mmap.'''
+
+    drop_cache(path)
+    start = time.perf_counter()
+    try:
+        import numpy as np
+
+        data = np.memmap(path, dtype=np.uint64, mode='r')
+        chunk = 8 * MiB
+        for i in range(0, len(data), chunk):
+            data[i:i + chunk].sum()
+
+        size = data.nbytes
+        del data
+    except ImportError:
+        with open(path, 'rb') as fp:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for i in range(0, len(mm), 64 * MiB):
+                    zlib.adler32(mm[i:i + 64 * MiB])
+
+                size = len(mm)
+
+    return size / (time.perf_counter() - start) / MiB
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark a local disk')
+    parser.add_argument('--dir', required=True)
+    parser.add_argument('--size', default='8g', help='size of the test file')
+    parser.add_argument('--runtime', type=int, default=30,
+                        help='seconds per workload')
+    parser.add_argument('--queue-depths', default='1,4,16,32',
+                        help='queue depths of the sequential workloads')
+    parser.add_argument('--random-depth', type=int, default=32,
+                        help='queue depth of the random workloads')
+    parser.add_argument('--driver', choices=['auto', 'fio', 'python'],
+                        default='auto')
+    args = parser.parse_args()
+
+    driver = args.driver
+    if driver == 'auto':
+        driver = 'fio' if shutil.which('fio') else 'python'
+
+    run = run_fio if driver == 'fio' else run_python
+    os.makedirs(args.dir, exist_ok=True)
+    args.file = os.path.join(args.dir, f'local-storage.{os.getpid()}')
+    print(f'local driver: {driver}', flush=True)
+    try:
+        size = parse_size(args.size)
+        create_file(args.file, size)
+        for rw in ('randread', 'randwrite'):
+            iops, _ = run(args, rw, '4k', args.random_depth)
+            print(f'local {rw}_4k: {iops:.0f} IOPS', flush=True)
+
+        for qd in (int(d) for d in args.queue_depths.split(',')):
+            for rw in ('read', 'write'):
+                _, bw = run(args, rw, '1m', qd)
+                print(f'local seq{rw}_qd{qd}: {bw:.1f} MiB/s', flush=True)
+
+        print(f'local mmap_read: {mmap_read(args.file):.1f} MiB/s')
+    except (OSError, subprocess.CalledProcessError) as err:
+        sys.exit(f'local: {err}')
+    finally:
+        if os.path.exists(args.file):
+            os.unlink(args.file)
+
+
+if __name__ == '__main__':
+    main()
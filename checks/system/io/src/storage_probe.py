@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+#
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Sample the latency of the file operations of a file system.
+#
+# Each thread repeatedly creates a file, writes a small block to it and
+# syncs it, stats it, opens it again, reads the block back and unlinks it,
+# until --duration seconds have passed.  The page cache of the file is
+# dropped before the read where the file system honours it.  The latency of
+# each operation is printed as a histogram with power of two buckets and
+# its 50th, 99th and 99.9th percentiles.
+#
+
+import argparse
+import collections
+import concurrent.futures
+import os
+import socket
+import sys
+import time
+
+
+OPERATIONS = ['create', 'write', 'stat', 'open', 'read', 'unlink']
+
+
+def percentile(values, p):
+    '''Return the nearest rank ``p`` percentile of sorted ``values``.'''
+
+    rank = max(int(-(-p * len(values) // 100)), 1)
+    return values[rank - 1]
+
+
+def probe(directory, block_size, deadline):
+    '''Run the operations in ``directory`` until ``deadline``; return the
+    latencies of each operation in microseconds.'''
+
+    latencies = collections.defaultdict(list)
+    block = os.urandom(block_size)
+
+    def timed(op, func, *args):
+        start = time.perf_counter_ns()
+        ret = func(*args)
+        latencies[op].append((time.perf_counter_ns() - start) / 1000)
+        return ret
+
+    os.makedirs(directory)
+    count = 0
+    while time.monotonic() < deadline:
+        path = os.path.join(directory, f'f{count}')
+        fd = timed('create', os.open, path,
+                   os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        start = time.perf_counter_ns()
+        os.pwrite(fd, block, 0)
+        os.fsync(fd)
+        latencies['write'].append((time.perf_counter_ns() - start) / 1000)
+        os.close(fd)
+
+        timed('stat', os.stat, path)
+        fd = timed('open', os.open, path, os.O_RDONLY)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+        timed('read', os.pread, fd, block_size, 0)
+        os.close(fd)
+        timed('unlink', os.unlink, path)
+        count += 1
+
+    os.rmdir(directory)
+    return latencies
+
+
+def histogram(values):
+    '''Return the counts of ``values`` in power of two buckets, as a dict
+    mapping the upper bound of each bucket to its count.'''
+
+    buckets = collections.Counter()
+    for v in values:
+        bound = 1
+        while bound < v:
+            bound *= 2
+
+        buckets[bound] += 1
+
+    return dict(sorted(buckets.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Probe a file system')
+    parser.add_argument('--dir', required=True,
+                        help='directory the probe files are created in')
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=120,
+                        help='seconds to probe for')
+    parser.add_argument('--block-size', type=int, default=4096,
+                        help='bytes written and read per file')
+    args = parser.parse_args()
+
+    prefix = os.path.join(args.dir,
+                          f'.probe.{socket.gethostname()}.{os.getpid()}')
+    deadline = time.monotonic() + args.duration
+    with concurrent.futures.ThreadPoolExecutor(args.threads) as pool:
+        futures = [pool.submit(probe, f'{prefix}.{t}', args.block_size,
+                               deadline)
+                   for t in range(args.threads)]
+        results = [f.result() for f in futures]
+
+    print(f'probe: {args.threads} threads, {args.duration:.0f} s, '
+          f'{args.block_size} byte blocks in {args.dir}')
+    for op in OPERATIONS:
+        values = sorted(v for r in results for v in r[op])
+        if not values:
+            sys.exit(f'probe: no {op} completed')
+
+        buckets = ' '.join(f'{bound}:{count}'
+                           for bound, count in histogram(values).items())
+        print(f'probe histogram {op} (us): {buckets}')
+        print(f'probe {op}: count={len(values)} '
+              f'p50={percentile(values, 50):.1f} '
+              f'p99={percentile(values, 99):.1f} '
+              f'p999={percentile(values, 99.9):.1f} us')
+
+
+if __name__ == '__main__':
+    main()
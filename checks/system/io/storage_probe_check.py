@@ -0,0 +1,96 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import getpass
+import os
+
+import reframe as rfm
+import reframe.utility.sanity as sn
+
+sitedata = rfm.utility.import_module('...common.sitedata')
+
+
+@rfm.simple_test
+class StorageProbe(rfm.RunOnlyRegressionTest):
+    '''Latency of the file operations of a file system
+
+    A few minutes of create, small block write, stat, open, small block
+    read and unlink from many threads of one node, reported as the 50th,
+    99th and 99.9th percentiles of each operation.  It is cheap enough to
+    run every hour, to catch a degrading file system between the IOR and
+    mdtest runs.
+    '''
+
+    base_dir = parameter(['/pfs/stor10/io-test',
+                          '/scratch',
+                          '/cephyr/NOBACKUP/priv/c3-alvis/reframe/io-test',
+                          '/mimer/NOBACKUP/groups/c3-staff/reframe/io-test',
+                          ])
+    username = getpass.getuser()
+    sourcesdir = 'src'
+    num_tasks = 1
+    time_limit = '10m'
+    maintainers = ['ÅS']
+    tags = {'ops', 'probe'}
+
+    operations = ['create', 'write', 'stat', 'open', 'read', 'unlink']
+    percentiles = ['p50', 'p99', 'p999']
+
+    @run_after('init')
+    def set_description(self):
+        self.descr = f'Storage latency probe ({self.base_dir})'
+
+    @run_after('init')
+    def add_fs_tags(self):
+        self.tags |= {self.base_dir}
+
+    @run_after('init')
+    def set_valid_systems(self):
+        settings = sitedata.fs_settings(self, 'probe', 'FS')
+        self.valid_systems = settings['valid_systems']
+        self.valid_prog_environs = settings.get('valid_prog_environs',
+                                                ['builtin'])
+
+    @run_after('init')
+    def set_performance_reference(self):
+        self.reference = {
+            '*': sitedata.fs_settings(self, 'probe', 'FS')['reference']
+        }
+
+    @run_before('performance')
+    def set_calibrated_reference(self):
+        sitedata.apply_calibrated_reference(self)
+
+    @run_before('run')
+    def prepare_run(self):
+        os.umask(2)
+        test_dir = os.path.join(self.base_dir, self.username, '.probe')
+        settings = sitedata.fs_settings(self, 'probe', 'FS')
+        self.num_cpus_per_task = settings['threads']
+        self.prerun_cmds = [f'mkdir -p {test_dir}']
+        self.executable = 'python3'
+        self.executable_opts = [
+            'storage_probe.py', '--dir', test_dir,
+            '--threads', str(settings['threads']),
+            '--duration', str(settings['duration']),
+            '--block-size', str(settings['block_size']),
+        ]
+
+    @sanity_function
+    def assert_output(self):
+        return sn.all([
+            sn.assert_found(rf'^probe {op}: count=\d+ ', self.stdout)
+            for op in self.operations
+        ])
+
+    @run_after('init')
+    def set_perf_variables(self):
+        self.perf_variables = {}
+        for op in self.operations:
+            for num, p in enumerate(self.percentiles, 1):
+                self.perf_variables[f'{op}_{p}'] = (
+                    sn.make_performance_function(sn.extractsingle(
+                        rf'^probe {op}: count=\d+ p50=(\S+) p99=(\S+) '
+                        rf'p999=(\S+) us$', self.stdout, num, float), 'us')
+                )
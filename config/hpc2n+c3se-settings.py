@@ -134,6 +134,13 @@ site_configuration = {
                     'max_jobs': 100,
                     'features': ['gpu', 'nvgpu'],
                     'environs': ['builtin', 'gnu', 'foss', 'foss_with_cuda', 'foss_2021a', 'foss_2021b', 'foss_2022a', 'intel_2021a', 'intel_2022a'],
+                    'devices': [
+                        {
+                            'type': 'gpu',
+                            'arch': 'sm_80',
+                            'num_devices': 4
+                        },
+                    ],
                     'container_platforms': [
                         {
                             'type': 'Singularity',
@@ -480,6 +487,7 @@ site_configuration = {
                     'devices': [
                         {
                             'type': 'gpu',
+                            'arch': 'gfx908',
                             'num_devices': 2
                         },
                     ],
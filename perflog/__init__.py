@@ -0,0 +1,10 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+'''Tools for reading the ReFrame performance logs of the HPC2N and C3SE
+systems.'''
+
+from .index import PerflogIndex
+from .parser import (PerfValue, PerflogParser, PerflogRecord, expand_nodelist,
+                     find_perflogs, iter_records, iter_stream, parse_time)
@@ -0,0 +1,237 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Calibration of the performance references from the perflog store.
+#
+# The references are written as a Python module (checks/common/references.py)
+# that is read by checks/common/sitedata.py, so the checks pick up the
+# calibrated values for the partitions and programming environments that
+# have enough history.
+#
+
+import collections
+import datetime
+import fnmatch
+import os
+
+import numpy as np
+
+from .stats import mad_scores, mad_sigma
+
+
+# Checks that use the calibrated references
+DEFAULT_CHECKS = [
+    'StreamTest2',
+    'StreamTest2Maintenance',
+    'StreamTest2Numa',
+    'StreamCacheSweep',
+    'HPLBaseSingleNode_Fixed',
+    'HPLScaling',
+    'HPLGpu',
+    'IorWriteCheck',
+    'IorReadCheck',
+    'IorWriteReadCheck',
+    'IorCacheBypassReadCheck',
+    'IorSweepCheck',
+    'IorScalingCheck',
+    'MDtestNode',
+    'MDtestSingle',
+    'MDtestSweep',
+    'MDtestIorInterference',
+    'StorageProbe',
+    'LocalStorageCheck',
+]
+
+Calibration = collections.namedtuple(
+    'Calibration', ['check', 'variant', 'partition', 'environ', 'var',
+                    'count', 'ref', 'lower', 'upper', 'unit', 'current']
+)
+
+
+# The direction of the performance variables whose history has no bound:
+# 1 if higher is better, -1 if lower is better and 0 to leave them
+# unbounded.  The variable patterns are tried first, then the units, and
+# the other units ending in /s are rates.
+DIRECTION_VARS = [
+    ('*_std', 0),
+    ('*_cv', -1),
+    ('*_avg_best', -1),
+    ('*_p50', -1),
+    ('*_p99', -1),
+    ('*_p999', -1),
+    ('*_ratio', 1),
+    ('*_efficiency', 1),
+    ('*_balance', 1),
+]
+
+DIRECTION_UNITS = {
+    's': -1,
+    'ms': -1,
+    'us': -1,
+    'GFlops': 1,
+    'IOPS': 1,
+    'accuracy': 1,
+}
+
+
+def direction(var, unit):
+    '''Return whether higher (1) or lower (-1) values of a performance
+    variable are better, or 0 if neither.'''
+
+    for pattern, sign in DIRECTION_VARS:
+        if fnmatch.fnmatchcase(var, pattern):
+            return sign
+
+    if unit in DIRECTION_UNITS:
+        return DIRECTION_UNITS[unit]
+
+    return 1 if unit and unit.endswith('/s') else 0
+
+
+def _threshold(values, tol, bounded):
+    # A bound of the history is kept; without one only the side of the
+    # worse values is bounded, e.g. not the upper bound of the bandwidths
+    if bounded or not np.all(np.isnan(values)):
+        return tol
+
+    return None
+
+
+def calibrate_var(rows, min_count=10, nsigma=3.0, min_tol=0.02, max_tol=0.25,
+                  outlier_score=3.5, digits=4, sign=0):
+    '''Compute a reference and tolerance from the rows of one variable.
+
+    Values further than ``outlier_score`` robust standard deviations from
+    the median, e.g. the runs on degraded nodes, are dropped; the reference
+    is the median of the remaining values and the tolerance ``nsigma``
+    robust standard deviations, clamped to ``[min_tol, max_tol]``.  The
+    bounds of the history are kept, and a variable without them is bounded
+    below if ``sign`` is 1 and above if it is -1; see :func:`direction`.
+    Returns ``(count, ref, lower, upper)`` or ``None`` if there are too few
+    values.
+    '''
+
+    values = rows['value']
+    if len(values) < min_count:
+        return None
+
+    keep = np.abs(mad_scores(values)) <= outlier_score
+    values = values[keep]
+    if len(values) < min_count:
+        return None
+
+    ref = float(np.median(values))
+    if ref == 0:
+        return None
+
+    tol = min(max(nsigma * mad_sigma(values) / abs(ref), min_tol), max_tol)
+    tol = round(float(tol), 3)
+    ref = float(f'{ref:.{digits}g}')
+    return (len(values), ref, _threshold(rows['lower'], -tol, sign > 0),
+            _threshold(rows['upper'], tol, sign < 0))
+
+
+def calibrate(store, checks=None, partition=None, since=None, **kwargs):
+    '''Calibrate the references of all matching tables in the store.
+
+    Yields one :class:`Calibration` per check, variant, partition,
+    programming environment and performance variable with enough records.
+    '''
+
+    checks = checks or DEFAULT_CHECKS
+    for part, check in store.tables():
+        if check not in checks:
+            continue
+
+        if partition is not None and part != partition:
+            continue
+
+        table = store.table(part, check)
+        for var in table.perfvars:
+            unit = table.unit(var)
+            rows = table.select(var, since=since)
+            keys = np.stack([rows['environ'], rows['variant']], axis=1)
+            for environ, variant in np.unique(keys, axis=0):
+                sel = ((rows['environ'] == environ) &
+                       (rows['variant'] == variant))
+                group = {k: v[sel] for k, v in rows.items()}
+                ret = calibrate_var(group, sign=direction(var, unit),
+                                    **kwargs)
+                if ret is None:
+                    continue
+
+                # The reference in use when the last record was written
+                current = group['ref'][np.argmax(group['time'])]
+                current = None if np.isnan(current) else float(current)
+                count, ref, lower, upper = ret
+                yield Calibration(check, table.strings('variant')[variant],
+                                  part, table.strings('environ')[environ],
+                                  var, count, ref, lower, upper,
+                                  unit, current)
+
+
+def load_references(filename):
+    '''Read the references of a previously generated module.'''
+
+    if not os.path.exists(filename):
+        return {}
+
+    namespace = {}
+    with open(filename) as fp:
+        exec(compile(fp.read(), filename, 'exec'), namespace)
+
+    return namespace.get('REFERENCES', {})
+
+
+def update_references(references, calibrations):
+    '''Add the calibrations to a nested references dict.
+
+    The dict is indexed by check, variant, partition, programming
+    environment and performance variable, like the generated module.
+    '''
+
+    for c in calibrations:
+        entry = references.setdefault(c.check, {})
+        entry = entry.setdefault(c.variant, {})
+        entry = entry.setdefault(c.partition, {})
+        entry = entry.setdefault(c.environ, {})
+        entry[c.var] = (c.ref, c.lower, c.upper, c.unit)
+
+    return references
+
+
+def _format_dict(d, indent=0):
+    pad = ' ' * (indent + 4)
+    lines = ['{']
+    for key in sorted(d):
+        val = d[key]
+        if isinstance(val, dict):
+            val = _format_dict(val, indent + 4)
+        else:
+            val = repr(tuple(val))
+
+        lines.append(f'{pad}{key!r}: {val},')
+
+    lines.append(' ' * indent + '}')
+    return '\n'.join(lines)
+
+
+def write_references(filename, references, source):
+    today = datetime.date.today().isoformat()
+    tmpfile = f'{filename}.{os.getpid()}.tmp'
+    with open(tmpfile, 'w') as fp:
+        fp.write(
+            f'# Performance references calibrated from the perflog history.\n'
+            f'#\n'
+            f'# Generated by perflog-store calibrate on {today} from\n'
+            f'# {source}\n'
+            f'# Do not edit; rerun the calibration instead.\n'
+            f'#\n'
+            f'# REFERENCES[check][variant][partition][environ][perfvar]\n'
+            f'\n'
+            f'REFERENCES = {_format_dict(references)}\n'
+        )
+
+    os.replace(tmpfile, filename)
@@ -0,0 +1,167 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import hashlib
+import json
+import os
+
+from .parser import PerflogParser, iter_lines, iter_records, read_header
+
+
+def default_cachedir():
+    cache = os.environ.get('XDG_CACHE_HOME',
+                           os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache, 'hpc2n-perflog')
+
+
+class PerflogIndex:
+    '''On-disk index of the byte offsets of the records in a perflog file.
+
+    The records are indexed by check name, job ID, node and job completion
+    time.  Perflogs are only ever appended to, so :func:`update` only parses
+    the part of the file written since the last update; the index is rebuilt
+    if the file was truncated or replaced.
+    '''
+
+    VERSION = 1
+
+    def __init__(self, path, cachedir=None):
+        self.path = os.path.abspath(path)
+        cachedir = cachedir or default_cachedir()
+        key = hashlib.sha1(self.path.encode()).hexdigest()
+        self.filename = os.path.join(cachedir, f'{key}.json')
+        self._data = None
+
+    def _empty(self):
+        return {
+            'version': self.VERSION,
+            'path': self.path,
+            'header': None,
+            'size': 0,
+            'offsets': [],
+            'times': [],
+            'keys': {'check': {}, 'jobid': {}, 'node': {}},
+        }
+
+    def _load(self):
+        try:
+            with open(self.filename) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return self._empty()
+
+        if data.get('version') != self.VERSION or data.get('path') != self.path:
+            return self._empty()
+
+        return data
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        tmpfile = f'{self.filename}.{os.getpid()}.tmp'
+        with open(tmpfile, 'w') as fp:
+            json.dump(self._data, fp, separators=(',', ':'))
+
+        os.replace(tmpfile, self.filename)
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self._load()
+
+        return self._data
+
+    def __len__(self):
+        return len(self.data['offsets'])
+
+    def update(self):
+        '''Index the records appended since the last update.
+
+        Returns the number of newly indexed records.
+        '''
+
+        data = self.data
+        size = os.path.getsize(self.path)
+        header = read_header(self.path)
+        if size < data['size'] or header != data['header']:
+            data = self._data = self._empty()
+            data['header'] = header
+
+        if size == data['size']:
+            return 0
+
+        parser = PerflogParser(header)
+        keys = data['keys']
+        count = 0
+        with open(self.path, 'rb') as fp:
+            for offset, end, line in iter_lines(fp, data['size']):
+                data['size'] = end
+                record = parser.parse(line)
+                if record is None:
+                    continue
+
+                recno = len(data['offsets'])
+                data['offsets'].append(offset)
+                data['times'].append(record.time)
+                keys['check'].setdefault(record.name, []).append(recno)
+                if record.jobid is not None:
+                    keys['jobid'].setdefault(record.jobid, []).append(recno)
+
+                for node in record.nodes:
+                    keys['node'].setdefault(node, []).append(recno)
+
+                count += 1
+
+        self._save()
+        return count
+
+    def lookup(self, check=None, jobid=None, node=None,
+               since=None, until=None):
+        '''Return the sorted record offsets matching all given criteria.
+
+        ``since`` and ``until`` are seconds since the epoch; records without
+        a completion time never match a time range.
+        '''
+
+        data = self.data
+        selected = None
+        for kind, key in (('check', check), ('jobid', jobid), ('node', node)):
+            if key is None:
+                continue
+
+            recnos = data['keys'][kind].get(str(key), [])
+            if selected is None:
+                selected = set(recnos)
+            else:
+                selected &= set(recnos)
+
+        if selected is None:
+            selected = range(len(data['offsets']))
+
+        times = data['times']
+        recnos = []
+        for recno in sorted(selected):
+            t = times[recno]
+            if since is not None and (t is None or t < since):
+                continue
+
+            if until is not None and (t is None or t > until):
+                continue
+
+            recnos.append(recno)
+
+        return [data['offsets'][recno] for recno in recnos]
+
+    def records(self, **criteria):
+        '''Read only the records matching the :func:`lookup` criteria.'''
+
+        offsets = self.lookup(**criteria)
+        if offsets:
+            yield from iter_records(self.path, offsets)
+
+    def nodes(self):
+        return sorted(self.data['keys']['node'])
+
+    def checks(self):
+        return sorted(self.data['keys']['check'])
+
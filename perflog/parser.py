@@ -0,0 +1,328 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Parser for the perflog files written by the 'filelog' handler in the
+# 'handlers_perflog' section of config/hpc2n+c3se-settings.py:
+#
+#   job_completion_time|version|info|jobid|job_nodelist|Copy_value,Copy_unit,...
+#   2024-01-15T10:20:30+01:00|reframe 4.5.2|StreamTest2 /def614be @alvis:4xA40+intel_2022a|jobid=123|nodelist=alvis3-01|97000.0,MB/s,97000,-0.05,0.05,...
+#
+
+import collections
+import datetime
+import os
+import re
+import time
+
+
+DELIM = '|'
+PERFVAR_DELIM = ','
+
+# Attribute names used in the header for each performance variable, in the
+# order they are written by 'format_perfvars'
+PERFVAR_ATTRS = ('value', 'unit', 'ref', 'lower_thres', 'upper_thres')
+
+PerfValue = collections.namedtuple(
+    'PerfValue', ['value', 'unit', 'ref', 'lower', 'upper']
+)
+
+
+class PerflogRecord(collections.namedtuple(
+        'PerflogRecord', ['time', 'version', 'name', 'params', 'hashcode',
+                          'system', 'partition', 'environ', 'jobid', 'nodes',
+                          'perfvalues', 'info'])):
+    '''One performance log entry.
+
+    ``time`` is the job completion time as seconds since the epoch (or
+    ``None``), ``nodes`` is the expanded node list and ``perfvalues`` maps
+    each performance variable to a :class:`PerfValue`.
+    '''
+
+    __slots__ = ()
+
+    @property
+    def fullname(self):
+        return f'{self.system}:{self.partition}'
+
+    @property
+    def datetime(self):
+        if self.time is None:
+            return None
+
+        return datetime.datetime.fromtimestamp(self.time).astimezone()
+
+
+def _to_float(s):
+    if s in ('', 'null', 'None'):
+        return None
+
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
+def _to_str(s):
+    return None if s in ('', 'null', 'None') else s
+
+
+def parse_time(s):
+    '''Convert a timestamp to seconds since the epoch.
+
+    Accepts the ISO 8601 format used by the perflogs as well as relative
+    specifications like ``90d``, ``12h`` or ``30m`` (counted back from now).
+    Timestamps without a time zone are taken as local time.
+    '''
+
+    if s is None or s in ('', 'null', 'None'):
+        return None
+
+    m = re.match(r'^(\d+(?:\.\d+)?)([wdhms])$', s)
+    if m:
+        scale = {'w': 604800, 'd': 86400, 'h': 3600, 'm': 60, 's': 1}
+        return time.time() - float(m.group(1))*scale[m.group(2)]
+
+    # Python < 3.11 does not accept a 'Z' suffix
+    if s.endswith('Z'):
+        s = s[:-1] + '+00:00'
+
+    dt = datetime.datetime.fromisoformat(s)
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+
+    return dt.timestamp()
+
+
+def _split_nodelist(s):
+    # Split on commas outside brackets
+    depth = 0
+    start = 0
+    for i, c in enumerate(s):
+        if c == '[':
+            depth += 1
+        elif c == ']':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            yield s[start:i]
+            start = i + 1
+
+    yield s[start:]
+
+
+def expand_nodelist(s):
+    '''Expand a node list like ``b-cn[0101-0103,0110],alvis3-01``.'''
+
+    if not s:
+        return []
+
+    nodes = []
+    for item in _split_nodelist(s):
+        m = re.match(r'^(.*?)\[([^\]]+)\](.*)$', item)
+        if not m:
+            if item:
+                nodes.append(item)
+
+            continue
+
+        prefix, ranges, suffix = m.groups()
+        for r in ranges.split(','):
+            lo, _, hi = r.partition('-')
+            if not hi:
+                nodes += expand_nodelist(f'{prefix}{lo}{suffix}')
+                continue
+
+            width = len(lo)
+            for n in range(int(lo), int(hi)+1):
+                nodes += expand_nodelist(f'{prefix}{n:0{width}d}{suffix}')
+
+    return nodes
+
+
+def parse_info(info):
+    '''Split the ``check_info`` field into its parts.
+
+    Returns ``(name, params, hashcode, system, partition, environ)``, where
+    ``params`` is a dict with the test parameters.
+    '''
+
+    desc, _, target = info.rpartition(' @')
+    if not desc:
+        desc, target = target, ''
+
+    name = None
+    params = {}
+    hashcode = None
+    for tok in desc.split():
+        if name is None:
+            name = tok
+        elif tok.startswith('%'):
+            key, _, val = tok[1:].partition('=')
+            params[key] = val
+        elif tok.startswith('/'):
+            hashcode = tok[1:]
+
+    sysname, _, rest = target.partition(':')
+    part, _, environ = rest.partition('+')
+    return (name, params, hashcode, _to_str(sysname),
+            _to_str(part), _to_str(environ))
+
+
+class PerflogParser:
+    '''Line parser that keeps track of the current perflog header.
+
+    The first line of each perflog file is a header; ReFrame moves the file
+    away when the header changes, but concatenated files may contain several
+    headers, so every line that is not a data record replaces the current
+    header.
+    '''
+
+    def __init__(self, header=None):
+        self.columns = ['job_completion_time', 'version', 'info', 'jobid',
+                        'job_nodelist', 'perfvalues']
+        self.perfvars = []
+        if header is not None:
+            self.set_header(header)
+
+    @staticmethod
+    def is_header(line):
+        fields = line.split(DELIM, 2)
+        return len(fields) < 2 or not fields[1].startswith('reframe')
+
+    def set_header(self, line):
+        fields = line.rstrip('\n').split(DELIM)
+        self.columns = fields[:-1] + ['perfvalues']
+        self.perfvars = []
+        for tok in fields[-1].split(PERFVAR_DELIM):
+            for attr in PERFVAR_ATTRS:
+                if tok.endswith(f'_{attr}'):
+                    self.perfvars.append((tok[:-len(attr)-1], attr))
+                    break
+            else:
+                self.perfvars.append((tok, None))
+
+    def parse(self, line):
+        '''Parse one line.
+
+        Returns a :class:`PerflogRecord`, or ``None`` for header and empty
+        lines.
+        '''
+
+        line = line.rstrip('\n')
+        if not line:
+            return None
+
+        if self.is_header(line):
+            self.set_header(line)
+            return None
+
+        fields = line.split(DELIM)
+        data = dict(zip(self.columns[:-1], fields))
+        perfdata = fields[len(self.columns)-1:]
+        perfdata = DELIM.join(perfdata).split(PERFVAR_DELIM)
+
+        perfvalues = {}
+        attrs = {}
+        for (var, attr), val in zip(self.perfvars, perfdata):
+            if attr is not None:
+                attrs.setdefault(var, {})[attr] = val
+
+        for var, a in attrs.items():
+            perfvalues[var] = PerfValue(_to_float(a.get('value')),
+                                        _to_str(a.get('unit')),
+                                        _to_float(a.get('ref')),
+                                        _to_float(a.get('lower_thres')),
+                                        _to_float(a.get('upper_thres')))
+
+        info = data.get('info', '')
+        name, params, hashcode, sysname, part, environ = parse_info(info)
+        jobid = data.get('jobid', '').partition('=')[2]
+        nodelist = data.get('job_nodelist', '').partition('=')[2]
+        return PerflogRecord(parse_time(data.get('job_completion_time')),
+                             data.get('version'), name, params, hashcode,
+                             sysname, part, environ, _to_str(jobid),
+                             expand_nodelist(_to_str(nodelist)),
+                             perfvalues, info)
+
+
+def iter_lines(fp, start=0):
+    '''Yield ``(start, end, line)`` for each complete line of a binary file.
+
+    A trailing line without a newline is not returned, since ReFrame may
+    still be writing it.
+    '''
+
+    fp.seek(start)
+    offset = start
+    for line in fp:
+        if not line.endswith(b'\n'):
+            break
+
+        yield offset, offset + len(line), line.decode('utf-8', errors='replace')
+        offset += len(line)
+
+
+def read_header(path):
+    with open(path, 'rb') as fp:
+        line = fp.readline().decode('utf-8', errors='replace')
+
+    return line.rstrip('\n') if PerflogParser.is_header(line) else None
+
+
+def iter_records(path, offsets=None):
+    '''Stream-parse the records of a perflog file.
+
+    If ``offsets`` is given, only the lines starting at these byte offsets
+    are read and parsed.
+    '''
+
+    with open(path, 'rb') as fp:
+        parser = PerflogParser()
+        if offsets is None:
+            for _, _, line in iter_lines(fp):
+                record = parser.parse(line)
+                if record is not None:
+                    yield record
+
+            return
+
+        header = fp.readline().decode('utf-8', errors='replace')
+        if parser.is_header(header):
+            parser.set_header(header)
+
+        for offset in offsets:
+            fp.seek(offset)
+            record = parser.parse(fp.readline().decode('utf-8',
+                                                       errors='replace'))
+            if record is not None:
+                yield record
+
+
+def iter_stream(lines):
+    '''Parse records from an iterable of text lines, e.g. ``sys.stdin``.'''
+
+    parser = PerflogParser()
+    for line in lines:
+        record = parser.parse(line)
+        if record is not None:
+            yield record
+
+
+def find_perflogs(paths):
+    '''Yield all perflog files below the given files and directories.
+
+    This includes the ``.log.h<N>`` files that ReFrame leaves behind when the
+    header of a perflog changes.
+    '''
+
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for f in sorted(filenames):
+                if re.search(r'\.log(\.h\d+)?$', f):
+                    yield os.path.join(dirpath, f)
@@ -0,0 +1,197 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Per-node statistics over the perflog store, used to find the nodes whose
+# performance is degrading.
+#
+
+import collections
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# The performance variables used to rank the nodes when nothing else is given
+DEFAULT_PERFVARS = [
+    ('StreamTest2', 'Triad'),
+    ('StreamTest2Maintenance', 'Triad'),
+    ('HPLBaseSingleNode_Fixed', 'GFlops'),
+    ('gpu_burn_check', 'gpu_perf_min'),
+]
+
+# Scale factor of the MAD for normally distributed data
+MAD_SIGMA = 1.4826
+
+NodeStats = collections.namedtuple(
+    'NodeStats', ['node', 'count', 'last_time', 'recent', 'rel', 'score',
+                  'change_time', 'change_shift']
+)
+
+GroupStats = collections.namedtuple(
+    'GroupStats', ['environ', 'variant', 'count', 'baseline', 'sigma', 'nodes']
+)
+
+
+def mad_sigma(x):
+    '''Robust estimate of the standard deviation of ``x``.'''
+
+    x = np.asarray(x, dtype=float)
+    if not len(x):
+        return np.nan
+
+    return MAD_SIGMA * np.median(np.abs(x - np.median(x)))
+
+
+def mad_scores(x, center=None, sigma=None):
+    '''Return the MAD-based outlier scores of ``x``.
+
+    The scores are the distance from the median in units of the robust
+    standard deviation; ``center`` and ``sigma`` may be given to score the
+    values against another distribution.
+    '''
+
+    x = np.asarray(x, dtype=float)
+    if center is None:
+        center = np.median(x)
+
+    if sigma is None:
+        sigma = mad_sigma(x)
+
+    # Avoid dividing by zero for perfectly reproducible values
+    sigma = max(sigma, 1e-9 * abs(center), 1e-300)
+    return (x - center) / sigma
+
+
+def rolling_median(x, window):
+    '''Rolling median of ``x``.
+
+    The first ``window-1`` elements are the medians of the values available
+    so far.
+    '''
+
+    x = np.asarray(x, dtype=float)
+    if not len(x):
+        return x
+
+    padded = np.concatenate([np.full(window - 1, np.nan), x])
+    return np.nanmedian(sliding_window_view(padded, window), axis=1)
+
+
+def change_point(x, min_size=3):
+    '''Find the most likely shift of the mean of ``x``.
+
+    Returns ``(index, mean_before, mean_after, stat)``, where ``index`` is the
+    first element after the shift and ``stat`` the size of the shift in
+    standard errors, or ``None`` if ``x`` is too short.  The noise level is
+    estimated from the successive differences, so that it is not inflated by
+    the shift itself.
+    '''
+
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if n < 2 * min_size:
+        return None
+
+    csum = np.cumsum(x)
+    k = np.arange(1, n)
+    before = csum[:-1] / k
+    after = (csum[-1] - csum[:-1]) / (n - k)
+    sigma = mad_sigma(np.diff(x)) / np.sqrt(2)
+    sigma = max(sigma, 1e-9 * abs(np.median(x)), 1e-300)
+    stat = np.abs(before - after) * np.sqrt(k * (n - k) / n) / sigma
+    stat[(k < min_size) | (n - k < min_size)] = 0
+    i = int(np.argmax(stat))
+    return i + 1, before[i], after[i], stat[i]
+
+
+def _node_index(table, rows):
+    '''Expand multi-node records to one (row, node) pair per node.'''
+
+    nodelists = [s.split(',') if s else [] for s in table.strings('nodes')]
+    names = sorted({n for nodes in nodelists for n in nodes})
+    ids = {n: i for i, n in enumerate(names)}
+    node_ids = [np.array([ids[n] for n in nodes], dtype=int)
+                for nodes in nodelists]
+    counts = np.array([len(n) for n in node_ids], dtype=int)
+
+    codes = rows['nodes']
+    rowidx = np.repeat(np.arange(len(codes)), counts[codes])
+    if len(rowidx):
+        nodeidx = np.concatenate([node_ids[c] for c in codes])
+    else:
+        nodeidx = np.empty(0, dtype=int)
+
+    return names, rowidx, nodeidx
+
+
+def node_stats(table, var, window=5, min_size=3, change_threshold=4.0,
+               higher_is_better=True, **criteria):
+    '''Compute per-node statistics of a performance variable.
+
+    The records are grouped by programming environment and test variant,
+    since their performance is not comparable.  For each node the rolling
+    median of its last ``window`` values is scored against the median and
+    MAD of all values in the group, and the node's own history is searched
+    for a change point.  The nodes of each group are ranked from the most
+    degraded to the best.
+    '''
+
+    rows = table.select(var, **criteria)
+    sign = 1 if higher_is_better else -1
+    groups = []
+    keys = np.stack([rows['environ'], rows['variant']], axis=1)
+    for environ, variant in np.unique(keys, axis=0):
+        sel = (rows['environ'] == environ) & (rows['variant'] == variant)
+        group = {k: v[sel] for k, v in rows.items()}
+        order = np.argsort(group['time'], kind='stable')
+        group = {k: v[order] for k, v in group.items()}
+
+        names, rowidx, nodeidx = _node_index(table, group)
+        values = group['value'][rowidx]
+        times = group['time'][rowidx]
+        baseline = np.median(values)
+        sigma = mad_sigma(values)
+
+        # Sort by node, keeping the time order within each node
+        order = np.argsort(nodeidx, kind='stable')
+        nodeidx, values, times = nodeidx[order], values[order], times[order]
+        bounds = np.flatnonzero(np.diff(nodeidx)) + 1
+        stats = []
+        for idx, vals, ts in zip(np.split(nodeidx, bounds),
+                                 np.split(values, bounds),
+                                 np.split(times, bounds)):
+            if not len(idx):
+                continue
+
+            recent = rolling_median(vals, window)[-1]
+            score = mad_scores([recent], baseline, sigma)[0]
+            change_time = change_shift = None
+            cp = change_point(vals, min_size)
+            if cp is not None and cp[3] >= change_threshold:
+                change_time = ts[cp[0]]
+                change_shift = cp[2] / cp[1] - 1 if cp[1] else None
+
+            stats.append(NodeStats(names[idx[0]], len(vals), ts[-1], recent,
+                                   recent / baseline - 1 if baseline else np.nan,
+                                   score, change_time, change_shift))
+
+        stats.sort(key=lambda s: sign * s.score)
+        groups.append(GroupStats(table.strings('environ')[environ],
+                                 table.strings('variant')[variant],
+                                 len(group['value']), baseline, sigma, stats))
+
+    return groups
+
+
+def is_degraded(stats, score_threshold=3.0, min_drop=0.05,
+                higher_is_better=True):
+    '''Whether a node's statistics indicate a performance drop.'''
+
+    sign = 1 if higher_is_better else -1
+    if sign * stats.score <= -score_threshold:
+        return True
+
+    return (stats.change_shift is not None and
+            sign * stats.change_shift <= -min_drop)
@@ -0,0 +1,366 @@
+# Copyright 2026 High Performance Computing Center North (HPC2N)
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Columnar store of perflog records.
+#
+# Each (partition, check) pair is stored as one table directory
+#
+#   <store>/<system>/<partition>/<check>/
+#       meta.json           row count, units and string tables
+#       time.f8             job completion time (seconds since the epoch)
+#       jobid.i8            job ID, -1 if unknown
+#       environ.i4          index into meta['strings']['environ']
+#       variant.i4          index into meta['strings']['variant']
+#       nodes.i4            index into meta['strings']['nodes']
+#       <var>.value.f8      one column per performance variable and
+#       <var>.ref.f8        attribute, NaN where the record does not
+#       <var>.lower.f8      have the variable
+#       <var>.upper.f8
+#
+# The columns are raw little-endian arrays, so new rows are appended to the
+# end of the files and the columns are memory-mapped for the queries.  The
+# file <store>/ingest.json keeps a high-water mark for every perflog file, so
+# that only the tail written since the last ingestion is parsed.
+#
+
+import json
+import os
+
+import numpy as np
+
+from .parser import PerflogParser, find_perflogs, iter_lines, read_header
+
+
+PERFVAR_COLUMNS = ('value', 'ref', 'lower', 'upper')
+
+DTYPES = {
+    'f8': np.dtype('<f8'),
+    'i8': np.dtype('<i8'),
+    'i4': np.dtype('<i4'),
+}
+
+BASE_COLUMNS = {
+    'time': 'f8',
+    'jobid': 'i8',
+    'environ': 'i4',
+    'variant': 'i4',
+    'nodes': 'i4',
+}
+
+STRING_COLUMNS = ('environ', 'variant', 'nodes')
+
+
+def _write_json(filename, data):
+    tmpfile = f'{filename}.{os.getpid()}.tmp'
+    with open(tmpfile, 'w') as fp:
+        json.dump(data, fp, indent=1)
+
+    os.replace(tmpfile, filename)
+
+
+def variant_string(params):
+    '''Return the string used to identify a test variant in the store.'''
+
+    return ' '.join(f'{k}={v}' for k, v in sorted(params.items()))
+
+
+class Table:
+    '''The records of one check on one partition.'''
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(os.path.join(path, 'meta.json')) as fp:
+                self.meta = json.load(fp)
+        except FileNotFoundError:
+            self.meta = {
+                'nrows': 0,
+                'columns': dict(BASE_COLUMNS),
+                'units': {},
+                'strings': {s: [] for s in STRING_COLUMNS},
+            }
+
+        self._codes = {s: {v: i for i, v in enumerate(vals)}
+                       for s, vals in self.meta['strings'].items()}
+        self._cache = {}
+        self._pending = None
+
+    def __len__(self):
+        return self.meta['nrows']
+
+    @property
+    def perfvars(self):
+        return sorted(self.meta['units'])
+
+    def unit(self, var):
+        return self.meta['units'].get(var)
+
+    def strings(self, column):
+        return self.meta['strings'][column]
+
+    def column(self, name):
+        '''Return a column as a read-only memory-mapped array.'''
+
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        nrows = self.meta['nrows']
+        dtype = DTYPES[self.meta['columns'][name]]
+        if nrows == 0:
+            data = np.empty(0, dtype=dtype)
+        else:
+            data = np.memmap(self._filename(name), dtype=dtype, mode='r',
+                             shape=(nrows,))
+
+        self._cache[name] = data
+        return data
+
+    def perfvalues(self, var, attr='value'):
+        name = f'{var}.{attr}'
+        if name not in self.meta['columns']:
+            return np.full(len(self), np.nan)
+
+        return self.column(name)
+
+    def _filename(self, name):
+        return os.path.join(self.path, f"{name}.{self.meta['columns'][name]}")
+
+    def _code(self, column, value):
+        codes = self._codes[column]
+        try:
+            return codes[value]
+        except KeyError:
+            codes[value] = len(codes)
+            self.meta['strings'][column].append(value)
+            return codes[value]
+
+    def append(self, record):
+        '''Buffer a record; the rows are written by :func:`flush`.'''
+
+        if self._pending is None:
+            self._pending = {name: [] for name in self.meta['columns']}
+
+        pending = self._pending
+        nrows = len(self) + len(pending['time'])
+        for var, pv in record.perfvalues.items():
+            if f'{var}.value' not in pending:
+                for attr in PERFVAR_COLUMNS:
+                    pending[f'{var}.{attr}'] = [np.nan] * (nrows - len(self))
+
+                self.meta['units'].setdefault(var, pv.unit)
+
+        try:
+            jobid = int(record.jobid)
+        except (TypeError, ValueError):
+            jobid = -1
+
+        nan = np.nan
+        row = {
+            'time': record.time if record.time is not None else nan,
+            'jobid': jobid,
+            'environ': self._code('environ', record.environ or ''),
+            'variant': self._code('variant', variant_string(record.params)),
+            'nodes': self._code('nodes', ','.join(record.nodes)),
+        }
+        for var, pv in record.perfvalues.items():
+            for attr in PERFVAR_COLUMNS:
+                val = getattr(pv, attr)
+                row[f'{var}.{attr}'] = val if val is not None else nan
+
+        for name, values in pending.items():
+            values.append(row.get(name, nan))
+
+    def flush(self):
+        '''Append the buffered rows to the column files.'''
+
+        if not self._pending or not self._pending['time']:
+            return 0
+
+        os.makedirs(self.path, exist_ok=True)
+        nrows = len(self)
+        columns = self.meta['columns']
+        for name, values in self._pending.items():
+            if name not in columns:
+                # New performance variable; backfill the existing rows
+                columns[name] = 'f8'
+                np.full(nrows, np.nan).astype(DTYPES['f8']).tofile(
+                    self._filename(name)
+                )
+
+            with open(self._filename(name), 'r+b' if nrows else 'wb') as fp:
+                # Drop any rows left behind by an interrupted flush
+                fp.truncate(nrows * DTYPES[columns[name]].itemsize)
+                fp.seek(0, os.SEEK_END)
+                np.asarray(values, dtype=DTYPES[columns[name]]).tofile(fp)
+
+        count = len(self._pending['time'])
+        self.meta['nrows'] = nrows + count
+        _write_json(os.path.join(self.path, 'meta.json'), self.meta)
+        self._pending = None
+        self._cache = {}
+        return count
+
+    def mask(self, since=None, until=None, environ=None, variant=None,
+             node=None):
+        '''Return a boolean array selecting the rows matching all criteria.
+
+        ``since`` and ``until`` are seconds since the epoch and ``variant`` is
+        a dict of test parameters that must match.
+        '''
+
+        mask = np.ones(len(self), dtype=bool)
+        if since is not None or until is not None:
+            t = self.column('time')
+            if since is not None:
+                mask &= t >= since
+
+            if until is not None:
+                mask &= t <= until
+
+        if environ is not None:
+            mask &= self._isin('environ', lambda s: s == environ)
+
+        if variant:
+            def _match(s):
+                params = dict(p.partition('=')[::2] for p in s.split())
+                return all(params.get(k) == str(v) for k, v in variant.items())
+
+            mask &= self._isin('variant', _match)
+
+        if node is not None:
+            mask &= self._isin('nodes', lambda s: node in s.split(','))
+
+        return mask
+
+    def _isin(self, column, pred):
+        codes = [i for i, s in enumerate(self.strings(column)) if pred(s)]
+        return np.isin(self.column(column), codes)
+
+    def select(self, var, **criteria):
+        '''Return the rows of a performance variable matching the criteria.
+
+        The result is a dict of arrays with the keys ``time``, ``value``,
+        ``ref``, ``lower``, ``upper``, ``jobid``, ``environ``, ``variant``
+        and ``nodes``; the last three hold codes into :func:`strings`.
+        '''
+
+        mask = self.mask(**criteria)
+        mask &= ~np.isnan(self.perfvalues(var))
+        idx = np.flatnonzero(mask)
+        ret = {attr: np.asarray(self.perfvalues(var, attr)[idx])
+               for attr in PERFVAR_COLUMNS}
+        for name in BASE_COLUMNS:
+            ret[name] = np.asarray(self.column(name)[idx])
+
+        return ret
+
+
+class PerflogStore:
+    '''Columnar store of the records of a perflog directory tree.'''
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self._tables = {}
+        self._marks = None
+
+    @property
+    def marks(self):
+        if self._marks is None:
+            try:
+                with open(os.path.join(self.path, 'ingest.json')) as fp:
+                    self._marks = json.load(fp)
+            except FileNotFoundError:
+                self._marks = {}
+
+        return self._marks
+
+    def table(self, partition, check):
+        '''Return the table of a check on a partition (``system:part``).'''
+
+        key = (partition, check)
+        if key not in self._tables:
+            sysname, _, part = partition.partition(':')
+            self._tables[key] = Table(
+                os.path.join(self.path, sysname, part, check)
+            )
+
+        return self._tables[key]
+
+    def tables(self):
+        '''Yield ``(partition, check)`` for all tables in the store.'''
+
+        if not os.path.isdir(self.path):
+            return
+
+        for sysname in sorted(os.listdir(self.path)):
+            sysdir = os.path.join(self.path, sysname)
+            if not os.path.isdir(sysdir):
+                continue
+
+            for part in sorted(os.listdir(sysdir)):
+                partdir = os.path.join(sysdir, part)
+                for check in sorted(os.listdir(partdir)):
+                    if os.path.exists(os.path.join(partdir, check,
+                                                   'meta.json')):
+                        yield f'{sysname}:{part}', check
+
+    def _start_offset(self, key, st, header):
+        '''Return the offset to start ingesting a perflog from.'''
+
+        mark = self.marks.get(key)
+        if (mark is None or mark['header'] != header or
+            mark['size'] > st.st_size):
+            return 0
+
+        return mark['size']
+
+    def ingest(self, paths):
+        '''Ingest the new records of all perflogs found in ``paths``.
+
+        Returns the number of ingested records.
+        '''
+
+        os.makedirs(self.path, exist_ok=True)
+        marks_file = os.path.join(self.path, 'ingest.json')
+        count = 0
+        for path in find_perflogs(paths):
+            # The marks are kept by inode, since ReFrame renames a perflog
+            # to <name>.h<N> when its header changes
+            path = os.path.abspath(path)
+            st = os.stat(path)
+            key = f'{st.st_dev}:{st.st_ino}'
+            header = read_header(path)
+            start = self._start_offset(key, st, header)
+            mark = {'path': path, 'header': header, 'size': start}
+            if start == st.st_size:
+                if self.marks.get(key) != mark:
+                    self.marks[key] = mark
+                    _write_json(marks_file, self.marks)
+
+                continue
+
+            parser = PerflogParser(header)
+            end = start
+            touched = set()
+            with open(path, 'rb') as fp:
+                for _, end, line in iter_lines(fp, start):
+                    record = parser.parse(line)
+                    if record is None or record.system is None:
+                        continue
+
+                    table = self.table(record.fullname, record.name)
+                    table.append(record)
+                    touched.add(table)
+
+            for table in touched:
+                count += table.flush()
+
+            mark['size'] = end
+            self.marks[key] = mark
+            _write_json(marks_file, self.marks)
+
+        return count